@@ -0,0 +1,50 @@
+import asyncio
+from typing import AsyncIterator, Callable
+from fastapi import Request
+from backend.services.cancellation import CancelScope, current_cancel_scope
+from backend.services.db import STATEMENT_TIMEOUTS, current_statement_timeout
+from backend.services.feed import VerificationFeed
+from backend.services.ingest_queue import WriteBehindQueue
+from backend.services.store import VerificationStore
+
+# Application-scoped services are created by the lifespan handler in backend.main
+# and kept on app.state; routes receive them through these dependencies.
+
+def get_store(request: Request) -> VerificationStore:
+    return request.app.state.store
+
+def get_ingest_queue(request: Request) -> WriteBehindQueue:
+    return request.app.state.ingest_queue
+
+def get_feed(request: Request) -> VerificationFeed:
+    return request.app.state.feed
+
+def query_guard(kind: str) -> Callable[[Request], AsyncIterator[CancelScope]]:
+    """
+    Dependency for read routes (GET, no request body). Their queries run with
+    the STATEMENT_TIMEOUTS[kind] statement_timeout and are cancelled server-side
+    if the client disconnects before the response is complete (including a
+    streamed body), so an abandoned request gives its connection back at once.
+    """
+    timeout_ms = STATEMENT_TIMEOUTS[kind] or None
+    
+    async def guard(request: Request) -> AsyncIterator[CancelScope]:
+        scope = CancelScope()
+        request.state.cancel_scope = scope
+        timeout_token = current_statement_timeout.set(timeout_ms)
+        scope_token = current_cancel_scope.set(scope)
+        watcher = asyncio.ensure_future(_cancel_on_disconnect(request, scope))
+        try:
+            yield scope
+        finally:
+            watcher.cancel()
+            current_cancel_scope.reset(scope_token)
+            current_statement_timeout.reset(timeout_token)
+    
+    return guard
+
+async def _cancel_on_disconnect(request: Request, scope: CancelScope):
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+    # Cancelling opens a connection to the server for each query, so keep it off the event loop
+    await asyncio.to_thread(scope.cancel)
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse
+from backend.api.conditional import etag_matches, not_modified
+from backend.api.deps import get_store
+from backend.services.store import VerificationStore
+
+router = APIRouter()
+
+# Content-addressed URLs never change meaning, so caches may keep them indefinitely
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+@router.get("/{file_id}")
+def get_file(file_id: str, request: Request, store: VerificationStore = Depends(get_store)):
+    """
+    Serve a stored file by content hash, session file id, or legacy file name.
+    Supports Range requests; the body is sent with the server's zero-copy path where available.
+    """
+    blob = store.files.resolve(file_id)
+    if not blob:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    cache_control = IMMUTABLE_CACHE_CONTROL if blob.immutable else REVALIDATE_CACHE_CONTROL
+    headers = {"Cache-Control": cache_control}
+    if blob.sha256:
+        # Strong validator: the hash identifies the exact bytes
+        etag = f'"{blob.sha256}"'
+        if etag_matches(request, etag):
+            return not_modified(etag, cache_control)
+        headers["ETag"] = etag
+    
+    return FileResponse(blob.path, media_type=blob.content_type, headers=headers)
@@ -0,0 +1,54 @@
+from typing import Dict
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from backend.services.files import MAX_UPLOAD_REQUEST_BYTES
+
+# Allowance on top of MAX_UPLOAD_REQUEST_BYTES for the metadata field and multipart framing
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+# Request body limits by path, enforced before the route parses the body
+REQUEST_SIZE_LIMITS = {
+    "/api/verifications/ingest": MAX_UPLOAD_REQUEST_BYTES + MULTIPART_OVERHEAD_BYTES,
+}
+
+
+class RequestSizeLimitMiddleware:
+    """
+    ASGI middleware rejecting request bodies over a per-path byte limit with 413.
+
+    Starlette spools a multipart body to disk in full before the route sees its
+    files, so route-level checks only run after an oversized upload has cost
+    its whole size. This refuses a declared Content-Length over the limit
+    before reading anything, and stops a body without one (or one that lies)
+    as soon as it streams past the limit.
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body exceeds the {limit} byte limit"
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside body parsing, which passes HTTPException through
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,151 @@
+import time
+from typing import List
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from backend.api.deps import get_store, get_ingest_queue, get_feed
+from backend.services.db import get_pool_stats, get_replica_stats
+from backend.services.feed import VerificationFeed
+from backend.services.ingest_queue import WriteBehindQueue
+from backend.services.metrics import registry, HTTP_REQUEST_SECONDS
+from backend.services.store import VerificationStore
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per route template (e.g.
+    /api/verifications/{session_id}), so path parameters do not explode the
+    label set. Timing covers the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=_route_template(scope),
+                status=status_code
+            )
+
+
+def _route_template(scope) -> str:
+    """Full path template of the matched route, including any router prefix."""
+    # Routes of included routers only know their own path; FastAPI records the prefixed one here
+    route = (scope.get("fastapi") or {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "<unmatched>"
+
+
+def _pool_metrics() -> List[str]:
+    stats = get_pool_stats()
+    if not stats:
+        return []
+    lines = [
+        "# HELP db_pool_acquire_seconds Time callers waited for a pooled connection.",
+        "# TYPE db_pool_acquire_seconds histogram",
+    ]
+    for bound, count in stats['acquire_latency_seconds'].items():
+        lines.append(f'db_pool_acquire_seconds_bucket{{le="{bound}"}} {count}')
+    lines.append(f"db_pool_acquire_seconds_sum {stats['wait_seconds_total']}")
+    lines.append(f"db_pool_acquire_seconds_count {stats['acquired_total']}")
+    for name in ('size', 'max', 'in_use', 'idle', 'waiting'):
+        lines.append(f"# TYPE db_pool_{name} gauge")
+        lines.append(f"db_pool_{name} {stats[name]}")
+    for name in ('timeouts_total', 'recycled_total'):
+        lines.append(f"# TYPE db_pool_{name} counter")
+        lines.append(f"db_pool_{name} {stats[name]}")
+    return lines
+
+
+def _cache_metrics(store: VerificationStore) -> List[str]:
+    lines = []
+    caches = {"detail": store.detail_cache.stats(), "stats": store.stats_cache.stats()}
+    for metric, kind in (('size', 'gauge'), ('hits', 'counter'), ('misses', 'counter'),
+                         ('evictions', 'counter'), ('invalidations', 'counter')):
+        name = f"cache_{metric}" if kind == 'gauge' else f"cache_{metric}_total"
+        lines.append(f"# TYPE {name} {kind}")
+        for cache, stats in caches.items():
+            lines.append(f'{name}{{cache="{cache}"}} {stats[metric]}')
+    return lines
+
+
+def _coalescing_metrics(store: VerificationStore) -> List[str]:
+    stats = store.flights.stats()
+    return [
+        "# TYPE read_coalescing_in_flight gauge", f"read_coalescing_in_flight {stats['in_flight']}",
+        "# TYPE read_coalescing_calls_total counter",
+        f'read_coalescing_calls_total{{result="executed"}} {stats["leaders"]}',
+        f'read_coalescing_calls_total{{result="shared"}} {stats["shared"]}',
+    ]
+
+
+def _ingest_queue_metrics(ingest_queue: WriteBehindQueue) -> List[str]:
+    stats = ingest_queue.stats()
+    lines = ["# TYPE ingest_queue_depth gauge", f"ingest_queue_depth {stats['depth']}"]
+    for name in ('accepted', 'written', 'rejected', 'retries', 'spooled', 'turned_away'):
+        lines.append(f"# TYPE ingest_queue_{name}_total counter")
+        lines.append(f"ingest_queue_{name}_total {stats[name]}")
+    return lines
+
+
+def _feed_metrics(feed: VerificationFeed) -> List[str]:
+    stats = feed.stats()
+    return [
+        "# TYPE feed_clients gauge", f"feed_clients {stats['clients']}",
+        "# TYPE feed_events_total counter", f"feed_events_total {stats['published']}",
+        "# TYPE feed_dropped_clients_total counter", f"feed_dropped_clients_total {stats['dropped_clients']}",
+    ]
+
+
+def _replica_metrics() -> List[str]:
+    stats = get_replica_stats()
+    if not stats:
+        return []
+    lines = []
+    for name, kind, value in (
+        ('db_replica_available', 'gauge', lambda r: int(r['available'])),
+        ('db_replica_lag_seconds', 'gauge', lambda r: r['lag_seconds']),
+        ('db_replica_in_use', 'gauge', lambda r: r['pool']['in_use'] if r['pool'] else 0),
+        ('db_replica_reads_total', 'counter', lambda r: r['reads']),
+        ('db_replica_failures_total', 'counter', lambda r: r['failures']),
+    ):
+        lines.append(f"# TYPE {name} {kind}")
+        for replica in stats:
+            if value(replica) is not None:
+                lines.append(f'{name}{{replica="{replica["replica"]}"}} {value(replica)}')
+    return lines
+
+
+registry.add_collector(_pool_metrics)
+registry.add_collector(_replica_metrics)
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(store: VerificationStore = Depends(get_store),
+            ingest_queue: WriteBehindQueue = Depends(get_ingest_queue),
+            feed: VerificationFeed = Depends(get_feed)):
+    """Prometheus text exposition of request, query, transform, pool, replica, cache, read coalescing, ingest queue and feed metrics."""
+    # Caches, the ingest queue and the feed belong to the running app, so they are read per scrape
+    extra = (_cache_metrics(store) + _coalescing_metrics(store)
+             + _ingest_queue_metrics(ingest_queue) + _feed_metrics(feed))
+    return PlainTextResponse(registry.render(extra), media_type=PROMETHEUS_CONTENT_TYPE)
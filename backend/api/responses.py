@@ -0,0 +1,15 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from backend.services.serialization import dumps
+
+class ModelResponse(JSONResponse):
+    """
+    JSON response for models the store has already built.
+
+    Returning a Response from a route bypasses FastAPI's response_model
+    validation, so only use this for trusted, store-built models; keep
+    response_model on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,129 +1,386 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
-from typing import List, Optional
-import json
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
+import asyncio
+import csv
+import hashlib
+import io
+from pydantic import ValidationError
 from backend.schemas.verification import (
     VerificationDetail, VerificationIngest, VerificationSession,
-    UserIngest, UserInfo, StepsStatus, DeviceInfo, NetworkDetails,
-    DocumentImages, DocumentDetails, LivenessInfo, FaceMatchInfo, PrivacyInfo
+    VerificationStats, BulkIngestFailure, BulkIngestResult
 )
-from backend.services.store import db
+from backend.services.store import (
+    VerificationStore, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT,
+    STATS_CACHE_TTL, INGEST_BATCH_SIZE
+)
+from backend.services.files import MAX_UPLOAD_FILE_BYTES, MAX_UPLOAD_REQUEST_BYTES, UploadTooLarge
+from backend.services.ingest_queue import WriteBehindQueue, IngestQueueUnavailable
+from backend.services.feed import VerificationFeed, FEED_HEARTBEAT_INTERVAL
+from backend.api.conditional import etag_matches, not_modified
+from backend.api.deps import get_store, get_ingest_queue, get_feed, query_guard
+from backend.api.responses import ModelResponse
+from backend.services.serialization import dumps
+from backend.services.db import USE_ASYNC_DB
 
 router = APIRouter()
 
-@router.get("/", response_model=List[VerificationSession])
-def get_verifications():
-    """Get all verification sessions (summary view)."""
-    # We return the full objects, but the response_model will filter to VerificationSession fields
-    return db.get_all()
-
-@router.get("/{session_id}", response_model=VerificationDetail)
-def get_verification_detail(session_id: str):
-    """Get full details for a specific verification session."""
-    verification = db.get_by_id(session_id)
-    if not verification:
+def _make_etag(*parts) -> str:
+    """Weak ETag derived from a data version token and anything else that shapes the response."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+@router.get("/", response_model=List[VerificationSession], dependencies=[Depends(query_guard("read"))])
+# Also answer without the trailing slash instead of redirecting (the dashboard requests /api/verifications)
+@router.get("", response_model=List[VerificationSession], include_in_schema=False,
+            dependencies=[Depends(query_guard("read"))])
+async def get_verifications(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    document_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    store: VerificationStore = Depends(get_store)
+):
+    """
+    Get one page of verification sessions (summary view), newest first.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    Responds 304 without querying the page when If-None-Match matches the current data version.
+    The store-built models are serialized directly, without response_model re-validation.
+    """
+    page_args = dict(
+        limit=limit,
+        cursor=cursor,
+        status=status_filter,
+        doc_type=document_type,
+        created_from=created_from,
+        created_to=created_to
+    )
+    
+    if USE_ASYNC_DB:
+        version = await store.aget_list_version()
+    else:
+        version = await run_in_threadpool(store.get_list_version)
+    etag = _make_etag("list", version, sorted(page_args.items()))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    try:
+        if USE_ASYNC_DB:
+            verifications, next_cursor = await store.aget_summary_page(**page_args)
+        else:
+            verifications, next_cursor = await run_in_threadpool(store.get_summary_page, **page_args)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return ModelResponse(verifications, headers=headers)
+
+@router.get("/stats", response_model=VerificationStats, dependencies=[Depends(query_guard("stats"))])
+async def get_verification_stats(
+    response: Response,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    store: VerificationStore = Depends(get_store)
+):
+    """
+    Dashboard counts by status, by document type and per day, optionally limited to a creation window.
+    Computed in SQL and cached server-side for a few seconds.
+    """
+    if USE_ASYNC_DB:
+        stats = await store.aget_stats(created_from, created_to)
+    else:
+        stats = await run_in_threadpool(store.get_stats, created_from, created_to)
+    
+    response.headers["Cache-Control"] = f"private, max-age={int(STATS_CACHE_TTL)}"
+    return stats
+
+@router.get("/search", response_model=List[VerificationSession], dependencies=[Depends(query_guard("read"))])
+async def search_verifications(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    store: VerificationStore = Depends(get_store)
+):
+    """
+    Look up sessions by partial candidate name, email, phone or document number, best match first.
+    Numeric queries match phone and document numbers by prefix or by trailing digits.
+    """
+    try:
+        if USE_ASYNC_DB:
+            results = await store.asearch(q, limit)
+        else:
+            results = await run_in_threadpool(store.search, q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return ModelResponse(results, headers={"Cache-Control": "no-cache"})
+
+@router.get("/stream")
+async def stream_verifications(request: Request, feed: VerificationFeed = Depends(get_feed)):
+    """
+    Server-Sent Events feed of list-view changes, pushed as they are committed.
+    created, status_changed and updated events carry the changed VerificationSession,
+    deleted carries its id, and resync asks the client to reload the list.
+    Reconnecting clients resume from Last-Event-ID when it is recent enough.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    
+    async def events() -> AsyncIterator[bytes]:
+        queue = feed.subscribe(last_event_id)
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), FEED_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream
+                    yield b": keep-alive\n\n"
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            feed.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Columns written by the CSV export, as (header, accessor)
+EXPORT_CSV_COLUMNS = [
+    ("id", lambda v: v.id),
+    ("name", lambda v: v.user.name),
+    ("email", lambda v: v.user.email),
+    ("phone", lambda v: v.user.phone),
+    ("country", lambda v: v.user.country),
+    ("document_type", lambda v: v.user.documentType),
+    ("document_number", lambda v: v.documents.details.docNumber),
+    ("dob", lambda v: v.documents.details.dob),
+    ("status", lambda v: v.status),
+    ("created_at", lambda v: v.createdAt),
+    ("vendor", lambda v: v.vendor),
+    ("step_document", lambda v: v.steps.document),
+    ("step_selfie", lambda v: v.steps.selfie),
+    ("step_database", lambda v: v.steps.database),
+    ("step_risk", lambda v: v.steps.risk),
+    ("ip", lambda v: v.device.ip),
+    ("location", lambda v: v.device.location),
+    ("event_count", lambda v: len(v.events)),
+]
+
+def _export_ndjson(verifications: Iterator[VerificationDetail]) -> Iterator[bytes]:
+    for verification in verifications:
+        yield dumps(verification) + b"\n"
+
+def _export_csv(verifications: Iterator[VerificationDetail]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+    
+    writer.writerow([header for header, _ in EXPORT_CSV_COLUMNS])
+    yield flush()
+    for verification in verifications:
+        writer.writerow([accessor(verification) for _, accessor in EXPORT_CSV_COLUMNS])
+        yield flush()
+
+@router.get("/export", dependencies=[Depends(query_guard("export"))])
+def export_verifications(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    document_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    store: VerificationStore = Depends(get_store)
+):
+    """
+    Stream every matching verification as NDJSON (full detail) or CSV (flattened).
+    Rows are read from a server-side cursor in batches, so memory use does not grow with table size.
+    """
+    verifications = store.iter_export(
+        status=status_filter,
+        doc_type=document_type,
+        created_from=created_from,
+        created_to=created_to
+    )
+    
+    if format == "csv":
+        body, media_type = _export_csv(verifications), "text/csv"
+    else:
+        body, media_type = _export_ndjson(verifications), "application/x-ndjson"
+    
+    filename = f"verifications-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/{session_id}", response_model=VerificationDetail, dependencies=[Depends(query_guard("read"))])
+async def get_verification_detail(session_id: str, request: Request,
+                                  store: VerificationStore = Depends(get_store)):
+    """
+    Get full details for a specific verification session.
+    Responds 304 without loading the session when If-None-Match matches its current version.
+    The ETag is that of the detail actually served; a cached detail recorded at another
+    version is reloaded rather than sent under the current one.
+    The store-built model is serialized directly, without response_model re-validation.
+    """
+    if USE_ASYNC_DB:
+        version = await store.aget_version(session_id)
+    else:
+        version = await run_in_threadpool(store.get_version, session_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Verification session not found")
+    
+    clean_session_id = session_id.replace('#', '')
+    etag = _make_etag("detail", clean_session_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if USE_ASYNC_DB:
+        versioned = await store.aget_versioned_by_id(session_id, version)
+    else:
+        versioned = await run_in_threadpool(store.get_versioned_by_id, session_id, version)
+    if not versioned:
         raise HTTPException(status_code=404, detail="Verification session not found")
-    return verification
+    
+    served_version, verification = versioned
+    etag = _make_etag("detail", clean_session_id, served_version)
+    return ModelResponse(verification, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
-@router.post("/ingest", status_code=status.HTTP_201_CREATED)
+@router.post("/ingest", status_code=status.HTTP_202_ACCEPTED)
 async def ingest_verification(
     metadata: str = Form(...),
-    files: List[UploadFile] = File(default=[])
+    files: List[UploadFile] = File(default=[]),
+    store: VerificationStore = Depends(get_store),
+    ingest_queue: WriteBehindQueue = Depends(get_ingest_queue)
 ):
     """
-    Ingest a new verification session.
-    - metadata: JSON string conforming to VerificationIngest schema (conceptually, though we'll parse it to a richer internal model for simplicity)
+    Accept a new verification session for writing.
+    - metadata: JSON string conforming to the VerificationIngest schema
     - files: List of PDF/Image files
+    
+    The record is validated and queued on the write-behind ingest queue; it is
+    persisted shortly after the 202 response. Responds 503 when the queue is full.
     """
     try:
-        data = json.loads(metadata)
-        # In a real scenario, we would validate 'data' against VerificationIngest
-        # ingest_data = VerificationIngest(**data) 
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid JSON metadata")
+        record = VerificationIngest.model_validate_json(metadata)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid metadata: {_validation_message(e)}")
 
-    session_id = data.get("session_id", "unknown")
+    session_id = record.session_id
     if not session_id.startswith("#"):
         session_id = f"#{session_id}"
 
-    # Handle files
+    # Handle files: stream each to disk within the per-file and per-request size limits
     saved_files = []
-    for file in files:
-        content = await file.read()
-        file_url = await db.save_file(session_id, file.filename, content)
-        saved_files.append(file_url)
-
-    # Transform Ingest Data to VerificationDetail (Mocking the enrichment process)
-    # Since the ingest payload is simple, we generate the detailed fields mock-style
-    
-    user_data = data.get("user", {})
-    
-    new_verification = VerificationDetail(
-        id=session_id,
-        user=UserInfo(
-            name=user_data.get("name", "Unknown"),
-            email=user_data.get("email", "unknown@example.com"),
-            country=user_data.get("country", "Unknown"),
-            documentType=data.get("document_type", "Unknown"),
-            phone=user_data.get("phone", None),
-            avatarUrl=""
-        ),
-        status=data.get("status", "NOT_STARTED").upper(),
-        createdAt=data.get("timestamps", {}).get("created_at", "2024-01-01T00:00:00Z"),
-        vendor="Veriff", # Hardcoded for prototype
-        steps=StepsStatus(
-            document="APPROVED" if "ID_VERIFICATION" in data.get("workflow", []) else "PENDING",
-            selfie="APPROVED" if "LIVENESS" in data.get("workflow", []) else "PENDING",
-            database="APPROVED",
-            risk="APPROVED"
-        ),
-        device=DeviceInfo(
-            type="Mobile",
-            os="iOS 17",
-            browser="Mobile Safari",
-            ip="49.37.170.8",
-            location="Bengaluru, India"
-        ),
-        network=NetworkDetails(
-            ip="49.37.170.8",
-            location="Bengaluru, Karnataka, India",
-            city="Bengaluru",
-            country="India",
-            isp="Bharti Airtel Ltd.",
-            timezone="Asia/Kolkata",
-            privacy=PrivacyInfo(
-                status="CLEAN",
-                vpn=False,
-                tor=False,
-                proxy=False,
-                dataCenter=False
-            ),
-            distanceFromDoc=783.64
-        ),
-        devices=[], # Can be populated if provided in ingest
-        warnings=[],
-        documents=DocumentImages(
-            front="https://placehold.co/600x400/e2e8f0/475569?text=ID+Front", # Mock
-            back="https://placehold.co/600x400/e2e8f0/475569?text=ID+Back",   # Mock
-            details=DocumentDetails(
-                firstName=user_data.get("name", "Unknown").split(" ")[0],
-                lastName=user_data.get("name", "Unknown").split(" ")[-1],
-                dob="1995-01-01",
-                docNumber="ABC12345",
-                expiryDate="2030-01-01"
+    remaining = MAX_UPLOAD_REQUEST_BYTES
+    try:
+        for file in files:
+            stored = await store.save_file(
+                session_id, file.filename, file,
+                max_bytes=min(MAX_UPLOAD_FILE_BYTES, remaining)
             )
-        ),
-        liveness=LivenessInfo(
-            score=98,
-            status="PASS",
-            selfieUrl="https://placehold.co/400x400/e2e8f0/475569?text=Selfie"
-        ),
-        faceMatch=FaceMatchInfo(
-            score=95,
-            status="MATCH"
-        ),
-        events=[]
+            remaining -= stored.size
+            saved_files.append(stored)
+    except UploadTooLarge as e:
+        for stored in reversed(saved_files):
+            await store.revert_file(stored)
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    try:
+        await ingest_queue.put(record)
+    except IngestQueueUnavailable:
+        for stored in reversed(saved_files):
+            await store.revert_file(stored)
+        raise
+    
+    return {
+        "message": "Verification session accepted",
+        "session_id": session_id,
+        "files": [{"url": f.url, "size": f.size, "sha256": f.sha256} for f in saved_files]
+    }
+
+async def _ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Tuple[int, bytes]]:
+    """Split a streamed body into (line number, line) pairs, skipping blank lines."""
+    buffer = bytearray()
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        if b"\n" in chunk:
+            *lines, rest = bytes(buffer).split(b"\n")
+            buffer = bytearray(rest)
+            for line in lines:
+                line_no += 1
+                if line.strip():
+                    yield line_no, line
+        if len(buffer) > max_line_bytes:
+            raise UploadTooLarge(f"Line {line_no + 1} exceeds the {max_line_bytes} byte limit")
+    if buffer.strip():
+        yield line_no + 1, bytes(buffer)
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" if err['loc'] else err['msg']
+        for err in error.errors()
     )
 
-    db.add_verification(new_verification)
+@router.post("/ingest/bulk", response_model=BulkIngestResult)
+async def bulk_ingest_verifications(request: Request, store: VerificationStore = Depends(get_store)):
+    """
+    Ingest many verification sessions from an NDJSON body, one VerificationIngest per line.
+    
+    Records are validated as the body streams in and written in batches of
+    INGEST_BATCH_SIZE, one transaction per batch. Invalid records are reported
+    by line number in `failed` and do not stop the rest of the upload. A line
+    over the size limit aborts the request with 413; batches already written are kept.
+    """
+    received = 0
+    failed: List[BulkIngestFailure] = []
+    batch: List[Tuple[int, VerificationIngest]] = []
+    seen: Dict[str, int] = {}
+    
+    async def flush():
+        failed.extend(await run_in_threadpool(store.ingest_batch, list(batch)))
+        batch.clear()
+    
+    try:
+        async for line_no, line in _ndjson_lines(request.stream(), MAX_UPLOAD_FILE_BYTES):
+            received += 1
+            try:
+                record = VerificationIngest.model_validate_json(line)
+            except ValidationError as e:
+                failed.append(BulkIngestFailure(line=line_no, error=_validation_message(e)))
+                continue
+            
+            session_id = record.session_id.lstrip('#')
+            if session_id in seen:
+                failed.append(BulkIngestFailure(
+                    line=line_no, session_id=record.session_id,
+                    error=f"Duplicate session_id, first seen on line {seen[session_id]}"
+                ))
+                continue
+            seen[session_id] = line_no
+            
+            batch.append((line_no, record))
+            if len(batch) >= INGEST_BATCH_SIZE:
+                await flush()
+        if batch:
+            await flush()
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     
-    return {"message": "Verification session created", "session_id": session_id}
+    failed.sort(key=lambda failure: failure.line)
+    return BulkIngestResult(received=received, ingested=received - len(failed), failed=failed)
@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for the backend.
+
+Each module is runnable on its own, e.g. `python -m backend.benchmarks.useragent`.
+
+- datagen: loads synthetic sessions/documents/audit_log at 1k, 100k or 1M sessions
+- suite: store, transform and HTTP route timings with p50/p99 and baseline comparison
+- useragent: user-agent classification micro-benchmark
+"""
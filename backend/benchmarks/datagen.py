@@ -0,0 +1,261 @@
+"""
+Synthetic data generator for benchmarks.
+
+Fills sessions, documents (Aadhaar-shaped doc_data) and audit_log with
+deterministic, realistic-looking data at a chosen scale, using COPY. Point it at
+a scratch database through the usual POSTGRES_* variables:
+
+    POSTGRES_DB=bgc_bench python -m backend.benchmarks.datagen --scale 100k --create-tables
+
+Refuses to touch a database that already has sessions unless --truncate is given.
+"""
+import argparse
+import csv
+import io
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from backend.benchmarks.useragent import UA_CORPUS
+from backend.services.db import DB_CONFIG, init_db_pool, close_db_pool, get_db_connection
+from backend.services.migrations import migrate
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# Sessions written per COPY round trip
+CHUNK_SIZE = 10_000
+
+# Minimal tables with the columns the backend reads, for an empty scratch database.
+# Production tables are owned by the verification service, not this repo.
+CREATE_TABLES_SQL = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        candidate_name TEXT,
+        candidate_email TEXT,
+        candidate_phone TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        requested_docs JSONB,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+    CREATE TABLE IF NOT EXISTS documents (
+        id SERIAL PRIMARY KEY,
+        session_id TEXT REFERENCES sessions(id),
+        doc_type TEXT,
+        doc_data JSONB,
+        photo_file TEXT,
+        pdf_file TEXT,
+        fetched_at TIMESTAMPTZ,
+        fetched_ip TEXT
+    );
+    CREATE TABLE IF NOT EXISTS audit_log (
+        id SERIAL PRIMARY KEY,
+        session_id TEXT REFERENCES sessions(id),
+        event TEXT NOT NULL,
+        details JSONB,
+        ip_address TEXT,
+        user_agent TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+"""
+
+SESSION_COLUMNS = ("id", "candidate_name", "candidate_email", "candidate_phone", "status",
+                   "requested_docs", "created_at", "updated_at")
+DOCUMENT_COLUMNS = ("session_id", "doc_type", "doc_data", "photo_file", "pdf_file", "fetched_at", "fetched_ip")
+AUDIT_COLUMNS = ("session_id", "event", "details", "ip_address", "user_agent", "created_at")
+
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Arjun", "Sai", "Reyansh", "Krishna", "Ishaan", "Rohan", "Rahul",
+               "Ananya", "Diya", "Priya", "Saanvi", "Aadhya", "Kavya", "Isha", "Meera", "Pooja", "Sneha"]
+LAST_NAMES = ["Sharma", "Verma", "Kumar", "Singh", "Patel", "Reddy", "Nair", "Iyer", "Gupta", "Das",
+              "Rao", "Joshi", "Mehta", "Chopra", "Banerjee", "Pillai", "Menon", "Yadav", "Shah", "Kulkarni"]
+# (city, district, state, pincode prefix)
+PLACES = [
+    ("Bengaluru", "Bengaluru Urban", "Karnataka", "560"),
+    ("Mumbai", "Mumbai Suburban", "Maharashtra", "400"),
+    ("Pune", "Pune", "Maharashtra", "411"),
+    ("Chennai", "Chennai", "Tamil Nadu", "600"),
+    ("Hyderabad", "Hyderabad", "Telangana", "500"),
+    ("New Delhi", "New Delhi", "Delhi", "110"),
+    ("Kolkata", "Kolkata", "West Bengal", "700"),
+    ("Jaipur", "Jaipur", "Rajasthan", "302"),
+    ("Kochi", "Ernakulam", "Kerala", "682"),
+    ("Lucknow", "Lucknow", "Uttar Pradesh", "226"),
+]
+# (weight, status)
+STATUSES = [(55, "verified"), (30, "pending"), (10, "failed"), (5, "expired")]
+# Share of sessions that reached the document step, and of those with a photo
+DOCUMENT_RATE = 0.97
+PHOTO_RATE = 0.6
+
+
+class SyntheticData:
+    """Deterministic row generator; the same seed and scale always produce the same rows."""
+
+    def __init__(self, seed: int = 42, now: datetime = None):
+        self.rng = random.Random(seed)
+        self.now = now or datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.status_weights, self.statuses = zip(*STATUSES)
+        self.ua_weights, self.user_agents = zip(*UA_CORPUS)
+
+    def _ip(self) -> str:
+        rng = self.rng
+        return f"{rng.choice([49, 103, 106, 117, 157, 183])}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+
+    def session(self, n: int):
+        """Rows for session number n: (session row, document row or None, audit rows)."""
+        rng = self.rng
+        session_id = f"{rng.getrandbits(64):016x}{n:08x}"
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        status = rng.choices(self.statuses, weights=self.status_weights)[0]
+        created_at = self.now - timedelta(seconds=rng.randint(0, 180 * 24 * 3600))
+        updated_at = created_at + timedelta(seconds=rng.randint(30, 3600))
+        session_row = (
+            session_id, name, f"{first.lower()}.{last.lower()}{n}@example.com", f"9{rng.randint(100000000, 999999999)}",
+            status, json.dumps(["aadhaar"]), created_at.isoformat(), updated_at.isoformat()
+        )
+
+        ip = self._ip()
+        user_agent = rng.choices(self.user_agents, weights=self.ua_weights)[0]
+        audit_rows = [(session_id, "SESSION_INITIATED", json.dumps({"requestedDocs": ["aadhaar"]}),
+                       ip, user_agent, created_at.isoformat())]
+
+        document_row = None
+        if rng.random() < DOCUMENT_RATE:
+            city, district, state, pin_prefix = rng.choice(PLACES)
+            house = f"{rng.randint(1, 999)}/{rng.randint(1, 30)}"
+            street = f"{rng.randint(1, 20)}th Cross, {rng.choice(['MG Road', 'Station Road', 'Main Road', 'Gandhi Nagar'])}"
+            pincode = f"{pin_prefix}{rng.randint(0, 999):03d}"
+            fetched_at = created_at + timedelta(seconds=rng.randint(20, 600))
+            photo_file = f"{session_id}_photo.jpg" if rng.random() < PHOTO_RATE else None
+            doc_data = {
+                "name": name,
+                "dob": f"{rng.randint(1960, 2004)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "gender": rng.choice(["M", "F"]),
+                "aadhaar_number": f"XXXX-XXXX-{rng.randint(0, 9999):04d}",
+                "care_of": f"S/O {rng.choice(FIRST_NAMES)} {last}",
+                "address": {
+                    "house": house,
+                    "street": street,
+                    "vtc": city,
+                    "district": district,
+                    "state": state,
+                    "country": "India",
+                    "pincode": pincode,
+                    "full_address": f"{house}, {street}, {city}, {district}, {state} - {pincode}",
+                },
+                "issuer": {"name": "UIDAI"},
+            }
+            document_row = (session_id, "aadhaar", json.dumps(doc_data), photo_file,
+                            f"{session_id}_aadhaar.pdf", fetched_at.isoformat(), ip)
+            audit_rows.append((session_id, "STATUS_CHECKED", json.dumps({"status": "ok"}),
+                               ip, user_agent, (fetched_at - timedelta(seconds=5)).isoformat()))
+            audit_rows.append((session_id, "DOCUMENT_FETCHED", json.dumps({"docType": "aadhaar"}),
+                               ip, user_agent, fetched_at.isoformat()))
+            if status == "verified":
+                audit_rows.append((session_id, "VERIFICATION_COMPLETE", json.dumps({"result": "verified"}),
+                                   ip, user_agent, updated_at.isoformat()))
+        return session_row, document_row, audit_rows
+
+
+def _copy(cur, table: str, columns: tuple, rows: list):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def generate(sessions: int, seed: int = 42, truncate: bool = False, create_tables: bool = False) -> dict:
+    """
+    Load `sessions` synthetic sessions (with their documents and audit events).
+
+    Row triggers are disabled during the load and verification_summary is
+    rebuilt in one statement afterwards, which is far faster than maintaining
+    it row by row.
+
+    Returns:
+        Row counts per table and elapsed seconds
+    """
+    started = time.perf_counter()
+    counts = {"sessions": 0, "documents": 0, "audit_log": 0}
+    data = SyntheticData(seed)
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            if create_tables:
+                cur.execute(CREATE_TABLES_SQL)
+            cur.execute("SELECT EXISTS (SELECT 1 FROM sessions) as has_rows")
+            if cur.fetchone()[0]:
+                if not truncate:
+                    raise SystemExit(f"Database {DB_CONFIG['database']} already has sessions; pass --truncate to replace them")
+                cur.execute("TRUNCATE audit_log, documents, sessions RESTART IDENTITY")
+    migrate()
+
+    tables = ("sessions", "documents", "audit_log")
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            for table in tables:
+                cur.execute(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+    try:
+        for chunk_start in range(0, sessions, CHUNK_SIZE):
+            session_rows, document_rows, audit_rows = [], [], []
+            for n in range(chunk_start, min(chunk_start + CHUNK_SIZE, sessions)):
+                session_row, document_row, events = data.session(n)
+                session_rows.append(session_row)
+                if document_row:
+                    document_rows.append(document_row)
+                audit_rows.extend(events)
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    _copy(cur, "sessions", SESSION_COLUMNS, session_rows)
+                    _copy(cur, "documents", DOCUMENT_COLUMNS, document_rows)
+                    _copy(cur, "audit_log", AUDIT_COLUMNS, audit_rows)
+            counts["sessions"] += len(session_rows)
+            counts["documents"] += len(document_rows)
+            counts["audit_log"] += len(audit_rows)
+            print(f"  {counts['sessions']:>9} / {sessions} sessions", flush=True)
+    finally:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                for table in tables:
+                    cur.execute(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            # Without publishing every rebuilt row to the live feed
+            cur.execute("ALTER TABLE verification_summary DISABLE TRIGGER USER")
+            cur.execute("TRUNCATE verification_summary")
+            cur.execute("INSERT INTO verification_summary SELECT * FROM verification_summary_source")
+            cur.execute("ALTER TABLE verification_summary ENABLE TRIGGER USER")
+    with get_db_connection() as conn:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("VACUUM ANALYZE sessions, documents, audit_log, verification_summary")
+        conn.autocommit = False
+
+    counts["elapsed_s"] = round(time.perf_counter() - started, 1)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--sessions", type=int, help="Exact session count, overrides --scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true", help="Replace existing rows in the target database")
+    parser.add_argument("--create-tables", action="store_true", help="Create minimal sessions/documents/audit_log tables if missing")
+    args = parser.parse_args()
+
+    sessions = args.sessions or SCALES[args.scale]
+    print(f"Generating {sessions} sessions into {DB_CONFIG['database']}@{DB_CONFIG['host']} (seed {args.seed})")
+    init_db_pool(minconn=1, maxconn=2)
+    try:
+        counts = generate(sessions, seed=args.seed, truncate=args.truncate, create_tables=args.create_tables)
+    finally:
+        close_db_pool()
+    print(f"Loaded {counts['sessions']} sessions, {counts['documents']} documents, "
+          f"{counts['audit_log']} audit events in {counts['elapsed_s']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Store and HTTP benchmark suite.
+
+Times the VerificationStore read paths, the row-to-model transform and the
+HTTP routes against the current database (load one with
+backend.benchmarks.datagen first), and reports throughput and p50/p99 latency.
+
+    POSTGRES_DB=bgc_bench python -m backend.benchmarks.suite --save-baseline baseline.json
+    POSTGRES_DB=bgc_bench python -m backend.benchmarks.suite --baseline baseline.json
+
+With --baseline, exits non-zero when any p50/p99 is more than --tolerance
+slower than the saved run. Baselines are only comparable on the same machine
+and data scale.
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from pydantic import TypeAdapter
+from backend.services.serialization import dumps
+from backend.benchmarks.timing import measure, load_baseline, save_baseline, find_regressions
+from backend.services.db import DB_CONFIG, init_db_pool, close_db_pool, get_db_connection, get_db_cursor
+from backend.schemas.verification import VerificationDetail
+from backend.services.store import VerificationStore, SESSION_DOCUMENT_COLUMNS
+
+# Benchmarks that read every session; skipped above this many sessions unless asked for
+GET_ALL_MAX_SESSIONS = 100_000
+
+# Identical list reads issued at once by the *_burst benchmark, like dashboards refreshing together
+BURST_CONCURRENCY = 8
+
+SAMPLE_ROWS_QUERY = f"""
+    SELECT {SESSION_DOCUMENT_COLUMNS}
+    FROM sessions s
+    JOIN documents d ON s.id = d.session_id
+    WHERE d.doc_data IS NOT NULL
+    ORDER BY s.id
+    LIMIT %s;
+"""
+
+
+def _sample(db: VerificationStore, sample_size: int):
+    """Joined rows, their audit events and the session count, for input variety."""
+    with get_db_connection() as conn:
+        with get_db_cursor(conn) as cur:
+            cur.execute("SELECT count(*) as count FROM sessions")
+            session_count = cur.fetchone()['count']
+            cur.execute(SAMPLE_ROWS_QUERY, (sample_size,))
+            rows = cur.fetchall()
+            audit_by_session = db._fetch_audit_events(cur, [row['id'] for row in rows])
+    return rows, audit_by_session, session_count
+
+
+def run(iterations: int = 200, sample_size: int = 1000, seed: int = 42,
+        include_get_all: bool = None, http: bool = True) -> dict:
+    """
+    Run every benchmark and return {name: measure() result}.
+
+    Detail reads clear the detail cache before each call, so they measure the
+    database path; the *_cached variants measure cache hits. serialize_list
+    encodes every sampled session the way the routes do; serialize_list_validated
+    re-validates and dumps them through pydantic the way response_model would.
+    get_summary_page_burst issues BURST_CONCURRENCY identical page reads at once.
+    """
+    init_db_pool()
+    try:
+        return _run(VerificationStore(), iterations, sample_size, seed, include_get_all, http)
+    finally:
+        close_db_pool()
+
+
+def _run(db: VerificationStore, iterations: int, sample_size: int, seed: int,
+         include_get_all: bool, http: bool) -> dict:
+    rng = random.Random(seed)
+    rows, audit_by_session, session_count = _sample(db, sample_size)
+    if not rows:
+        raise SystemExit(f"No sessions with documents in {DB_CONFIG['database']}; run backend.benchmarks.datagen first")
+    ids = [row['id'] for row in rows]
+    picks = [rng.choice(ids) for _ in range(iterations)]
+    if include_get_all is None:
+        include_get_all = session_count <= GET_ALL_MAX_SESSIONS
+
+    def transform(i):
+        session_data, document_data = db._split_row(rows[i % len(rows)])
+        db._transform_multi_table_data_to_verification(
+            session_data, document_data, audit_by_session[rows[i % len(rows)]['id']]
+        )
+
+    def get_by_id(i):
+        db.detail_cache.clear()
+        db.get_by_id(picks[i])
+
+    burst_pool = ThreadPoolExecutor(max_workers=BURST_CONCURRENCY)
+
+    def summary_page_burst(i):
+        calls = [burst_pool.submit(db.get_summary_page, limit=50) for _ in range(BURST_CONCURRENCY)]
+        for call in calls:
+            call.result()
+
+    details = db._build_verifications(rows, audit_by_session)
+    details_adapter = TypeAdapter(List[VerificationDetail])
+    
+    results = {
+        "transform": measure(transform, iterations * 10, warmup=iterations),
+        "serialize_list": measure(lambda i: dumps(details), max(10, iterations // 10), warmup=2),
+        "serialize_list_validated": measure(
+            lambda i: details_adapter.dump_json(details_adapter.validate_python(details)),
+            max(10, iterations // 10), warmup=2
+        ),
+        "get_by_id": measure(get_by_id, iterations, warmup=10),
+        "get_by_id_cached": measure(lambda i: db.get_by_id(picks[0]), iterations * 10, warmup=1),
+        "get_summary_page": measure(lambda i: db.get_summary_page(limit=50), iterations, warmup=10),
+        "get_summary_page_burst": measure(summary_page_burst, iterations, warmup=10),
+        "get_stats": measure(lambda i: (db.stats_cache.clear(), db.get_stats()), max(5, iterations // 20), warmup=1),
+        "search_name": measure(lambda i: db.search(rows[i % len(rows)]['candidate_name']), iterations, warmup=10),
+        "search_phone": measure(lambda i: db.search(rows[i % len(rows)]['candidate_phone'][-4:]), iterations, warmup=10),
+    }
+    burst_pool.shutdown()
+    if include_get_all:
+        results["get_all"] = measure(lambda i: db.get_all(), max(3, iterations // 50), warmup=1)
+
+    if http:
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        # The app builds its own store and pool in its lifespan
+        close_db_pool()
+        with TestClient(app) as client:
+            app_store = app.state.store
+            
+            def get(path, **params):
+                response = client.get(path, params=params)
+                assert response.status_code == 200, f"{path}: {response.status_code}"
+
+            def http_detail(i):
+                app_store.detail_cache.clear()
+                get(f"/api/verifications/{picks[i]}")
+
+            results["http_list"] = measure(lambda i: get("/api/verifications/", limit=50), iterations, warmup=10)
+            results["http_list_filtered"] = measure(
+                lambda i: get("/api/verifications/", limit=50, status="verified"), iterations, warmup=10
+            )
+            results["http_detail"] = measure(http_detail, iterations, warmup=10)
+            results["http_stats_cached"] = measure(lambda i: get("/api/verifications/stats"), iterations, warmup=1)
+
+    return results
+
+
+def print_results(results: dict):
+    print(f"{'benchmark':26} {'iters':>7} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, result in results.items():
+        print(f"{name:26} {result['iterations']:>7} {result['ops_per_sec']:>10.1f} "
+              f"{result['p50_ms']:>9.3f} {result['p99_ms']:>9.3f} {result['max_ms']:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--sample-size", type=int, default=1000, help="Distinct sessions to draw inputs from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--get-all", dest="get_all", action="store_true", default=None,
+                        help=f"Benchmark get_all even above {GET_ALL_MAX_SESSIONS} sessions")
+    parser.add_argument("--no-http", dest="http", action="store_false", help="Skip the HTTP route benchmarks")
+    parser.add_argument("--baseline", help="Compare against this saved baseline")
+    parser.add_argument("--save-baseline", help="Write this run's results as a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging, as a fraction")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Per-request INFO logging would dominate the fast paths being timed
+    logging.disable(logging.INFO)
+    results = run(args.iterations, args.sample_size, args.seed, args.get_all, args.http)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            raise SystemExit(f"Baseline {args.baseline} not found")
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for name, metric, before, after in regressions:
+            print(f"REGRESSION {name} {metric}: {before:.3f} ms -> {after:.3f} ms ({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Timing helpers shared by the benchmark suite: latency percentiles, throughput,
+and comparison of a run against a saved baseline.
+"""
+import json
+import time
+from typing import Callable, Dict, Optional
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable[[int], object], iterations: int, warmup: int = 0) -> dict:
+    """
+    Call func(i) for i in range(iterations) and summarise the per-call latency.
+
+    Args:
+        func: Benchmark body; receives the iteration number so it can vary its input
+        iterations: Timed calls
+        warmup: Untimed calls made first, to fill caches and pools
+
+    Returns:
+        Dict with iterations, total_s, ops_per_sec, mean_ms, p50_ms, p99_ms and max_ms
+    """
+    for i in range(warmup):
+        func(i)
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        call_started = time.perf_counter()
+        func(i)
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "total_s": round(total, 4),
+        "ops_per_sec": round(iterations / total, 1) if total else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 4),
+        "p99_ms": round(percentile(latencies, 0.99), 4),
+        "max_ms": round(latencies[-1], 4) if latencies else 0.0,
+    }
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path: str, results: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(results: Dict[str, dict], baseline: Dict[str, dict],
+                     tolerance: float, min_delta_ms: float = 0.05) -> list:
+    """
+    Compare p50/p99 latencies against a baseline.
+
+    A metric regresses when it is more than `tolerance` (a fraction, 0.2 = 20%)
+    slower than the baseline and the absolute difference exceeds min_delta_ms,
+    so sub-microsecond noise on very fast benchmarks is not reported.
+
+    Returns:
+        List of (benchmark, metric, baseline value, current value) tuples
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            before, after = previous.get(metric), current.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > min_delta_ms:
+                regressions.append((name, metric, before, after))
+    return regressions
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark for user-agent classification.
+
+Measures the per-call cost of the uncached rule evaluation and of the memoized
+classify_user_agent on a corpus weighted like real dashboard traffic (a few
+mobile browsers dominate, with a long tail of desktop, in-app and bot UAs).
+
+    python -m backend.benchmarks.useragent [--calls N]
+"""
+import argparse
+import random
+import time
+from backend.services.useragent import _classify, classify_user_agent
+
+# (weight, user agent)
+UA_CORPUS = [
+    (30, "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36"),
+    (12, "Mozilla/5.0 (Linux; Android 13; SM-A146B Build/TP1A.220624.014) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.144 Mobile Safari/537.36"),
+    (10, "Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1"),
+    (8, "Mozilla/5.0 (Linux; Android 12; RMX3371) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Mobile Safari/537.36"),
+    (6, "Mozilla/5.0 (Linux; Android 11; Redmi Note 9 Pro Build/RKQ1.200826.002; wv) AppleWebKit/537.36 (KHTML, like Gecko) Version/4.0 Chrome/118.0.5993.111 Mobile Safari/537.36"),
+    (6, "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"),
+    (4, "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.2478.51"),
+    (4, "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15"),
+    (3, "Mozilla/5.0 (Linux; Android 13; CPH2487) AppleWebKit/537.36 (KHTML, like Gecko) SamsungBrowser/23.0 Chrome/115.0.0.0 Mobile Safari/537.36"),
+    (3, "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) CriOS/120.0.6099.119 Mobile/15E148 Safari/604.1"),
+    (2, "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0"),
+    (2, "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1"),
+    (2, "Mozilla/5.0 (Linux; Android 12; V2111) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Mobile Safari/537.36 OPR/79.0.4195.76543"),
+    (1, "Mozilla/5.0 (Linux; Android 14; Pixel 8 Pro) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.6367.82 Mobile Safari/537.36"),
+    (1, "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 [FBAN/FBIOS;FBAV/458.0.0.41.108]"),
+    (1, "Mozilla/5.0 (X11; CrOS x86_64 14541.0.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    (1, "python-requests/2.31.0"),
+    (1, "curl/8.4.0"),
+]
+
+
+def _time_per_call(func, user_agents) -> float:
+    """Mean nanoseconds per call of func over user_agents."""
+    started = time.perf_counter_ns()
+    for user_agent in user_agents:
+        func(user_agent)
+    return (time.perf_counter_ns() - started) / len(user_agents)
+
+
+def run(calls: int = 200_000, seed: int = 42) -> dict:
+    """Benchmark classification over `calls` UAs sampled from the weighted corpus."""
+    rng = random.Random(seed)
+    weights, corpus = zip(*UA_CORPUS)
+    sample = rng.choices(corpus, weights=weights, k=calls)
+
+    # Legacy inline substring checks, for comparison with the previous implementation
+    def legacy(user_agent):
+        device_type = "Mobile" if "Mobile" in user_agent else "Desktop"
+        os_info = browser_info = "Unknown"
+        if "Macintosh" in user_agent:
+            os_info = "macOS"
+        elif "Windows" in user_agent:
+            os_info = "Windows"
+        elif "Linux" in user_agent:
+            os_info = "Linux"
+        if "Chrome" in user_agent:
+            browser_info = "Chrome"
+        elif "Safari" in user_agent and "Chrome" not in user_agent:
+            browser_info = "Safari"
+        elif "Firefox" in user_agent:
+            browser_info = "Firefox"
+        return device_type, os_info, browser_info
+
+    classify_user_agent.cache_clear()
+    results = {
+        "calls": calls,
+        "distinct_user_agents": len(corpus),
+        "legacy_substring_ns": _time_per_call(legacy, sample),
+        "uncached_rules_ns": _time_per_call(_classify, sample),
+        "memoized_ns": _time_per_call(classify_user_agent, sample),
+    }
+    results["cache"] = classify_user_agent.cache_info()._asdict()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    results = run(args.calls)
+    print(f"{results['calls']} calls over {results['distinct_user_agents']} distinct UAs")
+    print(f"  legacy substring checks : {results['legacy_substring_ns']:8.0f} ns/call")
+    print(f"  uncached rule matching  : {results['uncached_rules_ns']:8.0f} ns/call")
+    print(f"  memoized (LRU)          : {results['memoized_ns']:8.0f} ns/call")
+    print(f"  cache: {results['cache']}")
+    print()
+    for _, user_agent in UA_CORPUS:
+        print(f"  {classify_user_agent(user_agent)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,39 @@
 """
 Inspect all three tables (sessions, documents, audit_log) to understand their structure and relationships.
+
+With --explain, check instead that every store read query still uses its
+indexes: each one is run under EXPLAIN (ANALYZE, BUFFERS), and the check fails
+(exit status 1) when one sequentially scans a table of at least --min-rows rows.
+Run it against a database loaded to scale (backend.benchmarks.datagen), since
+the planner rightly prefers sequential scans of small tables.
+
+    POSTGRES_DB=bgc_bench python backend/inspect_all_tables.py --explain
 """
 import sys
 import os
+import argparse
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from services.db import init_db_pool, get_db_connection, get_db_cursor
+from backend.services.db import init_db_pool, get_db_connection, get_db_cursor
+from backend.services.migrations import migration_status
+from backend.services.store import (
+    VerificationStore, ALL_SESSIONS_QUERY, SESSION_BY_ID_QUERY, AUDIT_EVENTS_QUERY,
+    LIST_VERSION_QUERY, SESSION_VERSION_QUERY, SEARCH_TRIGRAM_QUERY, encode_cursor
+)
 import json
 
+# Sequential scans of tables at least this large fail the --explain check
+EXPLAIN_MIN_ROWS = 10_000
+
+# Session in the middle of the list, whose values parameterize the checked queries
+SAMPLE_SESSION_QUERY = """
+    SELECT id, created_at, status, doc_type, candidate_name, candidate_email, candidate_phone
+    FROM verification_summary
+    ORDER BY created_at DESC, id DESC
+    OFFSET (SELECT count(*) / 2 FROM verification_summary)
+    LIMIT 1;
+"""
+
 def inspect_table(cur, table_name):
     """Inspect a single table's schema and sample data."""
     print(f"\n{'='*60}")
@@ -92,10 +118,128 @@ def inspect_relationships(cur):
             for col in session_cols:
                 print(f"    {col['table_name']}.{col['column_name']}")
 
+def explain_cases(cur, store: VerificationStore):
+    """
+    (name, query, params, full_scan_ok) for every store read, parameterized from a sample session.
+    full_scan_ok marks queries that read every row by design, where a sequential scan is the right plan.
+    """
+    cur.execute(SAMPLE_SESSION_QUERY)
+    sample = cur.fetchone()
+    if sample is None:
+        raise SystemExit("verification_summary is empty; load data first (backend.benchmarks.datagen)")
+    cur.execute(SEARCH_TRIGRAM_QUERY)
+    store.search_trigram = cur.fetchone()['available']
+    
+    cursor = encode_cursor(sample['created_at'], sample['id'])
+    cur.execute("SELECT id, created_at FROM verification_summary ORDER BY created_at DESC, id DESC LIMIT 50")
+    first_page = cur.fetchall()
+    page_ids = [row['id'] for row in first_page]
+    recent = first_page[-1]['created_at']
+    
+    cases = [
+        ("summary_page", *store._build_summary_page_query(50), False),
+        ("summary_page_cursor", *store._build_summary_page_query(50, cursor=cursor), False),
+        ("summary_page_status", *store._build_summary_page_query(50, status=sample['status']), False),
+        ("summary_page_doc_type", *store._build_summary_page_query(50, doc_type=sample['doc_type']), False),
+        ("summary_page_created_from", *store._build_summary_page_query(50, created_from=sample['created_at']), False),
+        ("detail_page", *store._build_page_query(50), False),
+        ("detail_page_cursor", *store._build_page_query(50, cursor=cursor), False),
+        ("session_by_id", SESSION_BY_ID_QUERY, (sample['id'],), False),
+        ("audit_events", AUDIT_EVENTS_QUERY, (page_ids,), False),
+        ("list_version", LIST_VERSION_QUERY, (), False),
+        ("session_version", SESSION_VERSION_QUERY, (sample['id'],), False),
+        ("stats_recent", *store._build_stats_query(recent, None), False),
+        ("stats", *store._build_stats_query(None, None), True),
+        ("export", *store._build_export_query(), True),
+        ("all_sessions", ALL_SESSIONS_QUERY, (), True),
+    ]
+    searches = {
+        "search_name": (sample['candidate_name'] or "").split(" ")[0],
+        "search_email": sample['candidate_email'],
+        "search_phone_suffix": (sample['candidate_phone'] or "")[-4:],
+    }
+    for name, q in searches.items():
+        if q:
+            cases.append((name, *store._build_search_query(q, 20), False))
+    return cases
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from _plan_nodes(child)
+
+
+def explain_query(cur, query, params, table_rows, min_rows):
+    """Run one query under EXPLAIN ANALYZE; returns (execution ms, shared buffers hit/read, large tables seq-scanned)."""
+    cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}", params or None)
+    result = cur.fetchone()['QUERY PLAN'][0]
+    plan = result['Plan']
+    
+    seq_scanned = sorted({
+        node['Relation Name'] for node in _plan_nodes(plan)
+        if node['Node Type'] == 'Seq Scan' and table_rows.get(node['Relation Name'], 0) >= min_rows
+    })
+    buffers = f"{plan.get('Shared Hit Blocks', 0)}/{plan.get('Shared Read Blocks', 0)}"
+    return result['Execution Time'], buffers, seq_scanned
+
+
+def check_query_plans(min_rows=EXPLAIN_MIN_ROWS) -> bool:
+    """Print the migration state and a plan summary per store query; returns False if any query regressed to a sequential scan."""
+    print(f"\n{'='*60}")
+    print("MIGRATIONS")
+    print('='*60)
+    for migration in migration_status():
+        print(f"  {migration['version']:03d}_{migration['name']:35} {migration['state']}")
+    
+    store = VerificationStore()
+    failures = []
+    
+    print(f"\n{'='*60}")
+    print(f"QUERY PLANS (sequential scans of tables with >= {min_rows} rows fail)")
+    print('='*60)
+    print(f"  {'query':28} {'ms':>9} {'hit/read':>13}  result")
+    
+    with get_db_connection() as conn:
+        with get_db_cursor(conn) as cur:
+            cur.execute("SELECT relname, reltuples::bigint as rows FROM pg_class WHERE relkind = 'r'")
+            table_rows = {row['relname']: row['rows'] for row in cur.fetchall()}
+            
+            for name, query, params, full_scan_ok in explain_cases(cur, store):
+                ms, buffers, seq_scanned = explain_query(cur, query, params, table_rows, min_rows)
+                if not seq_scanned:
+                    result = "ok"
+                elif full_scan_ok:
+                    result = f"ok (reads every row: seq scan on {', '.join(seq_scanned)})"
+                else:
+                    result = f"FAIL: seq scan on {', '.join(seq_scanned)}"
+                    failures.append(name)
+                print(f"  {name:28} {ms:>9.2f} {buffers:>13}  {result}")
+            
+            # EXPLAIN ANALYZE runs each query; leave nothing behind
+            conn.rollback()
+    
+    if failures:
+        print(f"\n{len(failures)} queries fell back to sequential scans: {', '.join(failures)}")
+    else:
+        print("\nNo store query fell back to a sequential scan")
+    return not failures
+
+
 def main():
-    print("Inspecting all database tables...")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--explain", action="store_true", help="Check store query plans instead of inspecting tables")
+    parser.add_argument("--min-rows", type=int, default=EXPLAIN_MIN_ROWS,
+                        help="Smallest table whose sequential scan fails the --explain check")
+    args = parser.parse_args()
+    
     init_db_pool()
+    if args.explain:
+        if not check_query_plans(args.min_rows):
+            sys.exit(1)
+        return
     
+    print("Inspecting all database tables...")
     with get_db_connection() as conn:
         with get_db_cursor(conn) as cur:
             inspect_table(cur, 'sessions')
@@ -110,3 +254,4 @@ if __name__ == "__main__":
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
@@ -1,7 +1,29 @@
-from fastapi import FastAPI
+import time
+
+# Startup logs report how long importing this module (and everything it pulls in) took
+IMPORT_STARTED = time.perf_counter()
+
+import os
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from backend.api import verifications
-from backend.services.db import init_db_pool, close_db_pool, test_connection
+from fastapi.responses import JSONResponse, Response
+import psycopg
+import psycopg2.errors
+from backend.api import files, metrics, verifications
+from backend.api.deps import get_store, get_ingest_queue
+from backend.api.limits import RequestSizeLimitMiddleware, REQUEST_SIZE_LIMITS
+from backend.api.metrics import MetricsMiddleware
+from backend.services.cancellation import QueryCancelled
+from backend.services.db import (
+    init_db_pool, close_db_pool, test_connection, get_pool_stats, get_replica_stats, PoolTimeout, USE_ASYNC_DB,
+    subscribe_notifications, unsubscribe_notifications, start_notification_listener, stop_notification_listener
+)
+from backend.services.migrations import migrate, check_schema, MIGRATE_ON_STARTUP
+from backend.services.store import VerificationStore, CHANGE_CHANNEL
+from backend.services.async_db import init_async_db_pool, close_async_db_pool, test_async_connection
+from backend.services.ingest_queue import WriteBehindQueue, IngestQueueUnavailable, INGEST_SPOOL_DIR, INGEST_SPOOL_FILE
+from backend.services.feed import VerificationFeed, FEED_CHANNEL
 import uvicorn
 import logging
 
@@ -12,12 +34,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def _timed(timings: dict, step: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = (time.perf_counter() - started) * 1000
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the connection pools, the store and the ingest queue once per process
+    and expose them on app.state for the route dependencies; tear them down in
+    reverse order on shutdown. Nothing connects to the database at import time.
+    """
+    started = time.perf_counter()
+    logger.info(f"Application startup - modules imported in {IMPORT_MS:.0f} ms")
+    timings = {}
+    try:
+        with _timed(timings, "pool"):
+            init_db_pool()
+        if test_connection():
+            logger.info("Database connection successful")
+        else:
+            logger.error("Database connection test failed")
+        if USE_ASYNC_DB:
+            with _timed(timings, "async pool"):
+                await init_async_db_pool()
+            if await test_async_connection():
+                logger.info("Async database connection successful")
+            else:
+                logger.error("Async database connection test failed")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}")
+        raise
+    
+    store = VerificationStore()
+    
+    # The list view needs verification_summary and the detail cache the change-notification
+    # triggers, so refuse to start on an out-of-date schema. Instances starting together
+    # take turns through the migration advisory lock.
+    with _timed(timings, "migrations"):
+        try:
+            if MIGRATE_ON_STARTUP:
+                migrate()
+            else:
+                check_schema()
+        except Exception as e:
+            logger.error(f"Database schema is not ready: {e}")
+            raise
+    subscribe_notifications(CHANGE_CHANNEL, store.handle_change_notification, on_reconnect=store.handle_notification_reconnect)
+    
+    # Live list updates for /api/verifications/stream, from the same LISTEN connection
+    feed = VerificationFeed(store.summary_from_json)
+    feed.start()
+    subscribe_notifications(FEED_CHANNEL, feed.handle_notification, on_reconnect=feed.resync)
+    start_notification_listener()
+    
+    ingest_queue = WriteBehindQueue(store.ingest_batch, os.path.join(INGEST_SPOOL_DIR, INGEST_SPOOL_FILE))
+    # Earlier releases spooled into the storage directory, which /api/files serves
+    ingest_queue.adopt_spool(os.path.join(store.storage_path, INGEST_SPOOL_FILE))
+    with _timed(timings, "ingest queue"):
+        await ingest_queue.start()
+    
+    app.state.store = store
+    app.state.ingest_queue = ingest_queue
+    app.state.feed = feed
+    steps = ", ".join(f"{step} {ms:.0f} ms" for step, ms in timings.items())
+    logger.info(f"Application startup complete in {(time.perf_counter() - started) * 1000:.0f} ms ({steps})")
+    
+    try:
+        yield
+    finally:
+        # End open feed streams, flush accepted ingest records, then close database connections
+        feed.close()
+        logger.info("Application shutdown - Draining ingest queue")
+        await ingest_queue.stop()
+        logger.info("Application shutdown - Closing database connections")
+        stop_notification_listener()
+        unsubscribe_notifications(CHANGE_CHANNEL, store.handle_change_notification, on_reconnect=store.handle_notification_reconnect)
+        unsubscribe_notifications(FEED_CHANNEL, feed.handle_notification, on_reconnect=feed.resync)
+        close_db_pool()
+        await close_async_db_pool()
+
 app = FastAPI(
     title="Welocity BGC Backend",
     description="Internal API for Background Check Dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Refuse oversized uploads before they are spooled to disk (inside CORS, so a 413 carries its headers)
+app.add_middleware(RequestSizeLimitMiddleware, limits=REQUEST_SIZE_LIMITS)
+
 # CORS Configuration
 origins = [
     "http://localhost:3001", # Next.js frontend
@@ -30,35 +140,71 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-# Startup event - initialize database
-@app.on_event("startup")
-async def startup_event():
-    logger.info("Application startup - Initializing database connection")
-    try:
-        init_db_pool()
-        if test_connection():
-            logger.info("Database connection successful")
-        else:
-            logger.error("Database connection test failed")
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-        raise
+# Per-route latency histograms, exposed with query and pool metrics at /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Pool exhaustion is a temporary overload, not a server error
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout):
+    logger.warning(f"Database pool exhausted for {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database busy, please retry"},
+        headers={"Retry-After": "1"}
+    )
 
-# Shutdown event - close database connections
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("Application shutdown - Closing database connections")
-    close_db_pool()
+# A full ingest queue is backpressure; the client should retry shortly
+@app.exception_handler(IngestQueueUnavailable)
+async def ingest_queue_unavailable_handler(request: Request, exc: IngestQueueUnavailable):
+    logger.warning(f"Ingest rejected for {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+# A cancelled query hit its route's statement timeout, unless the client disconnected
+@app.exception_handler(psycopg2.errors.QueryCanceled)
+@app.exception_handler(psycopg.errors.QueryCanceled)
+@app.exception_handler(QueryCancelled)
+async def query_cancelled_handler(request: Request, exc: Exception):
+    scope = getattr(request.state, "cancel_scope", None)
+    if scope is not None and scope.cancelled:
+        # Nobody reads this response; 499 (client closed request) keeps it apart in the request metrics
+        return Response(status_code=499)
+    logger.warning(f"Query timed out for {request.url.path}: {exc}")
+    return JSONResponse(status_code=503, content={"detail": "Database query timed out"})
 
 # Include Routers
 app.include_router(verifications.router, prefix="/api/verifications", tags=["Verifications"])
+app.include_router(files.router, prefix="/api/files", tags=["Files"])
+app.include_router(metrics.router)
 
 @app.get("/")
 def health_check():
     return {"status": "ok", "service": "bgc-backend"}
 
+@app.get("/health/db")
+def database_health():
+    """Live connection pool statistics, and the routing state of any read replicas."""
+    return {"pool": get_pool_stats(), "replicas": get_replica_stats()}
+
+@app.get("/health/cache")
+def cache_health(store: VerificationStore = Depends(get_store)):
+    """Hit/miss counters for the verification detail and stats caches."""
+    return {"detail": store.detail_cache.stats(), "stats": store.stats_cache.stats()}
+
+@app.get("/health/ingest")
+def ingest_health(ingest_queue: WriteBehindQueue = Depends(get_ingest_queue)):
+    """Write-behind ingest queue depth and counters."""
+    return {"queue": ingest_queue.stats()}
+
+IMPORT_MS = (time.perf_counter() - IMPORT_STARTED) * 1000
+
 if __name__ == "__main__":
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Feed streams stay open until the client leaves; don't let them hold up shutdown
+    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True, timeout_graceful_shutdown=5)
 
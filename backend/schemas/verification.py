@@ -18,6 +18,16 @@ class VerificationIngest(BaseModel):
     timestamps: Dict[str, str]
     vendor: Optional[str] = None
 
+class BulkIngestFailure(BaseModel):
+    line: int
+    session_id: Optional[str] = None
+    error: str
+
+class BulkIngestResult(BaseModel):
+    received: int
+    ingested: int
+    failed: List[BulkIngestFailure]
+
 # --- Response Schemas (Matching Frontend Types) ---
 
 class UserInfo(BaseModel):
@@ -69,6 +79,10 @@ class DeviceInfo(BaseModel):
     browser: str
     ip: str
     location: str
+    osVersion: Optional[str] = None
+    browserVersion: Optional[str] = None
+    brand: Optional[str] = None
+    model: Optional[str] = None
 
 class PrivacyInfo(BaseModel):
     status: str
@@ -126,3 +140,16 @@ class VerificationDetail(VerificationSession):
     liveness: LivenessInfo
     faceMatch: FaceMatchInfo
     events: List[VerificationEvent]
+
+class DailyCount(BaseModel):
+    date: str
+    count: int
+
+class VerificationStats(BaseModel):
+    total: int
+    byStatus: Dict[str, int]
+    byDocumentType: Dict[str, int]
+    perDay: List[DailyCount]
+    createdFrom: Optional[str] = None
+    createdTo: Optional[str] = None
+    generatedAt: str
@@ -0,0 +1,171 @@
+import time
+from contextlib import asynccontextmanager, AsyncExitStack
+from typing import Dict, Optional
+import psycopg
+from psycopg import AsyncCursor
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+from backend.services.cancellation import QueryCancelled, current_cancel_scope
+from backend.services.db import (
+    DB_CONFIG, REPLICA_LAG_QUERY, SET_STATEMENT_TIMEOUT_QUERY, RESET_STATEMENT_TIMEOUT_QUERY,
+    current_statement_timeout, replica_router
+)
+from backend.services.metrics import record_query
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Async connection pool (psycopg 3), used when DB_ASYNC is enabled
+async_connection_pool = None
+
+# Async read replica pools by replica name; routing state is shared with the psycopg2 pools
+async_replica_pools: Dict[str, AsyncConnectionPool] = {}
+
+class TimedAsyncCursor(AsyncCursor):
+    """Async cursor recording every execute() in the query metrics."""
+
+    async def execute(self, query, params=None, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await super().execute(query, params, **kwargs)
+        finally:
+            record_query(query, time.perf_counter() - started, driver="psycopg")
+
+async def init_async_db_pool(minconn=1, maxconn=10):
+    """Initialize the async database connection pool, closing any pool it replaces."""
+    global async_connection_pool
+    if async_connection_pool:
+        logger.warning("Async database connection pool already initialized; closing the previous pool")
+        await close_async_db_pool()
+    try:
+        async_connection_pool = _create_pool(DB_CONFIG, minconn, maxconn)
+        await async_connection_pool.open(wait=True)
+        logger.info("Async database connection pool created successfully")
+    except Exception as e:
+        logger.error(f"Error creating async connection pool: {e}")
+        raise
+    
+    # Replica pools connect lazily, so a replica that is down does not stop startup
+    for replica in replica_router.replicas:
+        async_replica_pools[replica.name] = _create_pool(replica.config, 0, maxconn)
+        await async_replica_pools[replica.name].open()
+    return True
+
+def _create_pool(config, minconn, maxconn) -> AsyncConnectionPool:
+    conninfo = make_conninfo(
+        host=config['host'],
+        port=config['port'],
+        dbname=config['database'],
+        user=config['user'],
+        password=config['password']
+    )
+    return AsyncConnectionPool(
+        conninfo,
+        min_size=minconn,
+        max_size=maxconn,
+        kwargs={'row_factory': dict_row, 'cursor_factory': TimedAsyncCursor},
+        open=False
+    )
+
+async def close_async_db_pool():
+    """Close all connections in the async pool."""
+    global async_connection_pool
+    for replica_pool in async_replica_pools.values():
+        await replica_pool.close()
+    async_replica_pools.clear()
+    if async_connection_pool:
+        await async_connection_pool.close()
+        async_connection_pool = None
+        logger.info("Async database connection pool closed")
+
+async def _enter_replica_connection(stack: AsyncExitStack):
+    """Enter a connection to the next available replica on stack; returns (replica, connection) or None."""
+    for replica in replica_router.candidates():
+        replica_pool = async_replica_pools.get(replica.name)
+        if replica_pool is None:
+            continue
+        attempt = AsyncExitStack()
+        try:
+            conn = await attempt.enter_async_context(replica_pool.connection(timeout=replica_router.acquire_timeout))
+            if replica_router.needs_check(replica):
+                async with conn.cursor() as cur:
+                    await cur.execute(REPLICA_LAG_QUERY)
+                    lag_seconds = (await cur.fetchone())['lag_seconds']
+                if not replica_router.record_check(replica, lag_seconds):
+                    await attempt.aclose()
+                    continue
+        except PoolTimeout:
+            # Busy rather than broken: try the next one without taking it out of rotation
+            await attempt.aclose()
+            continue
+        except psycopg.Error as e:
+            await attempt.__aexit__(type(e), e, e.__traceback__)
+            replica_router.mark_failed(replica, e)
+            continue
+        replica_router.record_read(replica)
+        stack.push_async_exit(attempt)
+        return replica, conn
+    return None
+
+async def _set_statement_timeout(conn, timeout_ms: Optional[int]):
+    """Give a checked-out connection the statement_timeout wanted by its caller; see db._set_statement_timeout."""
+    if getattr(conn, 'statement_timeout_ms', None) == timeout_ms:
+        return
+    async with conn.cursor() as cur:
+        if timeout_ms is None:
+            await cur.execute(RESET_STATEMENT_TIMEOUT_QUERY)
+        else:
+            await cur.execute(SET_STATEMENT_TIMEOUT_QUERY, (str(timeout_ms),))
+    await conn.commit()
+    conn.statement_timeout_ms = timeout_ms
+
+@asynccontextmanager
+async def get_async_db_connection(read_only=False):
+    """
+    Async context manager for database connections. Commits on success, rolls back on error.
+    
+    With read_only, the connection comes from a read replica when one is
+    available; see get_db_connection, also for statement timeouts and cancellation.
+    """
+    scope = current_cancel_scope.get()
+    replica = None
+    try:
+        async with AsyncExitStack() as stack:
+            routed = await _enter_replica_connection(stack) if read_only and async_replica_pools else None
+            if routed:
+                replica, conn = routed
+            else:
+                conn = await stack.enter_async_context(async_connection_pool.connection())
+            await _set_statement_timeout(conn, current_statement_timeout.get())
+            if scope is not None:
+                scope.add(conn)
+                # Runs before the connection goes back to the pool
+                stack.callback(scope.discard, conn)
+            yield conn
+    except Exception as e:
+        if replica is not None and conn.broken:
+            # The replica dropped the connection mid-query
+            replica_router.mark_failed(replica, e)
+        if isinstance(e, (psycopg.errors.QueryCanceled, QueryCancelled)):
+            logger.warning(f"Query cancelled: {e}")
+        else:
+            logger.error(f"Database error: {e}")
+        raise
+
+def get_async_db_cursor(conn):
+    """Get a cursor from an async connection. Rows are returned as dicts."""
+    return conn.cursor()
+
+async def test_async_connection():
+    """Test the async database connection."""
+    try:
+        async with get_async_db_connection() as conn:
+            async with get_async_db_cursor(conn) as cur:
+                await cur.execute("SELECT version();")
+                version = await cur.fetchone()
+                logger.info(f"PostgreSQL version (async): {version}")
+                return True
+    except Exception as e:
+        logger.error(f"Async connection test failed: {e}")
+        return False
@@ -0,0 +1,62 @@
+import threading
+from contextvars import ContextVar
+from typing import Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCancelled(Exception):
+    """Raised when a query is about to start for a request that has already been cancelled."""
+
+
+class CancelScope:
+    """
+    The queries running on behalf of one API request (or one coalesced load),
+    so they can be cancelled server-side when nobody wants their result any more.
+
+    Members are anything with a cancel() method that is safe to call from
+    another thread: psycopg2 and psycopg connections, whose cancel() asks the
+    server to interrupt the statement in progress, or a caller's share of a
+    coalesced load. cancel() holds the scope lock while it signals, and
+    discard() takes it, so a connection is never cancelled after it has been
+    handed back to the pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._members: Set = set()
+        self.cancelled = False
+
+    def add(self, member):
+        """
+        Register member until discard(member).
+
+        Raises:
+            QueryCancelled: If the scope has already been cancelled
+        """
+        with self._lock:
+            if self.cancelled:
+                raise QueryCancelled("request was cancelled before its query started")
+            self._members.add(member)
+
+    def discard(self, member):
+        with self._lock:
+            self._members.discard(member)
+
+    def cancel(self):
+        """Cancel every registered member; members added afterwards are refused."""
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            for member in self._members:
+                try:
+                    member.cancel()
+                except Exception as e:
+                    logger.warning(f"Could not cancel {member!r}: {e}")
+
+
+# Scope of the request (or coalesced load) the current code runs for; None outside API requests.
+# Context variables follow run_in_threadpool and tasks, so the store never passes it along.
+current_cancel_scope: ContextVar[Optional[CancelScope]] = ContextVar('current_cancel_scope', default=None)
@@ -1,9 +1,19 @@
 import os
+import time
+import select
+import threading
+import itertools
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from typing import Dict, List, Optional
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import errors, extensions, pool
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, TRANSACTION_STATUS_IDLE
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
 from dotenv import load_dotenv
+from backend.services.cancellation import QueryCancelled, current_cancel_scope
+from backend.services.metrics import record_query
 import logging
 
 # Load environment variables from .env file
@@ -20,52 +30,662 @@ DB_CONFIG = {
     'password': os.getenv('POSTGRES_PASSWORD', '')
 }
 
+# Serve API reads from the async (psycopg 3) pool instead of the psycopg2 pool
+USE_ASYNC_DB = os.getenv('DB_ASYNC', 'false').lower() in ('1', 'true', 'yes')
+
+# Connection pool sizing and health settings
+POOL_CONFIG = {
+    'minconn': int(os.getenv('DB_POOL_MIN', 1)),
+    'maxconn': int(os.getenv('DB_POOL_MAX', 10)),
+    # Seconds a caller waits for a free connection before PoolTimeout
+    'acquire_timeout': float(os.getenv('DB_POOL_ACQUIRE_TIMEOUT', 10)),
+    # Connections older than this (seconds) are closed and replaced
+    'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', 1800)),
+    # Connections idle longer than this (seconds) are pinged before reuse
+    'validate_after': float(os.getenv('DB_POOL_VALIDATE_AFTER', 30))
+}
+
+# statement_timeout (ms) for the queries of API read routes, by route kind; 0 for none.
+# Bounds how long one slow request can hold a pooled connection. Export cursors
+# apply it per FETCH batch, not to the whole download.
+STATEMENT_TIMEOUTS = {
+    'read': int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 5000)),
+    'stats': int(os.getenv('DB_STATS_STATEMENT_TIMEOUT_MS', 15000)),
+    'export': int(os.getenv('DB_EXPORT_STATEMENT_TIMEOUT_MS', 30000))
+}
+
+# Timeout (ms) for connections checked out in the current context; None keeps the server's setting
+current_statement_timeout: ContextVar[Optional[int]] = ContextVar('current_statement_timeout', default=None)
+
+# Session-level, so a pooled connection only needs it again when the next checkout wants another value
+SET_STATEMENT_TIMEOUT_QUERY = "SELECT set_config('statement_timeout', %s, false);"
+RESET_STATEMENT_TIMEOUT_QUERY = "RESET statement_timeout;"
+
+# Read replicas as comma-separated host[:port]; they share the primary's database, user and password
+REPLICA_HOSTS = [host.strip() for host in os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',') if host.strip()]
+
+# Replica routing and health settings
+REPLICA_CONFIG = {
+    # Seconds a replica that failed or fell behind is skipped before it is tried again
+    'retry_interval': float(os.getenv('DB_REPLICA_RETRY_INTERVAL', 5)),
+    # Seconds a read waits for a busy replica's pool before going to the next replica or
+    # the primary; kept well below DB_POOL_ACQUIRE_TIMEOUT so a saturated replica costs little
+    'acquire_timeout': float(os.getenv('DB_REPLICA_ACQUIRE_TIMEOUT', 0.1)),
+    # Seconds between replication lag checks of a replica in use
+    'check_interval': float(os.getenv('DB_REPLICA_CHECK_INTERVAL', 5)),
+    # Replicas further behind the primary than this (seconds) are skipped
+    'max_lag': float(os.getenv('DB_REPLICA_MAX_LAG', 5))
+}
+
+# Seconds the replica has not yet replayed; 0 when caught up (or not a standby)
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END::float as lag_seconds;
+"""
+
+# Upper bounds (seconds) of the acquire latency histogram buckets
+ACQUIRE_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class TimedCursorMixin:
+    """Cursor mixin recording every execute() in the query metrics, keyed by statement fingerprint."""
+
+    def execute(self, query, vars=None):
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            record_query(query, time.perf_counter() - started)
+
+    def executemany(self, query, vars_list):
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            record_query(query, time.perf_counter() - started)
+
+
+class TimedRealDictCursor(TimedCursorMixin, RealDictCursor):
+    pass
+
+
+class PooledConnection(extensions.connection):
+    """Connection remembering the statement_timeout it was last given (None: the server's setting)."""
+
+    statement_timeout_ms: Optional[int] = None
+
+
+class PoolTimeout(pool.PoolError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class BlockingConnectionPool:
+    """
+    Thread-safe psycopg2 connection pool.
+    
+    Unlike SimpleConnectionPool, callers wait (up to acquire_timeout) for a connection
+    instead of failing immediately when every connection is in use. Idle connections
+    are validated before reuse and recycled after max_lifetime.
+    """
+
+    def __init__(self, minconn, maxconn, acquire_timeout=10.0, max_lifetime=1800.0,
+                 validate_after=30.0, **kwargs):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.validate_after = validate_after
+        self._kwargs = kwargs
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, created_at, last_used)
+        self._in_use = {}  # id(conn) -> created_at
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+        
+        # Stats
+        self._acquire_count = 0
+        self._timeout_count = 0
+        self._recycled_count = 0
+        self._wait_seconds_total = 0.0
+        self._latency_buckets = [0] * (len(ACQUIRE_LATENCY_BUCKETS) + 1)
+        
+        for _ in range(minconn):
+            self._idle.append((self._connect(), time.monotonic(), time.monotonic()))
+            self._size += 1
+
+    def _connect(self):
+        return psycopg2.connect(connection_factory=PooledConnection, **self._kwargs)
+
+    def _is_usable(self, conn, created_at, last_used) -> bool:
+        """Check whether an idle connection can be handed out again."""
+        now = time.monotonic()
+        if conn.closed or now - created_at > self.max_lifetime:
+            return False
+        if now - last_used > self.validate_after:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1;")
+                conn.rollback()
+            except psycopg2.Error:
+                return False
+        return True
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _record_acquire(self, elapsed: float):
+        self._acquire_count += 1
+        self._wait_seconds_total += elapsed
+        for i, bound in enumerate(ACQUIRE_LATENCY_BUCKETS):
+            if elapsed <= bound:
+                self._latency_buckets[i] += 1
+                break
+        else:
+            self._latency_buckets[-1] += 1
+
+    def getconn(self, timeout=None):
+        """Get a connection, waiting up to timeout (default acquire_timeout) seconds for one to free up."""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        
+        while True:
+            entry = None
+            with self._cond:
+                self._waiting += 1
+                try:
+                    while True:
+                        if self._closed:
+                            raise pool.PoolError("connection pool is closed")
+                        if self._idle:
+                            entry = self._idle.pop()
+                            break
+                        if self._size < self.maxconn:
+                            # Reserve a slot; the connection is opened outside the lock
+                            self._size += 1
+                            break
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeout_count += 1
+                            raise PoolTimeout(
+                                f"no database connection available after {timeout:.1f}s "
+                                f"({self.maxconn} in use)"
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            
+            if entry is not None:
+                conn, created_at, last_used = entry
+                if not self._is_usable(conn, created_at, last_used):
+                    # Replace the stale connection in the same slot
+                    self._discard(conn)
+                    with self._cond:
+                        self._recycled_count += 1
+                    entry = None
+            
+            if entry is None:
+                try:
+                    conn, created_at = self._connect(), time.monotonic()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            
+            with self._cond:
+                self._in_use[id(conn)] = created_at
+                self._record_acquire(time.monotonic() - started)
+            return conn
+
+    def putconn(self, conn, close=False):
+        """Return a connection to the pool, closing it if it is broken, too old or close is set."""
+        with self._cond:
+            created_at = self._in_use.pop(id(conn), None)
+            if created_at is None:
+                raise pool.PoolError("trying to put unkeyed connection")
+        
+        keep = not (close or self._closed or conn.closed
+                    or time.monotonic() - created_at > self.max_lifetime)
+        if keep and conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                keep = False
+        if not keep:
+            self._discard(conn)
+        
+        with self._cond:
+            if keep:
+                self._idle.append((conn, created_at, time.monotonic()))
+            else:
+                self._size -= 1
+            self._cond.notify()
+
+    def closeall(self):
+        """Close idle connections and mark the pool closed; in-use connections close when returned."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage and acquire latency."""
+        with self._cond:
+            cumulative = 0
+            histogram = {}
+            for bound, count in zip(ACQUIRE_LATENCY_BUCKETS + ('+Inf',), self._latency_buckets):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            return {
+                'size': self._size,
+                'max': self.maxconn,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'acquired_total': self._acquire_count,
+                'timeouts_total': self._timeout_count,
+                'recycled_total': self._recycled_count,
+                'wait_seconds_total': round(self._wait_seconds_total, 6),
+                'acquire_latency_seconds': histogram
+            }
+
+
+class Replica:
+    """Routing state of one read replica."""
+
+    def __init__(self, host: str):
+        name, _, port = host.partition(':')
+        self.name = host
+        self.config = {**DB_CONFIG, 'host': name, 'port': int(port or DB_CONFIG['port'])}
+        self.available = True
+        self.retry_at = 0.0
+        self.checked_at = 0.0
+        self.lag_seconds: Optional[float] = None
+        self.reads = 0
+        self.failures = 0
+
+
+class ReplicaRouter:
+    """
+    Picks the replica for each read: round-robin over the replicas that are up
+    and within max_lag of the primary. A replica whose connection fails, or
+    whose lag check finds it too far behind, is skipped for retry_interval and
+    then tried again. Callers wait at most acquire_timeout for a busy replica's
+    pool and fall back to the primary when none is available.
+    
+    Holds no connections, so the psycopg2 and async pools share its view.
+    """
+
+    def __init__(self, hosts: List[str], retry_interval: float = 5.0,
+                 check_interval: float = 5.0, max_lag: float = 5.0, acquire_timeout: float = 0.1):
+        self.replicas = [Replica(host) for host in hosts]
+        self.retry_interval = retry_interval
+        self.check_interval = check_interval
+        self.max_lag = max_lag
+        self.acquire_timeout = acquire_timeout
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def candidates(self) -> List[Replica]:
+        """Replicas to try for one read, in order: the next one in rotation first."""
+        if not self.replicas:
+            return []
+        now = time.monotonic()
+        start = next(self._next) % len(self.replicas)
+        rotated = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in rotated if replica.available or now >= replica.retry_at]
+
+    def needs_check(self, replica: Replica) -> bool:
+        """Whether the lag should be measured on the connection just taken for this replica."""
+        return not replica.available or time.monotonic() - replica.checked_at >= self.check_interval
+
+    def record_check(self, replica: Replica, lag_seconds: float) -> bool:
+        """Record a lag measurement; returns whether the replica may serve reads."""
+        with self._lock:
+            replica.checked_at = time.monotonic()
+            replica.lag_seconds = lag_seconds
+            if lag_seconds > self.max_lag:
+                if replica.available:
+                    logger.warning(f"Read replica {replica.name} is {lag_seconds:.1f}s behind; routing reads elsewhere")
+                replica.available = False
+                replica.retry_at = replica.checked_at + self.retry_interval
+                return False
+            if not replica.available:
+                logger.info(f"Read replica {replica.name} is back ({lag_seconds:.1f}s behind)")
+            replica.available = True
+            return True
+
+    def record_read(self, replica: Replica):
+        with self._lock:
+            replica.reads += 1
+
+    def mark_failed(self, replica: Replica, error: Exception):
+        """Take a replica out of rotation for retry_interval after a connection failure."""
+        with self._lock:
+            replica.failures += 1
+            if replica.available:
+                logger.warning(f"Read replica {replica.name} failed, routing reads elsewhere for {self.retry_interval:.0f}s: {error}")
+            replica.available = False
+            replica.retry_at = time.monotonic() + self.retry_interval
+
+    def stats(self) -> List[dict]:
+        with self._lock:
+            return [{
+                'replica': replica.name,
+                'available': replica.available,
+                'lag_seconds': replica.lag_seconds,
+                'reads': replica.reads,
+                'failures': replica.failures
+            } for replica in self.replicas]
+
+
 # Connection pool
 connection_pool = None
 
-def init_db_pool(minconn=1, maxconn=10):
-    """Initialize the database connection pool."""
+# Read replica pools by replica name, and the router choosing between them
+replica_pools: Dict[str, BlockingConnectionPool] = {}
+replica_router = ReplicaRouter(REPLICA_HOSTS, **REPLICA_CONFIG)
+
+def init_db_pool(minconn=POOL_CONFIG['minconn'], maxconn=POOL_CONFIG['maxconn']):
+    """Initialize the database connection pool, closing any pool it replaces."""
     global connection_pool
+    if connection_pool:
+        logger.warning("Database connection pool already initialized; closing the previous pool")
+        close_db_pool()
     try:
-        connection_pool = psycopg2.pool.SimpleConnectionPool(
+        connection_pool = BlockingConnectionPool(
             minconn,
             maxconn,
+            acquire_timeout=POOL_CONFIG['acquire_timeout'],
+            max_lifetime=POOL_CONFIG['max_lifetime'],
+            validate_after=POOL_CONFIG['validate_after'],
             **DB_CONFIG
         )
         logger.info("Database connection pool created successfully")
-        return True
     except Exception as e:
         logger.error(f"Error creating connection pool: {e}")
         raise
+    
+    # Replica pools connect lazily, so a replica that is down does not stop startup
+    for replica in replica_router.replicas:
+        replica_pools[replica.name] = BlockingConnectionPool(
+            0,
+            maxconn,
+            acquire_timeout=POOL_CONFIG['acquire_timeout'],
+            max_lifetime=POOL_CONFIG['max_lifetime'],
+            validate_after=POOL_CONFIG['validate_after'],
+            **replica.config
+        )
+    if replica_pools:
+        logger.info(f"Routing reads to replicas: {', '.join(replica_pools)}")
+    return True
 
 def close_db_pool():
     """Close all connections in the pool."""
     global connection_pool
+    for replica_pool in replica_pools.values():
+        replica_pool.closeall()
+    replica_pools.clear()
     if connection_pool:
         connection_pool.closeall()
+        connection_pool = None
         logger.info("Database connection pool closed")
 
+def get_pool_stats():
+    """Live statistics for the connection pool, or None if it is not initialized."""
+    return connection_pool.stats() if connection_pool else None
+
+def get_replica_stats() -> List[dict]:
+    """Routing state and pool statistics of each read replica."""
+    stats = replica_router.stats()
+    for replica in stats:
+        replica_pool = replica_pools.get(replica['replica'])
+        replica['pool'] = replica_pool.stats() if replica_pool else None
+    return stats
+
+def _replica_lag(conn) -> float:
+    with conn.cursor() as cur:
+        cur.execute(REPLICA_LAG_QUERY)
+        lag_seconds = cur.fetchone()[0]
+    conn.rollback()
+    return lag_seconds
+
+def _get_replica_connection():
+    """(replica, pool, connection) for the next available replica, or None to use the primary."""
+    for replica in replica_router.candidates():
+        replica_pool = replica_pools.get(replica.name)
+        if replica_pool is None:
+            continue
+        try:
+            conn = replica_pool.getconn(timeout=replica_router.acquire_timeout)
+        except PoolTimeout:
+            # Busy rather than broken: try the next one without taking it out of rotation
+            continue
+        except psycopg2.Error as e:
+            replica_router.mark_failed(replica, e)
+            continue
+        if replica_router.needs_check(replica):
+            try:
+                caught_up = replica_router.record_check(replica, _replica_lag(conn))
+            except psycopg2.Error as e:
+                replica_pool.putconn(conn, close=True)
+                replica_router.mark_failed(replica, e)
+                continue
+            if not caught_up:
+                replica_pool.putconn(conn)
+                continue
+        replica_router.record_read(replica)
+        return replica, replica_pool, conn
+    return None
+
+def _set_statement_timeout(conn, timeout_ms: Optional[int]):
+    """Give a checked-out connection the statement_timeout wanted by its caller, if it has another one."""
+    if conn.statement_timeout_ms == timeout_ms:
+        return
+    with conn.cursor() as cur:
+        if timeout_ms is None:
+            cur.execute(RESET_STATEMENT_TIMEOUT_QUERY)
+        else:
+            cur.execute(SET_STATEMENT_TIMEOUT_QUERY, (str(timeout_ms),))
+    # Committed on its own, so a rollback of the caller's transaction cannot undo it
+    conn.commit()
+    conn.statement_timeout_ms = timeout_ms
+
 @contextmanager
-def get_db_connection():
-    """Context manager for database connections."""
+def get_db_connection(read_only=False):
+    """
+    Context manager for database connections.
+    
+    With read_only, the connection comes from a read replica when one is
+    configured and available (see ReplicaRouter), otherwise from the primary.
+    Only use it for reads that may trail the primary by up to DB_REPLICA_MAX_LAG.
+    
+    The connection runs with the current_statement_timeout and is registered in
+    the current_cancel_scope, so API routes bound their queries and cancel them
+    when the client goes away.
+    """
+    conn_pool = connection_pool
+    if conn_pool is None:
+        raise RuntimeError("Database connection pool is not initialized; call init_db_pool() first")
+    scope = current_cancel_scope.get()
     conn = None
+    replica = None
     try:
-        conn = connection_pool.getconn()
+        if read_only and replica_pools:
+            routed = _get_replica_connection()
+            if routed:
+                replica, conn_pool, conn = routed
+        if conn is None:
+            conn = conn_pool.getconn()
+        _set_statement_timeout(conn, current_statement_timeout.get())
+        if scope is not None:
+            scope.add(conn)
         yield conn
         conn.commit()
     except Exception as e:
-        if conn:
+        if conn and not conn.closed:
             conn.rollback()
-        logger.error(f"Database error: {e}")
+        elif replica is not None:
+            # The replica dropped the connection mid-query
+            replica_router.mark_failed(replica, e)
+        if isinstance(e, (errors.QueryCanceled, QueryCancelled)):
+            logger.warning(f"Query cancelled: {e}")
+        else:
+            logger.error(f"Database error: {e}")
         raise
     finally:
         if conn:
-            connection_pool.putconn(conn)
+            if scope is not None:
+                scope.discard(conn)
+            conn_pool.putconn(conn)
 
-def get_db_cursor(conn, cursor_factory=RealDictCursor):
-    """Get a cursor from a connection."""
+def get_db_cursor(conn, cursor_factory=TimedRealDictCursor):
+    """Get a cursor from a connection. Queries are timed unless another cursor_factory is given."""
     return conn.cursor(cursor_factory=cursor_factory)
 
+def get_db_server_cursor(conn, name, itersize=500, cursor_factory=TimedRealDictCursor):
+    """
+    Get a named (server-side) cursor from a connection.
+    Rows are streamed from the server in batches of itersize instead of being loaded at once.
+    """
+    cur = conn.cursor(name=name, cursor_factory=cursor_factory)
+    cur.itersize = itersize
+    return cur
+
+class NotificationListener:
+    """
+    Background thread holding one dedicated connection that LISTENs on Postgres channels
+    and dispatches each NOTIFY payload to the callbacks subscribed to that channel.
+    
+    The connection is re-established with backoff if it drops. Because notifications
+    sent while disconnected are lost, on_reconnect callbacks run after every reconnect
+    so subscribers can discard state that may have missed an update.
+    """
+
+    def __init__(self, poll_interval=1.0, max_backoff=30.0):
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._callbacks = defaultdict(list)
+        self._reconnect_callbacks = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._conn = None
+
+    def subscribe(self, channel, callback, on_reconnect=None):
+        """Register callback(payload: str) for a channel. Subscribe before start(); channels are LISTENed on connect."""
+        with self._lock:
+            self._callbacks[channel].append(callback)
+            if on_reconnect:
+                self._reconnect_callbacks.append(on_reconnect)
+
+    def unsubscribe(self, channel, callback, on_reconnect=None):
+        """Remove callbacks registered with subscribe(). The channel stays LISTENed until reconnect."""
+        with self._lock:
+            if callback in self._callbacks.get(channel, []):
+                self._callbacks[channel].remove(callback)
+            if on_reconnect in self._reconnect_callbacks:
+                self._reconnect_callbacks.remove(on_reconnect)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval * 2)
+        self._close_connection()
+
+    def _close_connection(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _connect(self):
+        conn = psycopg2.connect(**DB_CONFIG)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with self._lock:
+            channels = list(self._callbacks)
+        with conn.cursor() as cur:
+            for channel in channels:
+                cur.execute(f'LISTEN "{channel}";')
+        logger.info(f"Listening for notifications on {channels}")
+        return conn
+
+    def _dispatch(self, notify):
+        with self._lock:
+            callbacks = list(self._callbacks.get(notify.channel, []))
+        for callback in callbacks:
+            try:
+                callback(notify.payload)
+            except Exception as e:
+                logger.error(f"Notification callback failed on {notify.channel}: {e}")
+
+    def _run(self):
+        backoff = 1.0
+        first_connect = True
+        while not self._stop.is_set():
+            try:
+                if self._conn is None:
+                    self._conn = self._connect()
+                    backoff = 1.0
+                    if not first_connect:
+                        with self._lock:
+                            reconnect_callbacks = list(self._reconnect_callbacks)
+                        for callback in reconnect_callbacks:
+                            callback()
+                    first_connect = False
+                
+                conn = self._conn
+                if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    self._dispatch(conn.notifies.pop(0))
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.warning(f"Notification listener error, reconnecting in {backoff:.0f}s: {e}")
+                self._close_connection()
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+
+# Shared LISTEN connection
+notification_listener = NotificationListener()
+
+def subscribe_notifications(channel, callback, on_reconnect=None):
+    """Subscribe to a Postgres NOTIFY channel on the shared listener."""
+    notification_listener.subscribe(channel, callback, on_reconnect=on_reconnect)
+
+def unsubscribe_notifications(channel, callback, on_reconnect=None):
+    notification_listener.unsubscribe(channel, callback, on_reconnect=on_reconnect)
+
+def start_notification_listener():
+    notification_listener.start()
+
+def stop_notification_listener():
+    notification_listener.stop()
+
 def test_connection():
     """Test database connection."""
     try:
@@ -0,0 +1,146 @@
+import os
+import json
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Optional, Set, Tuple
+from backend.services.serialization import dumps
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel the verification_summary triggers publish list-view changes on
+FEED_CHANNEL = "verification_feed"
+
+# Events each client may fall behind by before it is disconnected (it reconnects and resumes)
+FEED_CLIENT_QUEUE_SIZE = int(os.getenv('FEED_CLIENT_QUEUE_SIZE', 1000))
+# Recent events kept for clients resuming with Last-Event-ID
+FEED_REPLAY_SIZE = int(os.getenv('FEED_REPLAY_SIZE', 1000))
+# Seconds between keep-alive comments on an idle stream
+FEED_HEARTBEAT_INTERVAL = float(os.getenv('FEED_HEARTBEAT_INTERVAL', 15))
+
+# Sent when a client may have missed events and should reload the list
+RESYNC_EVENT = "resync"
+
+
+def _frame(event_id: int, event: str, data: bytes) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, event.encode(), data)
+
+
+class VerificationFeed:
+    """
+    Fan-out of verification_feed notifications to Server-Sent Events clients.
+
+    The shared LISTEN connection delivers each change once, on its own thread;
+    the feed turns the summary row into a VerificationSession, encodes the SSE
+    frame once and hands it to every client's queue on the event loop. A client
+    that falls FEED_CLIENT_QUEUE_SIZE events behind is disconnected rather than
+    buffered without bound; it resumes from the replay buffer on reconnect.
+    """
+
+    def __init__(self, transform: Callable[[dict], object]):
+        # Builds the response model from a summary row decoded from a notification
+        self.transform = transform
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._clients: Set[asyncio.Queue] = set()
+        self._recent: Deque[Tuple[int, bytes]] = deque(maxlen=FEED_REPLAY_SIZE)
+        self._last_id = 0
+        self._published = 0
+        self._dropped_clients = 0
+
+    def start(self):
+        """Bind to the running event loop; notifications arriving before this are ignored."""
+        self._loop = asyncio.get_running_loop()
+
+    def close(self):
+        """End every open stream."""
+        for queue in list(self._clients):
+            self._disconnect(queue)
+        self._loop = None
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> asyncio.Queue:
+        """
+        Register a client and return its queue of SSE frames (None ends the stream).
+
+        With a Last-Event-ID still in the replay buffer, the events after it are
+        queued first; with an older or unknown one, the client is told to resync.
+        """
+        queue = asyncio.Queue(maxsize=FEED_CLIENT_QUEUE_SIZE)
+        if last_event_id is not None:
+            for frame in self._replay(last_event_id):
+                queue.put_nowait(frame)
+        self._clients.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._clients.discard(queue)
+
+    def _replay(self, last_event_id: str) -> list:
+        try:
+            after = int(last_event_id)
+        except ValueError:
+            return [self._resync_frame()]
+        missed = [frame for event_id, frame in self._recent if event_id > after]
+        oldest = self._recent[0][0] if self._recent else self._last_id + 1
+        # Unknown ids include ones from before a restart, since ids restart at 1
+        if after > self._last_id or after < oldest - 1 or len(missed) >= FEED_CLIENT_QUEUE_SIZE:
+            return [self._resync_frame()]
+        return missed
+
+    def _resync_frame(self) -> bytes:
+        return _frame(self._last_id, RESYNC_EVENT, b"{}")
+
+    def handle_notification(self, payload: str):
+        """Listener callback: build the frame for one change and publish it on the event loop."""
+        try:
+            message = json.loads(payload)
+            event, row = message['event'], message['row']
+            if event == 'deleted':
+                data = dumps({"id": f"#{row['id']}"})
+            else:
+                data = dumps(self.transform(row))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed feed notification: {e}")
+            return
+        self._call_soon(self._publish, event, data)
+
+    def resync(self):
+        """Listener reconnect callback: notifications may have been lost, so clients reload."""
+        self._call_soon(self._publish, RESYNC_EVENT, b"{}")
+
+    def _call_soon(self, callback, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # Loop closed between the check and the call (shutdown)
+            pass
+
+    def _publish(self, event: str, data: bytes):
+        self._last_id += 1
+        frame = _frame(self._last_id, event, data)
+        self._recent.append((self._last_id, frame))
+        self._published += 1
+        for queue in list(self._clients):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning("Feed client fell too far behind; disconnecting it")
+                self._dropped_clients += 1
+                self._disconnect(queue)
+
+    def _disconnect(self, queue: asyncio.Queue):
+        self._clients.discard(queue)
+        # Make room for the end-of-stream marker
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def stats(self) -> dict:
+        return {
+            'clients': len(self._clients),
+            'last_event_id': self._last_id,
+            'published': self._published,
+            'dropped_clients': self._dropped_clients
+        }
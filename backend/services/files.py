@@ -0,0 +1,249 @@
+import os
+import hashlib
+import mimetypes
+import sqlite3
+import tempfile
+import anyio
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, NamedTuple, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upload streaming; limits are in bytes
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_FILE_BYTES = int(os.getenv('MAX_UPLOAD_FILE_BYTES', 25 * 1024 * 1024))
+MAX_UPLOAD_REQUEST_BYTES = int(os.getenv('MAX_UPLOAD_REQUEST_BYTES', 100 * 1024 * 1024))
+
+# Files earlier releases kept in the storage root that are not uploads (the ingest
+# spool and its replay copy); never served as legacy flat files
+LEGACY_STATE_FILES = ("ingest_spool.ndjson",)
+
+
+class UploadTooLarge(ValueError):
+    """Raised when an uploaded file exceeds its size limit."""
+
+
+class IndexEntry(NamedTuple):
+    sha256: str
+    size: int
+    content_type: str
+    created_at: str
+
+
+class StoredFile(NamedTuple):
+    url: str
+    file_id: str
+    sha256: str
+    size: int
+    content_type: str
+    # Whether put() wrote the blob, and the index entry it replaced; revert() undoes both
+    created: bool = False
+    replaced: Optional[IndexEntry] = None
+
+
+class BlobInfo(NamedTuple):
+    path: str
+    sha256: str
+    size: int
+    content_type: str
+    immutable: bool
+
+
+class FileStore:
+    """
+    Content-addressed file storage.
+
+    Blobs are stored once under blobs/<sha256[:2]>/<sha256>, so re-uploading the same
+    document does not use more disk. A small SQLite index maps session file ids
+    ("{session_id}_{file_name}", the form stored in documents.photo_file) to blob hashes.
+    Files written by the previous flat layout ({root}/{session_id}_{file_name}) are
+    still resolved.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.blob_root = os.path.join(root, "blobs")
+        self.index_path = os.path.join(root, "index.sqlite3")
+        os.makedirs(self.blob_root, exist_ok=True)
+        with self._index() as index:
+            # Persistent in the database file, so set once rather than per connection
+            index.execute("PRAGMA journal_mode=WAL")
+            index.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    file_id TEXT PRIMARY KEY,
+                    session_id TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_type TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            index.execute("CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256)")
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """An index connection for one transaction: committed (or rolled back) and closed on exit."""
+        conn = sqlite3.connect(self.index_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.blob_root, sha256[:2], sha256)
+
+    @staticmethod
+    def _write_chunk(f, hasher, chunk: bytes):
+        f.write(chunk)
+        hasher.update(chunk)
+
+    def _commit_blob(self, tmp_path: str, sha256: str) -> bool:
+        """Move a fully written temp file into place. Returns False if the blob already existed."""
+        path = self.blob_path(sha256)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        return True
+
+    def _record(self, file_id: str, session_id: str, file_name: str, sha256: str,
+                size: int, content_type: str) -> Optional[IndexEntry]:
+        """Point file_id at a blob. Returns the entry it replaced, if any."""
+        with self._index() as index:
+            row = index.execute(
+                "SELECT sha256, size, content_type, created_at FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            index.execute("""
+                INSERT INTO files (file_id, session_id, file_name, sha256, size, content_type, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (file_id) DO UPDATE SET
+                    sha256 = excluded.sha256,
+                    size = excluded.size,
+                    content_type = excluded.content_type,
+                    created_at = excluded.created_at
+            """, (file_id, session_id, file_name, sha256, size, content_type,
+                  datetime.now(timezone.utc).isoformat()))
+        return IndexEntry(*row) if row else None
+
+    async def put(self, session_id: str, file_name: str, source,
+                  max_bytes: Optional[int] = None) -> StoredFile:
+        """
+        Stream a file into the store in chunks, deduplicating by content.
+
+        Args:
+            session_id: Session the file belongs to
+            file_name: Original file name (any directory part is discarded)
+            source: Object with an async read(size) method, e.g. an UploadFile
+            max_bytes: Reject the file with UploadTooLarge once it exceeds this size
+
+        Returns:
+            StoredFile whose url addresses the content hash
+        """
+        safe_session_id = session_id.replace('#', '')
+        safe_name = os.path.basename(file_name or 'upload')
+        file_id = f"{safe_session_id}_{safe_name}"
+        content_type = mimetypes.guess_type(safe_name)[0] or "application/octet-stream"
+
+        # Blocking file I/O runs in worker threads
+        tmp_file = await anyio.to_thread.run_sync(
+            lambda: tempfile.NamedTemporaryFile(dir=self.blob_root, suffix=".part", delete=False)
+        )
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            while True:
+                chunk = await source.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLarge(f"{file_name} exceeds the {max_bytes} byte upload limit")
+                await anyio.to_thread.run_sync(self._write_chunk, tmp_file, hasher, chunk)
+            await anyio.to_thread.run_sync(tmp_file.close)
+        except BaseException:
+            tmp_file.close()
+            if os.path.exists(tmp_file.name):
+                os.remove(tmp_file.name)
+            raise
+
+        sha256 = hasher.hexdigest()
+        created = await anyio.to_thread.run_sync(self._commit_blob, tmp_file.name, sha256)
+        replaced = await anyio.to_thread.run_sync(
+            self._record, file_id, safe_session_id, safe_name, sha256, size, content_type
+        )
+        logger.info(f"Stored {file_id} as {sha256[:12]} ({size} bytes, {'new' if created else 'deduplicated'})")
+
+        return StoredFile(url=f"/api/files/{sha256}", file_id=file_id, sha256=sha256,
+                          size=size, content_type=content_type, created=created, replaced=replaced)
+
+    def _revert(self, stored_file: StoredFile):
+        with self._index() as index:
+            row = index.execute("SELECT sha256 FROM files WHERE file_id = ?", (stored_file.file_id,)).fetchone()
+            # Leave the entry alone if a later put() has already repointed it
+            if row and row[0] == stored_file.sha256:
+                if stored_file.replaced:
+                    index.execute("""
+                        UPDATE files SET sha256 = ?, size = ?, content_type = ?, created_at = ?
+                        WHERE file_id = ?
+                    """, (*stored_file.replaced, stored_file.file_id))
+                else:
+                    index.execute("DELETE FROM files WHERE file_id = ?", (stored_file.file_id,))
+            still_used = index.execute(
+                "SELECT 1 FROM files WHERE sha256 = ? LIMIT 1", (stored_file.sha256,)
+            ).fetchone()
+        path = self.blob_path(stored_file.sha256)
+        if stored_file.created and not still_used and os.path.exists(path):
+            os.remove(path)
+
+    async def revert(self, stored_file: StoredFile):
+        """
+        Undo a put(): restore the index entry it replaced (or remove the one it
+        added), and remove its blob if put() wrote it and nothing references it.
+        Files stored earlier under the same file id are kept.
+        """
+        await anyio.to_thread.run_sync(self._revert, stored_file)
+
+    def _is_legacy_upload(self, name: str) -> bool:
+        """Whether a storage root file name is a flat-layout upload ({session_id}_{file_name}) rather than store state."""
+        session_id, _, file_name = name.partition("_")
+        if not session_id or not file_name:
+            return False
+        # The index and its -wal/-shm/-journal files, temp files of uploads in progress, the spool
+        if name.startswith(os.path.basename(self.index_path)) or name.endswith(".part"):
+            return False
+        return not name.startswith(LEGACY_STATE_FILES)
+
+    def resolve(self, file_id: str) -> Optional[BlobInfo]:
+        """
+        Find the file for a content hash, an indexed session file id, or a legacy flat file name.
+        Only content-hash lookups are immutable.
+        """
+        if len(file_id) == 64 and all(c in "0123456789abcdef" for c in file_id):
+            path = self.blob_path(file_id)
+            if os.path.exists(path):
+                with self._index() as index:
+                    row = index.execute(
+                        "SELECT content_type FROM files WHERE sha256 = ? LIMIT 1", (file_id,)
+                    ).fetchone()
+                content_type = row[0] if row else "application/octet-stream"
+                return BlobInfo(path, file_id, os.path.getsize(path), content_type, immutable=True)
+
+        with self._index() as index:
+            row = index.execute(
+                "SELECT sha256, size, content_type FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+        if row and os.path.exists(self.blob_path(row[0])):
+            return BlobInfo(self.blob_path(row[0]), row[0], row[1], row[2], immutable=False)
+
+        legacy_name = os.path.basename(file_id)
+        legacy_path = os.path.join(self.root, legacy_name)
+        if self._is_legacy_upload(legacy_name) and os.path.isfile(legacy_path):
+            content_type = mimetypes.guess_type(legacy_path)[0] or "application/octet-stream"
+            return BlobInfo(legacy_path, "", os.path.getsize(legacy_path), content_type, immutable=False)
+
+        return None
@@ -0,0 +1,240 @@
+import os
+import asyncio
+from typing import Callable, List, Optional
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from backend.schemas.verification import VerificationIngest, BulkIngestFailure
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Write-behind queue sizing and retry settings
+INGEST_QUEUE_SIZE = int(os.getenv('INGEST_QUEUE_SIZE', 10000))
+INGEST_QUEUE_WORKERS = int(os.getenv('INGEST_QUEUE_WORKERS', 2))
+INGEST_QUEUE_BATCH_SIZE = int(os.getenv('INGEST_QUEUE_BATCH_SIZE', 200))
+# Seconds a worker waits for a micro-batch to fill once it has one record
+INGEST_QUEUE_LINGER = float(os.getenv('INGEST_QUEUE_LINGER', 0.05))
+# Seconds an ingest request waits for queue space before it is turned away
+INGEST_ENQUEUE_TIMEOUT = float(os.getenv('INGEST_ENQUEUE_TIMEOUT', 1))
+INGEST_RETRY_ATTEMPTS = int(os.getenv('INGEST_RETRY_ATTEMPTS', 5))
+INGEST_RETRY_BACKOFF = float(os.getenv('INGEST_RETRY_BACKOFF', 0.5))
+# Seconds shutdown waits for the queue to drain before spooling the rest to disk
+INGEST_DRAIN_TIMEOUT = float(os.getenv('INGEST_DRAIN_TIMEOUT', 30))
+# Directory of the spool file; keep it out of the storage directory, which /api/files serves
+INGEST_SPOOL_DIR = os.getenv('INGEST_SPOOL_DIR', 'backend/spool')
+INGEST_SPOOL_FILE = "ingest_spool.ndjson"
+
+
+class IngestQueueUnavailable(Exception):
+    """Raised when a record cannot be accepted because the queue is full or shutting down."""
+
+
+class WriteBehindQueue:
+    """
+    Bounded in-process queue between ingest requests and the database.
+
+    Requests enqueue validated records and return immediately; worker tasks write
+    them in micro-batches through writer (VerificationStore.ingest_batch), retrying
+    with exponential backoff while the database is unavailable. When the queue is
+    full, put() waits up to INGEST_ENQUEUE_TIMEOUT and then raises, so callers
+    push back on clients instead of growing memory.
+
+    Records that still cannot be written after every retry, or that are left
+    over when shutdown times out, are appended to an NDJSON spool file and
+    re-queued on the next start. Delivery is at-least-once: a batch interrupted
+    mid-write may be written again, which the ingest upsert tolerates. Spool
+    lines that no longer parse (e.g. cut short by a crash) are moved to a
+    .rejected file next to the spool rather than stopping the start.
+    """
+
+    def __init__(self, writer: Callable[[list], List[BulkIngestFailure]], spool_path: str,
+                 maxsize: int = INGEST_QUEUE_SIZE,
+                 workers: int = INGEST_QUEUE_WORKERS,
+                 batch_size: int = INGEST_QUEUE_BATCH_SIZE,
+                 linger: float = INGEST_QUEUE_LINGER):
+        self.writer = writer
+        self.spool_path = spool_path
+        self.maxsize = maxsize
+        self.worker_count = workers
+        self.batch_size = batch_size
+        self.linger = linger
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._closed = True
+        self._accepted = 0
+        self._written = 0
+        self._rejected = 0
+        self._retries = 0
+        self._spooled = 0
+        self._turned_away = 0
+
+    async def start(self):
+        """Start the workers and re-queue anything spooled by a previous run."""
+        if self._workers:
+            return
+        os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"ingest-writer-{n}")
+            for n in range(self.worker_count)
+        ]
+        self._closed = False
+        logger.info(f"Ingest queue started with {self.worker_count} workers (capacity {self.maxsize})")
+        await self._replay_spool()
+
+    async def stop(self, timeout: float = INGEST_DRAIN_TIMEOUT):
+        """
+        Stop accepting records and wait for the queue to drain.
+
+        Whatever is still queued or in a worker's hands after timeout seconds is
+        spooled to disk rather than dropped.
+        """
+        if not self._workers:
+            return
+        self._closed = True
+        logger.info(f"Draining ingest queue ({self._queue.qsize()} records pending)")
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Ingest queue did not drain within {timeout}s, spooling the remainder")
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        leftover = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+            self._queue.task_done()
+        if leftover:
+            self._spool(leftover)
+        logger.info(f"Ingest queue stopped: {self._written} written, {self._spooled} spooled")
+
+    async def put(self, record: VerificationIngest):
+        """
+        Accept a record for writing.
+
+        Raises:
+            IngestQueueUnavailable: If the queue is shutting down or stays full for INGEST_ENQUEUE_TIMEOUT
+        """
+        if self._closed:
+            raise IngestQueueUnavailable("Ingest queue is not accepting records")
+        try:
+            await asyncio.wait_for(self._queue.put(record), INGEST_ENQUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._turned_away += 1
+            raise IngestQueueUnavailable(f"Ingest queue is full ({self.maxsize} records pending)")
+        self._accepted += 1
+
+    async def _worker(self):
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Give a trickle of requests a moment to fill the batch
+                if self.linger and self._queue.qsize() < self.batch_size - 1:
+                    await asyncio.sleep(self.linger)
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await self._write(batch)
+            except asyncio.CancelledError:
+                self._spool(batch)
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error writing ingest batch of {len(batch)}: {e}")
+                self._spool(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: List[VerificationIngest]):
+        """Write one micro-batch, retrying transient failures and spooling it if they persist."""
+        # Two records for the same session in one batch make the batched upsert fail;
+        # ingest_batch then falls back to writing them one by one, in order.
+        records = list(enumerate(batch, start=1))
+        for attempt in range(1, INGEST_RETRY_ATTEMPTS + 1):
+            try:
+                failures = await run_in_threadpool(self.writer, records)
+            except Exception as e:
+                if attempt == INGEST_RETRY_ATTEMPTS:
+                    logger.error(f"Ingest batch of {len(batch)} failed after {attempt} attempts: {e}")
+                    self._spool(batch)
+                    return
+                delay = INGEST_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logger.warning(f"Ingest batch of {len(batch)} failed (attempt {attempt}), retrying in {delay}s: {e}")
+                self._retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            # Rejected by the database itself; retrying would fail the same way
+            for failure in failures:
+                logger.error(f"Dropping ingest record {failure.session_id}: {failure.error}")
+            self._rejected += len(failures)
+            self._written += len(batch) - len(failures)
+            return
+
+    def _spool(self, records: List[VerificationIngest]):
+        """Append records to the spool file for the next start to re-queue."""
+        with open(self.spool_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(record.model_dump_json() + "\n")
+        self._spooled += len(records)
+        logger.warning(f"Spooled {len(records)} ingest records to {self.spool_path}")
+
+    def adopt_spool(self, path: str):
+        """Move a spool left at another path (e.g. by an older release) into this queue's, for start() to replay."""
+        for src, dst in ((path, self.spool_path), (f"{path}.replay", f"{self.spool_path}.replay")):
+            if os.path.abspath(src) == os.path.abspath(dst) or not os.path.exists(src):
+                continue
+            os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+            with open(src, "rb") as f, open(dst, "ab") as out:
+                out.write(f.read())
+            os.remove(src)
+            logger.info(f"Moved ingest spool {src} to {dst}")
+
+    async def _replay_spool(self):
+        replay_path = f"{self.spool_path}.replay"
+        if os.path.exists(self.spool_path):
+            # Append, in case an earlier replay was interrupted
+            with open(self.spool_path, "rb") as src, open(replay_path, "ab") as dst:
+                dst.write(src.read())
+            os.remove(self.spool_path)
+        if not os.path.exists(replay_path):
+            return
+
+        replayed = 0
+        rejected = 0
+        with open(replay_path, encoding="utf-8", errors="replace") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = VerificationIngest.model_validate_json(line)
+                except ValidationError as e:
+                    logger.error(f"Skipping unreadable ingest spool line {line_no}: {e.errors()[0]['msg']}")
+                    with open(f"{self.spool_path}.rejected", "a", encoding="utf-8") as quarantine:
+                        quarantine.write(line if line.endswith("\n") else line + "\n")
+                    rejected += 1
+                    continue
+                await self._queue.put(record)
+                replayed += 1
+        os.remove(replay_path)
+        self._accepted += replayed
+        self._rejected += rejected
+        logger.info(f"Re-queued {replayed} spooled ingest records")
+        if rejected:
+            logger.warning(f"Moved {rejected} unreadable spool lines to {self.spool_path}.rejected")
+
+    def stats(self) -> dict:
+        """Queue depth and lifetime counters."""
+        return {
+            'depth': self._queue.qsize() if self._queue else 0,
+            'maxsize': self.maxsize,
+            'workers': len(self._workers),
+            'accepted': self._accepted,
+            'written': self._written,
+            'rejected': self._rejected,
+            'retries': self._retries,
+            'spooled': self._spooled,
+            'turned_away': self._turned_away
+        }
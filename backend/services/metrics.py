@@ -0,0 +1,225 @@
+import os
+import re
+import time
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Iterable, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Queries slower than this (milliseconds) are logged with their fingerprint; 0 disables the log
+SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 0))
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Latency histogram with labels, rendered with cumulative buckets like prometheus_client."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[tuple, list] = {}  # labels -> [per-bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a with-block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def timed(self, **labels) -> Callable:
+        """Decorator observing the duration of every call."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(time.perf_counter() - started, **labels)
+            return wrapper
+        return decorator
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Metrics exposed at /metrics.
+
+    Besides metrics it owns, collectors (callables returning Prometheus text
+    lines) export state kept elsewhere, such as pool and cache statistics,
+    at scrape time.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]):
+        self._collectors.append(collector)
+
+    def render(self, extra: Iterable[str] = ()) -> str:
+        """Text exposition of every metric and collector, followed by any extra lines."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+        lines.extend(extra)
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status")
+))
+DB_QUERY_SECONDS = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL statement execution time by statement fingerprint.", ("statement", "driver")
+))
+DB_SLOW_QUERIES = registry.register(Counter(
+    "db_slow_queries_total", "Statements slower than DB_SLOW_QUERY_MS.", ("statement",)
+))
+TRANSFORM_SECONDS = registry.register(Histogram(
+    "verification_transform_seconds", "Time to build response models from database rows.", ("kind",),
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+))
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUES_LIST = re.compile(r"\bVALUES\s*\(.*?\)(?:\s*,\s*\(.*?\))*(?=\s*(?:ON\b|RETURNING\b|;|$))", re.I | re.S)
+_FROM = re.compile(r"\sFROM\s", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _elide_select_list(query: str) -> str:
+    """Replace the top-level select list with ..., leaving scalar subqueries in it alone."""
+    if not query[:7].upper() == "SELECT ":
+        return query
+    for match in _FROM.finditer(query):
+        prefix = query[:match.start()]
+        if prefix.count("(") == prefix.count(")"):
+            return "SELECT ..." + query[match.start():]
+    return query
+
+
+# Statements up to this many characters have their fingerprints cached. Longer ones,
+# such as execute_values batches with every row inlined, are nearly always unique
+# and would only fill the cache with dead keys.
+FINGERPRINT_CACHE_MAX_CHARS = 4096
+
+
+def statement_fingerprint(query) -> str:
+    """
+    Stable, low-cardinality label for a SQL statement: comments dropped,
+    whitespace collapsed, literals replaced with ?, multi-row VALUES lists and
+    the top-level select list elided. Parameter placeholders (%s) are kept.
+    """
+    if isinstance(query, bytes):
+        query = query.decode("utf-8", "replace")
+    query = str(query)
+    if len(query) > FINGERPRINT_CACHE_MAX_CHARS:
+        return _fingerprint(query)
+    return _cached_fingerprint(query)
+
+
+def _fingerprint(query: str) -> str:
+    query = _COMMENT.sub(" ", query)
+    query = _WHITESPACE.sub(" ", query).strip()
+    query = _VALUES_LIST.sub("VALUES ...", query)
+    query = _LITERAL.sub("?", query)
+    return _elide_select_list(query)[:200]
+
+
+_cached_fingerprint = lru_cache(maxsize=1024)(_fingerprint)
+
+
+def record_query(query, seconds: float, driver: str = "psycopg2"):
+    """Record one statement's execution time, logging it if it crossed SLOW_QUERY_MS."""
+    fingerprint = statement_fingerprint(query)
+    DB_QUERY_SECONDS.observe(seconds, statement=fingerprint, driver=driver)
+    if SLOW_QUERY_MS and seconds * 1000 >= SLOW_QUERY_MS:
+        DB_SLOW_QUERIES.inc(statement=fingerprint)
+        logger.warning(f"Slow query ({seconds * 1000:.1f} ms, {driver}): {fingerprint}")
@@ -0,0 +1,256 @@
+import os
+import re
+import sys
+import time
+import hashlib
+from typing import Dict, List, NamedTuple
+from backend.services.db import get_db_connection, get_db_cursor, init_db_pool, close_db_pool
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Versioned migrations, named NNN_description.sql and applied in version order
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sql")
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# First line of a migration that must run outside a transaction, one statement at a
+# time (CREATE INDEX CONCURRENTLY). Statements in such files are split on a ';' that
+# ends a line, so they cannot contain function bodies.
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+# Whether app startup applies pending migrations. Deployments running several workers
+# can turn this off and run `python -m backend.services.migrations` once per release
+# instead; startup then only checks that the schema is current.
+MIGRATE_ON_STARTUP = os.getenv('DB_MIGRATE_ON_STARTUP', 'true').lower() in ('1', 'true', 'yes')
+
+# Advisory lock key serializing migrations between app instances starting together
+MIGRATION_LOCK_ID = 4716502301
+# Seconds between attempts to take the lock while another instance migrates
+MIGRATION_LOCK_POLL_INTERVAL = 0.5
+
+SCHEMA_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version integer PRIMARY KEY,
+        name text NOT NULL,
+        checksum text NOT NULL,
+        applied_at timestamptz NOT NULL DEFAULT now(),
+        execution_ms double precision NOT NULL
+    );
+"""
+
+APPLIED_MIGRATIONS_QUERY = "SELECT version, name, checksum, applied_at FROM schema_migrations ORDER BY version;"
+
+RECORD_MIGRATION_QUERY = """
+    INSERT INTO schema_migrations (version, name, checksum, execution_ms)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (version) DO UPDATE SET
+        name = EXCLUDED.name,
+        checksum = EXCLUDED.checksum,
+        applied_at = now(),
+        execution_ms = EXCLUDED.execution_ms;
+"""
+
+# Left behind when a CREATE INDEX CONCURRENTLY fails; IF NOT EXISTS would then skip it forever
+INVALID_INDEXES_QUERY = """
+    SELECT c.relname as name
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE NOT i.indisvalid AND n.nspname = current_schema();
+"""
+
+
+class SchemaOutOfDate(Exception):
+    """Raised when migrations the app relies on have not been applied."""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: str
+    checksum: str
+    transactional: bool
+
+    @property
+    def statements(self) -> List[str]:
+        """The migration's statements, for running outside a transaction."""
+        statements = [s.strip() for s in re.split(r";[ \t]*$", self.sql, flags=re.MULTILINE)]
+        return [s for s in statements if any(
+            line.strip() and not line.strip().startswith("--") for line in s.splitlines()
+        )]
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Read every migration file in a directory, in version order.
+
+    Raises:
+        ValueError: If two files share a version number
+    """
+    migrations: Dict[int, Migration] = {}
+    for file_name in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE_PATTERN.match(file_name)
+        if not match:
+            continue
+        with open(os.path.join(directory, file_name)) as f:
+            sql = f.read()
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version {version}: {migrations[version].name} and {match.group(2)}")
+        migrations[version] = Migration(
+            version=version,
+            name=match.group(2),
+            sql=sql,
+            checksum=hashlib.sha256(sql.encode()).hexdigest(),
+            transactional=not sql.startswith(NO_TRANSACTION_MARKER)
+        )
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def migration_status(directory: str = MIGRATIONS_DIR) -> List[dict]:
+    """Each migration with its state: applied, pending, or changed (edited since it was applied)."""
+    with get_db_connection() as conn:
+        with get_db_cursor(conn) as cur:
+            cur.execute(SCHEMA_MIGRATIONS_TABLE)
+            cur.execute(APPLIED_MIGRATIONS_QUERY)
+            applied = {row['version']: row for row in cur.fetchall()}
+
+    status = []
+    for migration in load_migrations(directory):
+        row = applied.get(migration.version)
+        if row is None:
+            state = "pending"
+        elif row['checksum'] != migration.checksum:
+            state = "changed"
+        else:
+            state = "applied"
+        status.append({
+            'version': migration.version,
+            'name': migration.name,
+            'state': state,
+            'applied_at': row['applied_at'] if row else None
+        })
+    return status
+
+
+def check_schema(directory: str = MIGRATIONS_DIR):
+    """
+    Make sure every migration has been applied as it stands on disk.
+
+    Raises:
+        SchemaOutOfDate: If any migration is pending or changed since it was applied
+    """
+    outdated = [
+        f"{m['version']:03d}_{m['name']} ({m['state']})"
+        for m in migration_status(directory) if m['state'] != "applied"
+    ]
+    if outdated:
+        raise SchemaOutOfDate(f"Database schema is out of date, run python -m backend.services.migrations: {', '.join(outdated)}")
+
+
+def migrate(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Apply pending migrations, each in its own transaction with its schema_migrations row.
+
+    Migrations are idempotent DDL (CREATE OR REPLACE, IF NOT EXISTS), so one
+    edited after it was applied, such as a trigger function fix, is applied
+    again rather than rejected. Concurrent callers wait for an advisory lock
+    and then find nothing left to do.
+
+    Returns:
+        The migrations applied by this call
+    """
+    migrations = load_migrations(directory)
+    applied_now = []
+
+    with get_db_connection() as conn:
+        with get_db_cursor(conn) as cur:
+            _lock(conn, cur)
+            try:
+                cur.execute(SCHEMA_MIGRATIONS_TABLE)
+                cur.execute("SELECT version, checksum FROM schema_migrations;")
+                applied = {row['version']: row['checksum'] for row in cur.fetchall()}
+                conn.commit()
+
+                for migration in migrations:
+                    checksum = applied.get(migration.version)
+                    if checksum == migration.checksum:
+                        continue
+                    if checksum is not None:
+                        logger.warning(f"Migration {migration.version:03d}_{migration.name} changed since it was applied; applying it again")
+                    _apply(conn, cur, migration)
+                    applied_now.append(migration)
+            finally:
+                conn.rollback()
+                cur.execute("SELECT pg_advisory_unlock(%s);", (MIGRATION_LOCK_ID,))
+
+    if not applied_now:
+        logger.info(f"Schema is up to date ({len(migrations)} migrations)")
+    return applied_now
+
+
+def _lock(conn, cur):
+    """
+    Take the migration lock, polling outside any transaction. A session blocked in
+    pg_advisory_lock() would hold a snapshot that the other instance's
+    CREATE INDEX CONCURRENTLY waits for, deadlocking the two.
+    """
+    conn.autocommit = True
+    try:
+        waiting = False
+        while True:
+            cur.execute("SELECT pg_try_advisory_lock(%s) as locked;", (MIGRATION_LOCK_ID,))
+            if cur.fetchone()['locked']:
+                return
+            if not waiting:
+                logger.info("Waiting for another instance to finish migrating")
+                waiting = True
+            time.sleep(MIGRATION_LOCK_POLL_INTERVAL)
+    finally:
+        conn.autocommit = False
+
+
+def _apply(conn, cur, migration: Migration):
+    started = time.perf_counter()
+    if migration.transactional:
+        cur.execute(migration.sql)
+    else:
+        conn.autocommit = True
+        try:
+            _drop_invalid_indexes(cur)
+            for statement in migration.statements:
+                cur.execute(statement)
+        finally:
+            conn.autocommit = False
+
+    execution_ms = (time.perf_counter() - started) * 1000
+    cur.execute(RECORD_MIGRATION_QUERY, (migration.version, migration.name, migration.checksum, execution_ms))
+    conn.commit()
+    logger.info(f"Applied migration {migration.version:03d}_{migration.name} in {execution_ms:.0f} ms")
+
+
+def _drop_invalid_indexes(cur):
+    """Drop indexes left invalid by an interrupted concurrent build, so it can run again."""
+    cur.execute(INVALID_INDEXES_QUERY)
+    for row in cur.fetchall():
+        logger.warning(f"Dropping invalid index {row['name']} left by an interrupted build")
+        cur.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{row["name"]}";')
+
+
+def main():
+    """Apply pending migrations as a deploy step, before starting the app."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    init_db_pool()
+    try:
+        applied = migrate()
+        logger.info(f"Applied {len(applied)} migrations")
+    finally:
+        close_db_pool()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,14 @@
+from typing import Any
+import orjson
+from pydantic import BaseModel
+
+def _default(obj: Any):
+    # Models built by the store are trusted and plain (no aliases or custom serializers),
+    # so their field dict is already the wire shape
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """Serialize models, lists and dicts of models straight to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default)
@@ -0,0 +1,224 @@
+import asyncio
+import inspect
+import threading
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from backend.services.cancellation import CancelScope, QueryCancelled, current_cancel_scope
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight synchronous load, shared by every thread asking for the same key."""
+
+    __slots__ = ('done', 'value', 'error', 'waiters', 'scope')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+        # The load's own queries: it runs for every waiter, not just the caller that started it
+        self.scope = CancelScope()
+
+
+class _AsyncCall:
+    """One in-flight async load; cancelled only when every caller waiting on it has gone."""
+
+    __slots__ = ('task', 'waiters', 'scope')
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+        self.scope = CancelScope()
+
+
+class _Share:
+    """
+    One caller's claim on a load, registered in the caller's cancel scope.
+    Cancelling it withdraws the claim; see SingleFlight._withdraw.
+    """
+
+    __slots__ = ('flight', 'calls', 'key', 'call', 'scope', 'withdrawn')
+
+    def __init__(self, flight: 'SingleFlight', calls: dict, key: Hashable, call, scope: Optional[CancelScope]):
+        self.flight = flight
+        self.calls = calls
+        self.key = key
+        self.call = call
+        self.scope = scope
+        self.withdrawn = False
+
+    def cancel(self):
+        self.flight._withdraw(self)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical reads into one execution.
+
+    The first caller for a key runs the load; callers arriving while it is in
+    flight wait for and share its result (or exception) instead of running
+    their own. Nothing is kept once the load finishes, so this never serves a
+    result older than the request that asked for it, except that a caller may
+    join a load that started just before a write. forget() closes that window:
+    after a change notification, new callers start a fresh load.
+
+    A caller whose request is cancelled (its client disconnected) withdraws
+    from the load; the load's queries are cancelled only once every caller
+    waiting on it has withdrawn.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, _AsyncCall] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs), or wait for the identical call already running in another thread."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+            call.waiters += 1
+
+        share = self._join(self._calls, key, call)
+        try:
+            if not leader:
+                call.done.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.value
+
+            token = current_cancel_scope.set(call.scope)
+            try:
+                call.value = func(*args, **kwargs)
+                return call.value
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                current_cancel_scope.reset(token)
+                with self._lock:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                call.done.set()
+        finally:
+            self._leave(share)
+
+    async def ado(self, key: Hashable, func: Callable[..., Awaitable], *args, **kwargs) -> Any:
+        """Async version of do; the load runs as a task so one caller disconnecting does not fail the others."""
+        with self._lock:
+            call = self._async_calls.get(key)
+            if call is None or call.task.done():
+                call = self._async_calls[key] = _AsyncCall()
+                call.task = asyncio.ensure_future(_run_in_scope(call.scope, func, *args, **kwargs))
+                call.task.add_done_callback(lambda task, call=call: self._async_done(key, call))
+                self._leaders += 1
+            else:
+                self._shared += 1
+            call.waiters += 1
+
+        share = self._join(self._async_calls, key, call)
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            # Stop the load once nobody is left to receive it
+            if self._withdraw(share) and not call.task.done():
+                call.task.cancel()
+            raise
+        finally:
+            self._leave(share)
+
+    def _async_done(self, key: Hashable, call: _AsyncCall):
+        with self._lock:
+            if self._async_calls.get(key) is call:
+                del self._async_calls[key]
+
+    def _join(self, calls: dict, key: Hashable, call) -> _Share:
+        """Register the caller's share of call in the caller's cancel scope, if it runs in one."""
+        share = _Share(self, calls, key, call, current_cancel_scope.get())
+        if share.scope is not None:
+            try:
+                share.scope.add(share)
+            except QueryCancelled:
+                # The caller's client is already gone
+                self._withdraw(share)
+        return share
+
+    def _leave(self, share: _Share):
+        if share.scope is not None:
+            share.scope.discard(share)
+
+    def _withdraw(self, share: _Share) -> bool:
+        """
+        Withdraw a caller's claim on its load. The last claim withdrawn forgets
+        the load, so later callers start their own, and cancels its queries.
+
+        Returns:
+            Whether this was the last claim
+        """
+        call = share.call
+        with self._lock:
+            if share.withdrawn:
+                return False
+            share.withdrawn = True
+            call.waiters -= 1
+            if call.waiters:
+                return False
+            if share.calls.get(share.key) is call:
+                del share.calls[share.key]
+        call.scope.cancel()
+        return True
+
+    def forget(self):
+        """Make callers arriving from now on start a fresh load; callers already waiting still share theirs."""
+        with self._lock:
+            self._calls.clear()
+            self._async_calls.clear()
+
+    def stats(self) -> dict:
+        """Loads executed and calls that shared another caller's load."""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls) + len(self._async_calls),
+                'leaders': self._leaders,
+                'shared': self._shared
+            }
+
+
+async def _run_in_scope(scope: CancelScope, func: Callable[..., Awaitable], *args, **kwargs) -> Any:
+    # Tasks run in a copy of their creator's context, so this only affects the load
+    current_cancel_scope.set(scope)
+    return await func(*args, **kwargs)
+
+
+def coalesced(method: Callable) -> Callable:
+    """
+    Route a store read through the instance's SingleFlight (self.flights), keyed
+    on the method name and its arguments. Works for both sync methods and async
+    (aX) methods. Pass arguments the same way at every call site: f(50) and
+    f(limit=50) are different keys (still correct, just not shared).
+    """
+    name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            key = (name, args, frozenset(kwargs.items()))
+            return await self.flights.ado(key, method, self, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, frozenset(kwargs.items()))
+        return self.flights.do(key, method, self, *args, **kwargs)
+    return wrapper
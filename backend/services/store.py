@@ -1,36 +1,367 @@
 import os
-from typing import List, Dict, Optional
-from datetime import datetime
+import re
+import json
+import time
+import base64
+from functools import lru_cache
+from typing import Any, List, Dict, Iterator, Optional, Tuple, Type, TypeVar
+from datetime import datetime, timezone
+from pydantic import BaseModel
+from psycopg2 import Error as DatabaseError
+from psycopg2.extras import Json, execute_values
 from backend.schemas.verification import (
-    VerificationDetail, UserInfo, StepsStatus, DeviceInfo, 
+    VerificationIngest, BulkIngestFailure, VerificationDetail, VerificationSession, UserInfo, StepsStatus, DeviceInfo, 
     NetworkDetails, DocumentImages, DocumentDetails, LivenessInfo, 
-    FaceMatchInfo, PrivacyInfo, VerificationEvent, VerificationWebhook
+    FaceMatchInfo, PrivacyInfo, VerificationEvent, VerificationWebhook,
+    VerificationStats, DailyCount
 )
-from backend.services.db import get_db_connection, get_db_cursor, init_db_pool
+from backend.services.db import get_db_connection, get_db_cursor, get_db_server_cursor, replica_router, REPLICA_CONFIG
+from backend.services.async_db import get_async_db_connection, get_async_db_cursor
+from backend.services.cache import LRUCache
+from backend.services.singleflight import SingleFlight, coalesced
+from backend.services.metrics import TRANSFORM_SECONDS
+from backend.services.files import FileStore, StoredFile
+from backend.services.useragent import classify_user_agent
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns selected by every sessions/documents join
+SESSION_DOCUMENT_COLUMNS = """
+    s.id,
+    s.candidate_name,
+    s.candidate_email,
+    s.candidate_phone,
+    s.status,
+    s.requested_docs,
+    s.created_at,
+    s.updated_at,
+    d.id as doc_id,
+    d.doc_type,
+    d.doc_data,
+    d.photo_file,
+    d.pdf_file,
+    d.fetched_at,
+    d.fetched_ip
+"""
+
+# Audit events that count as the document having been fetched. Keep in step with
+# sync_verification_summary() in backend/sql/002_verification_summary.sql.
+DOCUMENT_FETCH_EVENTS = ('DOCUMENT_FETCHED', 'STATUS_CHECKED')
+
+# Columns needed to build a VerificationSession summary. verification_summary is
+# kept up to date by triggers, so the list view never joins or parses doc_data.
+SUMMARY_COLUMNS = """
+    v.id,
+    v.candidate_name,
+    v.candidate_email,
+    v.candidate_phone,
+    v.status,
+    v.created_at,
+    v.doc_type,
+    v.doc_name,
+    v.country,
+    v.issuer_name,
+    v.photo_file,
+    v.has_document_fetch
+"""
+
+ALL_SESSIONS_QUERY = f"""
+    SELECT {SESSION_DOCUMENT_COLUMNS}
+    FROM sessions s
+    LEFT JOIN documents d ON s.id = d.session_id
+    ORDER BY s.created_at DESC;
+"""
+
+# Carries the session's version (see SESSION_VERSION_QUERY) from the same snapshot,
+# so a cached detail knows which version it shows
+SESSION_BY_ID_QUERY = f"""
+    SELECT {SESSION_DOCUMENT_COLUMNS},
+        coalesce(sv.version, 0) as version
+    FROM sessions s
+    LEFT JOIN documents d ON s.id = d.session_id
+    LEFT JOIN session_versions sv ON sv.session_id = s.id
+    WHERE s.id = %s
+    LIMIT 1;
+"""
+
+AUDIT_EVENTS_QUERY = """
+    SELECT id, session_id, event, details, ip_address, user_agent, created_at
+    FROM audit_log
+    WHERE session_id = ANY(%s)
+    ORDER BY session_id, created_at ASC;
+"""
+
+# Cheap change marker for conditional GETs: bumped in the same transaction as any
+# write to sessions, documents or audit_log (backend/sql/008_change_counter.sql)
+LIST_VERSION_QUERY = """
+    SELECT sum(changes) as changes FROM verification_change_counter;
+"""
+
+# Per-session counterpart, from the session_versions counter bumped by every write
+# to the session, its documents or its audit trail (backend/sql/009_session_versions.sql)
+SESSION_VERSION_QUERY = """
+    SELECT coalesce(v.version, 0) as version
+    FROM sessions s
+    LEFT JOIN session_versions v ON v.session_id = s.id
+    WHERE s.id = %s;
+"""
+
+# Dashboard counts in one pass over sessions. Each grouping set yields
+# one breakdown; GROUPING() tells them apart (1 bits mark the columns rolled up).
+STATS_QUERY = """
+    SELECT
+        GROUPING(
+            COALESCE(upper(s.status), 'PENDING'),
+            COALESCE(upper(v.doc_type), 'UNKNOWN'),
+            (s.created_at AT TIME ZONE 'UTC')::date
+        ) as grouping,
+        COALESCE(upper(s.status), 'PENDING') as status,
+        COALESCE(upper(v.doc_type), 'UNKNOWN') as doc_type,
+        (s.created_at AT TIME ZONE 'UTC')::date as day,
+        count(*) as count
+    FROM sessions s
+    -- verification_summary only has sessions with a fetched document; count the rest too
+    LEFT JOIN verification_summary v ON v.id = s.id
+    WHERE {where}
+    GROUP BY GROUPING SETS (
+        (COALESCE(upper(s.status), 'PENDING')),
+        (COALESCE(upper(v.doc_type), 'UNKNOWN')),
+        ((s.created_at AT TIME ZONE 'UTC')::date),
+        ()
+    );
+"""
+STATS_BY_STATUS, STATS_BY_DOC_TYPE, STATS_BY_DAY, STATS_TOTAL = 0b011, 0b101, 0b110, 0b111
+
+# Bulk ingest writes; each is run once per batch with execute_values.
+# Re-ingesting a session updates the session row and appends an audit event;
+# its document is only created the first time.
+INGEST_SESSIONS_QUERY = """
+    INSERT INTO sessions (id, candidate_name, candidate_email, candidate_phone,
+                          status, requested_docs, created_at, updated_at)
+    VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        candidate_name = EXCLUDED.candidate_name,
+        candidate_email = EXCLUDED.candidate_email,
+        candidate_phone = EXCLUDED.candidate_phone,
+        status = EXCLUDED.status,
+        requested_docs = EXCLUDED.requested_docs,
+        updated_at = EXCLUDED.updated_at
+    RETURNING id, (xmax = 0) as inserted;
+"""
+
+INGEST_DOCUMENTS_QUERY = """
+    INSERT INTO documents (session_id, doc_type, doc_data)
+    VALUES %s;
+"""
+
+INGEST_AUDIT_EVENTS_QUERY = """
+    INSERT INTO audit_log (session_id, event, details, created_at)
+    VALUES %s;
+"""
+
+INGEST_EVENT = "SESSION_INGESTED"
+
+# Candidate sources for search, one per indexed expression in
+# backend/sql/005_search_indexes.sql (the expressions must match exactly). Each
+# yields (id, rank): 3 for an exact match, 2 plus ts_rank for a word or number
+# prefix, 1 for a number suffix, and trigram word similarity (0-1) for a
+# substring match. Every source is capped at %(candidates)s rows, so a very
+# common name costs the same as a rare one.
+SEARCH_NAME_SOURCES = """
+    (SELECT s.id, CASE WHEN lower(s.candidate_name) = %(text)s THEN 3 ELSE 2 END
+            + ts_rank(to_tsvector('simple', coalesce(s.candidate_name, '')), q)
+     FROM sessions s, to_tsquery('simple', %(tsquery)s) q
+     WHERE to_tsvector('simple', coalesce(s.candidate_name, '')) @@ q
+     LIMIT %(candidates)s)
+    UNION ALL
+    (SELECT d.session_id, CASE WHEN lower(d.doc_data->>'name') = %(text)s THEN 3 ELSE 2 END
+            + ts_rank(to_tsvector('simple', coalesce(d.doc_data->>'name', '')), q)
+     FROM documents d, to_tsquery('simple', %(tsquery)s) q
+     WHERE to_tsvector('simple', coalesce(d.doc_data->>'name', '')) @@ q
+     LIMIT %(candidates)s)
+"""
+
+SEARCH_EMAIL_SOURCE = """
+    (SELECT s.id, CASE WHEN lower(s.candidate_email) = %(text)s THEN 3 ELSE 2 END
+     FROM sessions s
+     WHERE lower(s.candidate_email) LIKE %(prefix)s
+     LIMIT %(candidates)s)
+"""
+
+SEARCH_NUMBER_SOURCES = """
+    (SELECT s.id, CASE WHEN search_digits(s.candidate_phone) = %(digits)s THEN 3 ELSE 2 END
+     FROM sessions s
+     WHERE search_digits(s.candidate_phone) LIKE %(digits_prefix)s
+     LIMIT %(candidates)s)
+    UNION ALL
+    (SELECT s.id, 1
+     FROM sessions s
+     WHERE reverse(search_digits(s.candidate_phone)) LIKE %(digits_suffix)s
+     LIMIT %(candidates)s)
+    UNION ALL
+    (SELECT d.session_id, CASE WHEN search_digits(d.doc_data->>'aadhaar_number') = %(digits)s THEN 3 ELSE 2 END
+     FROM documents d
+     WHERE search_digits(d.doc_data->>'aadhaar_number') LIKE %(digits_prefix)s
+     LIMIT %(candidates)s)
+    UNION ALL
+    (SELECT d.session_id, 1
+     FROM documents d
+     WHERE reverse(search_digits(d.doc_data->>'aadhaar_number')) LIKE %(digits_suffix)s
+     LIMIT %(candidates)s)
+"""
+
+# Only used where pg_trgm is installed; the trigram indexes cover these expressions
+SESSION_SEARCH_TEXT = """lower(coalesce(s.candidate_name, '') || ' ' || coalesce(s.candidate_email, '') || ' '
+        || coalesce(search_digits(s.candidate_phone), ''))"""
+DOCUMENT_SEARCH_TEXT = """lower(coalesce(d.doc_data->>'name', '') || ' '
+        || coalesce(search_digits(d.doc_data->>'aadhaar_number'), ''))"""
+
+SEARCH_TRIGRAM_SOURCES = f"""
+    (SELECT s.id, word_similarity(%(needle)s, {SESSION_SEARCH_TEXT})
+     FROM sessions s
+     WHERE {SESSION_SEARCH_TEXT} LIKE %(contains)s
+     LIMIT %(candidates)s)
+    UNION ALL
+    (SELECT d.session_id, word_similarity(%(needle)s, {DOCUMENT_SEARCH_TEXT})
+     FROM documents d
+     WHERE {DOCUMENT_SEARCH_TEXT} LIKE %(contains)s
+     LIMIT %(candidates)s)
+"""
+
+# Best rank per session, returned as list-view summaries
+SEARCH_QUERY = f"""
+    WITH matches (id, rank) AS (
+        {{sources}}
+    )
+    SELECT {SUMMARY_COLUMNS}, m.rank
+    FROM (SELECT id, max(rank) as rank FROM matches GROUP BY id) m
+    JOIN verification_summary v ON v.id = m.id
+    ORDER BY m.rank DESC, v.created_at DESC, v.id DESC
+    LIMIT %(limit)s;
+"""
+
+SEARCH_TRIGRAM_QUERY = """
+    SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') as available;
+"""
+
+# A query made only of these is looked up as a phone or document number
+SEARCH_NUMBER_PATTERN = re.compile(r"[\d\s+()\-]+")
+
+# Page size bounds for keyset-paginated listing
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Rows fetched per round trip when streaming exports
+EXPORT_BATCH_SIZE = 500
+
+def encode_cursor(created_at: datetime, session_id: str) -> str:
+    """Encode the (created_at, id) keyset position of a row as an opaque token."""
+    raw = json.dumps([created_at.isoformat(), session_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a token produced by encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(session_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _like_escape(value: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+@lru_cache(maxsize=None)
+def _field_defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+def _construct(model: Type[ModelT], /, **fields) -> ModelT:
+    """
+    Build a model from trusted values without validation.
+    
+    Like model_construct, but sets the field dict directly instead of walking
+    the fields in Python, which makes it cheaper than validating __init__.
+    Omitted optional fields get their defaults.
+    """
+    if len(fields) < len(model.model_fields):
+        fields = {**_field_defaults(model), **fields}
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+# Detail cache bounds; the TTL is a fallback for missed change notifications
+DETAIL_CACHE_SIZE = int(os.getenv('DETAIL_CACHE_SIZE', 1024))
+DETAIL_CACHE_TTL = float(os.getenv('DETAIL_CACHE_TTL', 300))
+
+# Records written per bulk ingest transaction
+INGEST_BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', 1000))
+
+# Search result bounds, and the rows each search index may contribute
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+SEARCH_CANDIDATE_LIMIT = int(os.getenv('SEARCH_CANDIDATE_LIMIT', 250))
+# Digits needed before a numeric query is searched (fewer match most of the table)
+SEARCH_MIN_DIGITS = 3
+
+# Stats are recomputed at most once per window per TTL
+STATS_CACHE_SIZE = int(os.getenv('STATS_CACHE_SIZE', 64))
+STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', 30))
+
+# Postgres channel the notify triggers publish row changes on
+CHANGE_CHANNEL = "verification_changed"
+
+# Root directory for uploaded files and their index
+STORAGE_PATH = os.getenv('STORAGE_PATH', 'backend/storage')
+
 class VerificationStore:
-    def __init__(self):
-        """Initialize the PostgreSQL-backed verification store."""
-        self.storage_path = "backend/storage"
+    def __init__(self, storage_path: str = STORAGE_PATH):
+        """
+        Initialize the PostgreSQL-backed verification store.
+        
+        Reads go through the shared connection pool, which the application
+        lifespan (or a script) initializes with init_db_pool() before use.
+        """
+        self.storage_path = storage_path
         os.makedirs(self.storage_path, exist_ok=True)
+        self.files = FileStore(self.storage_path)
         
-        # Initialize database connection pool
-        try:
-            init_db_pool()
-            logger.info("Database connection pool initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-            raise
+        # Transformed VerificationDetail objects keyed by session id, invalidated via LISTEN/NOTIFY
+        self.detail_cache = LRUCache(maxsize=DETAIL_CACHE_SIZE, ttl=DETAIL_CACHE_TTL)
+        
+        # Dashboard statistics keyed by date window, expired by TTL only
+        self.stats_cache = LRUCache(maxsize=STATS_CACHE_SIZE, ttl=STATS_CACHE_TTL)
+        
+        # Identical reads running concurrently share one execution; forgotten on every change notification
+        self.flights = SingleFlight()
+        
+        # Sessions changed within the replica lag bound; reads of them stay on the primary
+        self.recent_writes = LRUCache(maxsize=DETAIL_CACHE_SIZE, ttl=REPLICA_CONFIG['max_lag'])
+        self._primary_reads_until = 0.0
+        
+        # Whether pg_trgm substring search is available; checked on first search
+        self.search_trigram: Optional[bool] = None
 
+    @TRANSFORM_SECONDS.timed(kind="detail")
     def _transform_multi_table_data_to_verification(self, session_data: dict, 
                                                      document_data: dict,
                                                      audit_events: list) -> VerificationDetail:
         """
         Transform data from all three tables (sessions, documents, audit_log) into VerificationDetail schema.
         
+        Rows come from our own tables, so models are built with _construct and skip
+        pydantic validation; routes serialize them without re-validating.
+        
         Args:
             session_data: Data from the sessions table
             document_data: Data from the documents table
@@ -44,7 +375,7 @@ class VerificationStore:
         
         # Extract user information - prioritize doc_data, fallback to session data
         name = doc_data.get('name', session_data.get('candidate_name', 'Unknown'))
-        email = session_data.get('candidate_email', f"{candidate_name}@example.com")
+        email = session_data.get('candidate_email')
         phone = session_data.get('candidate_phone')
         dob = doc_data.get('dob', '1990-01-01')
         gender = doc_data.get('gender', 'Unknown')
@@ -75,14 +406,8 @@ class VerificationStore:
         session_status = session_data.get('status', 'pending').upper()
         
         # Determine verification steps status based on session status and audit events
-        has_document_fetch = any(e['event'] in ['DOCUMENT_FETCHED', 'STATUS_CHECKED'] for e in audit_events)
-        
-        steps_status = StepsStatus(
-            document="APPROVED" if has_document_fetch and session_status == "VERIFIED" else "PENDING",
-            selfie="APPROVED" if photo_file else "PENDING",
-            database="APPROVED" if session_status == "VERIFIED" else "PENDING",
-            risk="APPROVED" if session_status == "VERIFIED" else "PENDING"
-        )
+        has_document_fetch = any(e['event'] in DOCUMENT_FETCH_EVENTS for e in audit_events)
+        steps_status = self._derive_steps(session_status, has_document_fetch, photo_file)
         
         # Map audit log to events
         events = []
@@ -111,7 +436,8 @@ class VerificationStore:
                 description = f"Event: {audit['event']}"
                 title = audit['event'].replace('_', ' ').title()
             
-            events.append(VerificationEvent(
+            events.append(_construct(
+                VerificationEvent,
                 id=f"evt_{session_id}_{audit['id']}",
                 type=event_type,
                 title=title,
@@ -129,30 +455,14 @@ class VerificationStore:
         first_event = audit_events[0] if audit_events else {}
         ip_address = first_event.get('ip_address', document_data.get('fetched_ip', 'Unknown'))
         user_agent = first_event.get('user_agent', 'Unknown')
-        
-        # Parse user agent to extract device info (simplified)
-        device_type = "Mobile" if "Mobile" in user_agent else "Desktop"
-        os_info = "Unknown"
-        browser_info = "Unknown"
-        
-        if "Macintosh" in user_agent:
-            os_info = "macOS"
-        elif "Windows" in user_agent:
-            os_info = "Windows"
-        elif "Linux" in user_agent:
-            os_info = "Linux"
-            
-        if "Chrome" in user_agent:
-            browser_info = "Chrome"
-        elif "Safari" in user_agent and "Chrome" not in user_agent:
-            browser_info = "Safari"
-        elif "Firefox" in user_agent:
-            browser_info = "Firefox"
+        ua = classify_user_agent(user_agent)
         
         # Create verification detail object
-        verification = VerificationDetail(
+        verification = _construct(
+            VerificationDetail,
             id=f"#{session_id}",
-            user=UserInfo(
+            user=_construct(
+                UserInfo,
                 name=name,
                 email=email if email else f"{session_id}@example.com",
                 country=country,
@@ -164,21 +474,28 @@ class VerificationStore:
             createdAt=session_data['created_at'].isoformat() if session_data.get('created_at') else None,
             vendor=issuer_name,
             steps=steps_status,
-            device=DeviceInfo(
-                type=device_type,
-                os=os_info,
-                browser=browser_info,
+            device=_construct(
+                DeviceInfo,
+                type=ua.device_type,
+                os=ua.os,
+                browser=ua.browser,
+                osVersion=ua.os_version,
+                browserVersion=ua.browser_version,
+                brand=ua.brand,
+                model=ua.model,
                 ip=ip_address,
                 location=f"{city}, {state}, {country}"
             ),
-            network=NetworkDetails(
+            network=_construct(
+                NetworkDetails,
                 ip=ip_address,
                 location=f"{city}, {state}, {country}",
                 city=city,
                 country=country,
                 isp="Unknown",
                 timezone="Asia/Kolkata",
-                privacy=PrivacyInfo(
+                privacy=_construct(
+                    PrivacyInfo,
                     status="CLEAN",
                     vpn=False,
                     tor=False,
@@ -189,10 +506,12 @@ class VerificationStore:
             ),
             devices=[],
             warnings=[],
-            documents=DocumentImages(
+            documents=_construct(
+                DocumentImages,
                 front="https://placehold.co/600x400/e2e8f0/475569?text=Aadhaar+Front",
                 back="https://placehold.co/600x400/e2e8f0/475569?text=Aadhaar+Back",
-                details=DocumentDetails(
+                details=_construct(
+                    DocumentDetails,
                     firstName=name.split()[0] if name else "Unknown",
                     lastName=" ".join(name.split()[1:]) if len(name.split()) > 1 else "",
                     dob=dob,
@@ -200,12 +519,14 @@ class VerificationStore:
                     expiryDate="N/A"  # Aadhaar doesn't have expiry
                 )
             ),
-            liveness=LivenessInfo(
+            liveness=_construct(
+                LivenessInfo,
                 score=98 if photo_file else 0,
                 status="PASS" if photo_file else "PENDING",
                 selfieUrl=photo_url
             ),
-            faceMatch=FaceMatchInfo(
+            faceMatch=_construct(
+                FaceMatchInfo,
                 score=95 if photo_file else 0,
                 status="MATCH" if photo_file else "PENDING"
             ),
@@ -214,191 +535,896 @@ class VerificationStore:
         
         return verification
 
-    def add_verification(self, verification: VerificationDetail):
+    @staticmethod
+    def _derive_steps(session_status: str, has_document_fetch: bool, photo_file: Optional[str]) -> StepsStatus:
+        """Derive the per-step status shown in the dashboard from the session state."""
+        return _construct(
+            StepsStatus,
+            document="APPROVED" if has_document_fetch and session_status == "VERIFIED" else "PENDING",
+            selfie="APPROVED" if photo_file else "PENDING",
+            database="APPROVED" if session_status == "VERIFIED" else "PENDING",
+            risk="APPROVED" if session_status == "VERIFIED" else "PENDING"
+        )
+
+    @TRANSFORM_SECONDS.timed(kind="summary")
+    def _transform_summary_row(self, row: dict) -> VerificationSession:
         """
-        Add or update a verification in the database.
-        This would insert into the documents table.
+        Build a VerificationSession directly from a summary projection row.
+        
+        Mirrors the summary fields of _transform_multi_table_data_to_verification without
+        touching doc_data beyond the extracted columns or the audit events themselves.
         """
-        # For now, this is a placeholder - in a real scenario, you would insert/update the database
-        logger.info(f"Would add/update verification: {verification.id}")
-        pass
+        session_id = row['id']
+        name = row.get('doc_name') or row.get('candidate_name') or 'Unknown'
+        email = row.get('candidate_email')
+        photo_file = row.get('photo_file')
+        session_status = (row.get('status') or 'pending').upper()
+        
+        return _construct(
+            VerificationSession,
+            id=f"#{session_id}",
+            user=_construct(
+                UserInfo,
+                name=name,
+                email=email if email else f"{session_id}@example.com",
+                country=row.get('country') or 'India',
+                documentType=(row.get('doc_type') or 'unknown').upper(),
+                phone=row.get('candidate_phone'),
+                avatarUrl=f"/api/files/{photo_file}" if photo_file else ""
+            ),
+            status=session_status,
+            createdAt=row['created_at'].isoformat() if row.get('created_at') else None,
+            vendor=row.get('issuer_name') or 'Unknown Issuer',
+            steps=self._derive_steps(session_status, bool(row.get('has_document_fetch')), photo_file)
+        )
 
-    def get_all(self) -> List[VerificationDetail]:
-        """Get all verification sessions from the database, joining all three tables."""
-        verifications = []
+    def summary_from_json(self, row: dict) -> VerificationSession:
+        """Build a VerificationSession from a verification_summary row decoded from JSON (e.g. a notification)."""
+        created_at = row.get('created_at')
+        if isinstance(created_at, str):
+            row = {**row, 'created_at': datetime.fromisoformat(created_at)}
+        return self._transform_summary_row(row)
+
+    def add_verification(self, record: VerificationIngest):
+        """
+        Write a single ingest record. Request handlers enqueue on the
+        write-behind ingest queue instead of calling this inline.
+        
+        Raises:
+            ValueError: If the record was rejected
+        """
+        failures = self.ingest_batch([(1, record)])
+        if failures:
+            raise ValueError(failures[0].error)
+
+    @staticmethod
+    def _ingest_rows(record: VerificationIngest) -> Tuple[tuple, tuple, tuple]:
+        """
+        Map an ingest record to its sessions, documents and audit_log rows.
+        
+        Raises:
+            ValueError: If a timestamp is not ISO 8601
+        """
+        session_id = record.session_id.lstrip('#')
+        now = datetime.now(timezone.utc)
+        created_at = record.timestamps.get('created_at')
+        created_at = datetime.fromisoformat(created_at) if created_at else now
+        
+        session_row = (
+            session_id, record.user.name, record.user.email, record.user.phone,
+            record.status.lower(), Json(record.workflow), created_at, now
+        )
+        # Same doc_data shape the vendor fetch writes, so the summary and detail views read it unchanged
+        doc_data = {'name': record.user.name, 'address': {'country': record.user.country}}
+        if record.vendor:
+            doc_data['issuer'] = {'name': record.vendor}
+        document_row = (session_id, record.document_type.lower(), Json(doc_data))
+        audit_row = (
+            session_id, INGEST_EVENT,
+            Json({'vendor': record.vendor, 'workflow': record.workflow, 'timestamps': record.timestamps}),
+            now
+        )
+        return session_row, document_row, audit_row
+
+    @staticmethod
+    def _write_ingest_rows(cur, rows: List[Tuple[tuple, tuple, tuple]]):
+        """Write mapped ingest rows with one multi-row statement per table."""
+        inserted = execute_values(
+            cur, INGEST_SESSIONS_QUERY, [session_row for session_row, _, _ in rows],
+            page_size=len(rows), fetch=True
+        )
+        new_sessions = {row['id'] for row in inserted if row['inserted']}
+        documents = [document_row for _, document_row, _ in rows if document_row[0] in new_sessions]
+        if documents:
+            execute_values(cur, INGEST_DOCUMENTS_QUERY, documents, page_size=len(documents))
+        execute_values(cur, INGEST_AUDIT_EVENTS_QUERY, [audit_row for _, _, audit_row in rows],
+                       page_size=len(rows))
+
+    def ingest_batch(self, records: List[Tuple[int, VerificationIngest]]) -> List[BulkIngestFailure]:
+        """
+        Persist a batch of validated ingest records in one transaction.
+        
+        If the batch fails, it is retried record by record, each under its own
+        savepoint, so one bad record does not reject the rest.
+        
+        Args:
+            records: (line number, record) pairs; session ids must be unique within the batch
+        
+        Returns:
+            Failures for the records that were not written
+        """
+        failures = []
+        rows = []
+        for line, record in records:
+            try:
+                rows.append((line, record, self._ingest_rows(record)))
+            except ValueError as e:
+                failures.append(BulkIngestFailure(line=line, session_id=record.session_id, error=str(e)))
+        if not rows:
+            return failures
         
         try:
             with get_db_connection() as conn:
                 with get_db_cursor(conn) as cur:
-                    # Query to join sessions, documents, and get session_id for audit logs
-                    cur.execute("""
-                        SELECT 
-                            s.id,
-                            s.candidate_name,
-                            s.candidate_email,
-                            s.candidate_phone,
-                            s.status,
-                            s.requested_docs,
-                            s.created_at,
-                            s.updated_at,
-                            d.id as doc_id,
-                            d.doc_type,
-                            d.doc_data,
-                            d.photo_file,
-                            d.pdf_file,
-                            d.fetched_at,
-                            d.fetched_ip
-                        FROM sessions s
-                        LEFT JOIN documents d ON s.id = d.session_id
-                        ORDER BY s.created_at DESC;
-                    """)
+                    self._write_ingest_rows(cur, [mapped for _, _, mapped in rows])
+            logger.info(f"Ingested batch of {len(rows)} verifications")
+            return failures
+        except (DatabaseError, ValueError) as e:
+            # ValueError: values psycopg2 refuses to send, e.g. strings containing NUL
+            logger.warning(f"Ingest batch of {len(rows)} failed, retrying record by record: {e}")
+        
+        with get_db_connection() as conn:
+            with get_db_cursor(conn) as cur:
+                for line, record, mapped in rows:
+                    cur.execute("SAVEPOINT ingest_record")
+                    try:
+                        self._write_ingest_rows(cur, [mapped])
+                        cur.execute("RELEASE SAVEPOINT ingest_record")
+                    except (DatabaseError, ValueError) as e:
+                        cur.execute("ROLLBACK TO SAVEPOINT ingest_record")
+                        failures.append(BulkIngestFailure(
+                            line=line, session_id=record.session_id, error=str(e).strip()
+                        ))
+        
+        logger.info(f"Ingested {len(records) - len(failures)} of {len(records)} verifications record by record")
+        return failures
+
+    @staticmethod
+    def _split_row(row: dict):
+        """Split a joined sessions/documents row into its session and document parts."""
+        session_data = {
+            'id': row['id'],
+            'candidate_name': row['candidate_name'],
+            'candidate_email': row['candidate_email'],
+            'candidate_phone': row['candidate_phone'],
+            'status': row['status'],
+            'requested_docs': row['requested_docs'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+        
+        document_data = {
+            'doc_type': row.get('doc_type'),
+            'doc_data': row.get('doc_data'),
+            'photo_file': row.get('photo_file'),
+            'pdf_file': row.get('pdf_file'),
+            'fetched_at': row.get('fetched_at'),
+            'fetched_ip': row.get('fetched_ip')
+        }
+        
+        return session_data, document_data
+
+    @staticmethod
+    def _group_audit_events(session_ids: List[str], audit_rows: list) -> Dict[str, list]:
+        """Group audit rows by session_id, keeping an (empty) entry for every requested session."""
+        events_by_session: Dict[str, list] = {session_id: [] for session_id in session_ids}
+        for audit in audit_rows:
+            events_by_session[audit['session_id']].append(audit)
+        return events_by_session
+
+    @classmethod
+    def _fetch_audit_events(cls, cur, session_ids: List[str]) -> Dict[str, list]:
+        """
+        Fetch audit events for many sessions in a single query.
+        
+        Returns:
+            Dict mapping session_id to its audit events, oldest first
+        """
+        if not session_ids:
+            return {}
+        cur.execute(AUDIT_EVENTS_QUERY, (list(session_ids),))
+        return cls._group_audit_events(session_ids, cur.fetchall())
+
+    @classmethod
+    async def _afetch_audit_events(cls, cur, session_ids: List[str]) -> Dict[str, list]:
+        """Async version of _fetch_audit_events."""
+        if not session_ids:
+            return {}
+        await cur.execute(AUDIT_EVENTS_QUERY, (list(session_ids),))
+        return cls._group_audit_events(session_ids, await cur.fetchall())
+
+    def _build_verifications(self, rows: list, audit_by_session: Dict[str, list]) -> List[VerificationDetail]:
+        """Transform joined sessions/documents rows and their audit events into VerificationDetail objects."""
+        verifications = []
+        for row in rows:
+            session_data, document_data = self._split_row(row)
+            verifications.append(self._transform_multi_table_data_to_verification(
+                session_data=session_data,
+                document_data=document_data,
+                audit_events=audit_by_session.get(row['id'], [])
+            ))
+        return verifications
+
+    @staticmethod
+    def _build_page_filters(cursor: Optional[str] = None,
+                            status: Optional[str] = None,
+                            doc_type: Optional[str] = None,
+                            created_from: Optional[datetime] = None,
+                            created_to: Optional[datetime] = None,
+                            session_alias: str = "s",
+                            document_alias: str = "d") -> Tuple[str, list]:
+        """
+        Build the WHERE clause shared by paginated list queries.
+        
+        Args:
+            session_alias: Alias of the relation holding the session columns
+            document_alias: Alias of the relation holding doc_type
+        
+        Returns:
+            Tuple of (SQL condition string, parameter list)
+        """
+        conditions = []
+        params: list = []
+        
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            conditions.append(f"({session_alias}.created_at, {session_alias}.id) < (%s, %s)")
+            params.extend([cursor_created_at, cursor_id])
+        if status:
+            conditions.append(f"lower({session_alias}.status) = %s")
+            params.append(status.lower())
+        if doc_type:
+            conditions.append(f"lower({document_alias}.doc_type) = %s")
+            params.append(doc_type.lower())
+        if created_from:
+            conditions.append(f"{session_alias}.created_at >= %s")
+            params.append(created_from)
+        if created_to:
+            conditions.append(f"{session_alias}.created_at < %s")
+            params.append(created_to)
+        
+        return " AND ".join(conditions) or "TRUE", params
+
+    def _build_page_query(self, limit: int, **filters) -> Tuple[str, tuple]:
+        """Build the keyset page query. One extra row is fetched to know whether another page exists."""
+        where, params = self._build_page_filters(**filters)
+        query = f"""
+            SELECT {SESSION_DOCUMENT_COLUMNS}
+            FROM sessions s
+            JOIN documents d ON s.id = d.session_id
+            WHERE d.doc_data IS NOT NULL AND {where}
+            ORDER BY s.created_at DESC, s.id DESC
+            LIMIT %s;
+        """
+        return query, (*params, limit + 1)
+
+    def _build_export_query(self, **filters) -> Tuple[str, tuple]:
+        """Build the unpaginated export query: the page query's rows and order, without a limit."""
+        where, params = self._build_page_filters(**filters)
+        query = f"""
+            SELECT {SESSION_DOCUMENT_COLUMNS}
+            FROM sessions s
+            JOIN documents d ON s.id = d.session_id
+            WHERE d.doc_data IS NOT NULL AND {where}
+            ORDER BY s.created_at DESC, s.id DESC;
+        """
+        return query, tuple(params)
+
+    def _build_summary_page_query(self, limit: int, **filters) -> Tuple[str, tuple]:
+        """Build the keyset page query over verification_summary, with the same look-ahead row."""
+        where, params = self._build_page_filters(session_alias="v", document_alias="v", **filters)
+        query = f"""
+            SELECT {SUMMARY_COLUMNS}
+            FROM verification_summary v
+            WHERE {where}
+            ORDER BY v.created_at DESC, v.id DESC
+            LIMIT %s;
+        """
+        return query, (*params, limit + 1)
+
+    @staticmethod
+    def _split_page(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+        """Trim the look-ahead row from a page and compute the next cursor."""
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+        return rows, None
+
+    @coalesced
+    def get_all(self) -> List[VerificationDetail]:
+        """Get all verification sessions from the database, joining all three tables."""
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_cursor(conn) as cur:
+                    cur.execute(ALL_SESSIONS_QUERY)
                     
-                    sessions_docs = cur.fetchall()
+                    # Only process rows that have document data
+                    rows = [row for row in cur.fetchall() if row.get('doc_data')]
                     
-                    for row in sessions_docs:
-                        # Get audit logs for this session
-                        cur.execute("""
-                            SELECT id, session_id, event, details, ip_address, user_agent, created_at
-                            FROM audit_log
-                            WHERE session_id = %s
-                            ORDER BY created_at ASC;
-                        """, (row['id'],))
-                        
-                        audit_events = cur.fetchall()
-                        
-                        # Transform to VerificationDetail
-                        session_data = {
-                            'id': row['id'],
-                            'candidate_name': row['candidate_name'],
-                            'candidate_email': row['candidate_email'],
-                            'candidate_phone': row['candidate_phone'],
-                            'status': row['status'],
-                            'requested_docs': row['requested_docs'],
-                            'created_at': row['created_at'],
-                            'updated_at': row['updated_at']
-                        }
-                        
-                        document_data = {
-                            'doc_type': row.get('doc_type'),
-                            'doc_data': row.get('doc_data'),
-                            'photo_file': row.get('photo_file'),
-                            'pdf_file': row.get('pdf_file'),
-                            'fetched_at': row.get('fetched_at'),
-                            'fetched_ip': row.get('fetched_ip')
-                        }
-                        
-                        if document_data['doc_data']:  # Only process if we have document data
-                            verification = self._transform_multi_table_data_to_verification(
-                                session_data=session_data,
-                                document_data=document_data,
-                                audit_events=audit_events
-                            )
-                            verifications.append(verification)
+                    # Get audit logs for every session in one round trip
+                    audit_by_session = self._fetch_audit_events(cur, list({row['id'] for row in rows}))
+                    verifications = self._build_verifications(rows, audit_by_session)
                     
                     logger.info(f"Retrieved {len(verifications)} verifications from database (joined from all 3 tables)")
+                    return verifications
+                    
+        except Exception as e:
+            logger.error(f"Error retrieving verifications: {e}")
+            raise
+
+    @coalesced
+    async def aget_all(self) -> List[VerificationDetail]:
+        """Async version of get_all."""
+        try:
+            async with get_async_db_connection(read_only=True) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    await cur.execute(ALL_SESSIONS_QUERY)
+                    rows = [row for row in await cur.fetchall() if row.get('doc_data')]
+                    audit_by_session = await self._afetch_audit_events(cur, list({row['id'] for row in rows}))
+                    verifications = self._build_verifications(rows, audit_by_session)
+                    
+                    logger.info(f"Retrieved {len(verifications)} verifications from database (async)")
+                    return verifications
                     
         except Exception as e:
             logger.error(f"Error retrieving verifications: {e}")
             raise
+
+    @coalesced
+    def get_page(self, limit: int = DEFAULT_PAGE_SIZE,
+                 cursor: Optional[str] = None,
+                 status: Optional[str] = None,
+                 doc_type: Optional[str] = None,
+                 created_from: Optional[datetime] = None,
+                 created_to: Optional[datetime] = None) -> Tuple[List[VerificationDetail], Optional[str]]:
+        """
+        Get one page of verification sessions, newest first, using keyset pagination on (created_at, id).
         
-        return verifications
+        Args:
+            limit: Maximum number of sessions to return
+            cursor: Token from a previous page's next cursor, or None for the first page
+            status: Only include sessions with this status (case-insensitive)
+            doc_type: Only include sessions with this document type (case-insensitive)
+            created_from: Only include sessions created at or after this time
+            created_to: Only include sessions created before this time
+        
+        Returns:
+            Tuple of (verifications, next cursor or None if this is the last page)
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query, params = self._build_page_query(
+            limit, cursor=cursor, status=status, doc_type=doc_type,
+            created_from=created_from, created_to=created_to
+        )
+        
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_cursor(conn) as cur:
+                    cur.execute(query, params)
+                    rows, next_cursor = self._split_page(cur.fetchall(), limit)
+                    audit_by_session = self._fetch_audit_events(cur, list({row['id'] for row in rows}))
+                    verifications = self._build_verifications(rows, audit_by_session)
+                    
+                    logger.info(f"Retrieved page of {len(verifications)} verifications (more: {next_cursor is not None})")
+                    return verifications, next_cursor
+                    
+        except Exception as e:
+            logger.error(f"Error retrieving verification page: {e}")
+            raise
+
+    @coalesced
+    async def aget_page(self, limit: int = DEFAULT_PAGE_SIZE,
+                        cursor: Optional[str] = None,
+                        status: Optional[str] = None,
+                        doc_type: Optional[str] = None,
+                        created_from: Optional[datetime] = None,
+                        created_to: Optional[datetime] = None) -> Tuple[List[VerificationDetail], Optional[str]]:
+        """Async version of get_page."""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query, params = self._build_page_query(
+            limit, cursor=cursor, status=status, doc_type=doc_type,
+            created_from=created_from, created_to=created_to
+        )
+        
+        try:
+            async with get_async_db_connection(read_only=True) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    await cur.execute(query, params)
+                    rows, next_cursor = self._split_page(await cur.fetchall(), limit)
+                    audit_by_session = await self._afetch_audit_events(cur, list({row['id'] for row in rows}))
+                    verifications = self._build_verifications(rows, audit_by_session)
+                    
+                    logger.info(f"Retrieved page of {len(verifications)} verifications (async, more: {next_cursor is not None})")
+                    return verifications, next_cursor
+                    
+        except Exception as e:
+            logger.error(f"Error retrieving verification page: {e}")
+            raise
+
+    @coalesced
+    def get_summary_page(self, limit: int = DEFAULT_PAGE_SIZE,
+                         cursor: Optional[str] = None,
+                         status: Optional[str] = None,
+                         doc_type: Optional[str] = None,
+                         created_from: Optional[datetime] = None,
+                         created_to: Optional[datetime] = None) -> Tuple[List[VerificationSession], Optional[str]]:
+        """
+        Get one page of session summaries for the list view.
+        
+        Same paging and filters as get_page, but reads the precomputed
+        verification_summary table instead of joining sessions and documents
+        and loading full doc_data and every audit event.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query, params = self._build_summary_page_query(
+            limit, cursor=cursor, status=status, doc_type=doc_type,
+            created_from=created_from, created_to=created_to
+        )
+        
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_cursor(conn) as cur:
+                    cur.execute(query, params)
+                    rows, next_cursor = self._split_page(cur.fetchall(), limit)
+                    summaries = [self._transform_summary_row(row) for row in rows]
+                    
+                    logger.info(f"Retrieved {len(summaries)} verification summaries (more: {next_cursor is not None})")
+                    return summaries, next_cursor
+                    
+        except Exception as e:
+            logger.error(f"Error retrieving verification summaries: {e}")
+            raise
+
+    @coalesced
+    async def aget_summary_page(self, limit: int = DEFAULT_PAGE_SIZE,
+                                cursor: Optional[str] = None,
+                                status: Optional[str] = None,
+                                doc_type: Optional[str] = None,
+                                created_from: Optional[datetime] = None,
+                                created_to: Optional[datetime] = None) -> Tuple[List[VerificationSession], Optional[str]]:
+        """Async version of get_summary_page."""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query, params = self._build_summary_page_query(
+            limit, cursor=cursor, status=status, doc_type=doc_type,
+            created_from=created_from, created_to=created_to
+        )
+        
+        try:
+            async with get_async_db_connection(read_only=True) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    await cur.execute(query, params)
+                    rows, next_cursor = self._split_page(await cur.fetchall(), limit)
+                    summaries = [self._transform_summary_row(row) for row in rows]
+                    
+                    logger.info(f"Retrieved {len(summaries)} verification summaries (async, more: {next_cursor is not None})")
+                    return summaries, next_cursor
+                    
+        except Exception as e:
+            logger.error(f"Error retrieving verification summaries: {e}")
+            raise
+
+    def iter_export(self, batch_size: int = EXPORT_BATCH_SIZE,
+                    status: Optional[str] = None,
+                    doc_type: Optional[str] = None,
+                    created_from: Optional[datetime] = None,
+                    created_to: Optional[datetime] = None) -> Iterator[VerificationDetail]:
+        """
+        Stream every matching verification, newest first, without loading them all into memory.
+        
+        Reads through a server-side cursor in batches of batch_size and fetches the
+        audit events for each batch with one query, so memory stays bounded by the
+        batch size regardless of table size. The connection is held until the
+        iterator is exhausted or closed.
+        """
+        query, params = self._build_export_query(
+            status=status, doc_type=doc_type, created_from=created_from, created_to=created_to
+        )
+        exported = 0
+        
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_server_cursor(conn, "verification_export", itersize=batch_size) as cur, \
+                        get_db_cursor(conn) as audit_cur:
+                    cur.execute(query, params)
+                    
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        audit_by_session = self._fetch_audit_events(audit_cur, list({row['id'] for row in rows}))
+                        for verification in self._build_verifications(rows, audit_by_session):
+                            exported += 1
+                            yield verification
+                    
+                    logger.info(f"Exported {exported} verifications")
+                    
+        except Exception as e:
+            logger.error(f"Error exporting verifications after {exported} rows: {e}")
+            raise
+
+    def _build_stats_query(self, created_from: Optional[datetime],
+                           created_to: Optional[datetime]) -> Tuple[str, list]:
+        """Build STATS_QUERY for an optional creation window."""
+        where, params = self._build_page_filters(
+            created_from=created_from, created_to=created_to, session_alias="s", document_alias="v"
+        )
+        return STATS_QUERY.format(where=where), params
+
+    @staticmethod
+    def _build_stats(rows: list, created_from: Optional[datetime],
+                     created_to: Optional[datetime]) -> VerificationStats:
+        """Fold the grouping-set rows of STATS_QUERY into a VerificationStats."""
+        total = 0
+        by_status: Dict[str, int] = {}
+        by_doc_type: Dict[str, int] = {}
+        per_day = []
+        for row in rows:
+            if row['grouping'] == STATS_BY_STATUS:
+                by_status[row['status']] = row['count']
+            elif row['grouping'] == STATS_BY_DOC_TYPE:
+                by_doc_type[row['doc_type']] = row['count']
+            elif row['grouping'] == STATS_BY_DAY:
+                per_day.append(DailyCount(date=row['day'].isoformat(), count=row['count']))
+            elif row['grouping'] == STATS_TOTAL:
+                total = row['count']
+        per_day.sort(key=lambda day: day.date)
+        
+        return VerificationStats(
+            total=total,
+            byStatus=by_status,
+            byDocumentType=by_doc_type,
+            perDay=per_day,
+            createdFrom=created_from.isoformat() if created_from else None,
+            createdTo=created_to.isoformat() if created_to else None,
+            generatedAt=datetime.now(timezone.utc).isoformat()
+        )
+
+    @coalesced
+    def get_stats(self, created_from: Optional[datetime] = None,
+                  created_to: Optional[datetime] = None) -> VerificationStats:
+        """
+        Counts by status, by document type and per day (UTC), computed by one aggregate query.
+        
+        Args:
+            created_from: Only count sessions created at or after this time
+            created_to: Only count sessions created before this time
+        
+        Returns:
+            VerificationStats, cached per window for STATS_CACHE_TTL seconds
+        """
+        key = (created_from, created_to)
+        cached = self.stats_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        query, params = self._build_stats_query(created_from, created_to)
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_cursor(conn) as cur:
+                    cur.execute(query, params)
+                    stats = self._build_stats(cur.fetchall(), created_from, created_to)
+        except Exception as e:
+            logger.error(f"Error computing verification stats: {e}")
+            raise
+        
+        self.stats_cache.set(key, stats)
+        return stats
+
+    @coalesced
+    async def aget_stats(self, created_from: Optional[datetime] = None,
+                         created_to: Optional[datetime] = None) -> VerificationStats:
+        """Async version of get_stats."""
+        key = (created_from, created_to)
+        cached = self.stats_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        query, params = self._build_stats_query(created_from, created_to)
+        try:
+            async with get_async_db_connection(read_only=True) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    await cur.execute(query, params)
+                    stats = self._build_stats(await cur.fetchall(), created_from, created_to)
+        except Exception as e:
+            logger.error(f"Error computing verification stats: {e}")
+            raise
+        
+        self.stats_cache.set(key, stats)
+        return stats
+
+    @staticmethod
+    def _search_params(q: str) -> Tuple[List[str], dict]:
+        """
+        Choose the search sources for a query and their parameters.
+        
+        Queries made of digits and separators are matched against phone and
+        document numbers (prefix or suffix); anything else against names by word
+        prefix and, if it is a single token, against emails by prefix.
+        
+        Raises:
+            ValueError: If the query has nothing searchable in it
+        """
+        text = " ".join(q.split()).lower()
+        digits = re.sub(r"\D", "", text)
+        params = {"text": text, "candidates": SEARCH_CANDIDATE_LIMIT}
+        sources = []
+        
+        if SEARCH_NUMBER_PATTERN.fullmatch(text):
+            if len(digits) < SEARCH_MIN_DIGITS:
+                raise ValueError(f"Number searches need at least {SEARCH_MIN_DIGITS} digits")
+            params.update(digits=digits, digits_prefix=f"{digits}%", digits_suffix=f"{digits[::-1]}%")
+            sources.append(SEARCH_NUMBER_SOURCES)
+            needle = digits
+        else:
+            words = re.findall(r"[^\W_]+", text)
+            if not words:
+                raise ValueError("Search query must contain letters or digits")
+            params["tsquery"] = " & ".join(f"{word}:*" for word in words)
+            sources.append(SEARCH_NAME_SOURCES)
+            if " " not in text:
+                params["prefix"] = f"{_like_escape(text)}%"
+                sources.append(SEARCH_EMAIL_SOURCE)
+            needle = text
+        
+        params.update(needle=needle, contains=f"%{_like_escape(needle)}%")
+        return sources, params
+
+    def _build_search_query(self, q: str, limit: int) -> Tuple[str, dict]:
+        """Build the ranked search query; pg_trgm substring sources are added once search_trigram is known."""
+        sources, params = self._search_params(q)
+        if self.search_trigram:
+            sources.append(SEARCH_TRIGRAM_SOURCES)
+        params["limit"] = limit
+        return SEARCH_QUERY.format(sources="    UNION ALL".join(sources)), params
+
+    def search(self, q: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[VerificationSession]:
+        """
+        Find sessions by partial candidate name, email, phone or document number.
+        
+        Results are list-view summaries, best match first (exact, then prefix,
+        then number suffix and substring matches), newest first within a rank.
+        
+        Raises:
+            ValueError: If the query has nothing searchable in it
+        """
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        self._search_params(q)  # reject unsearchable queries before taking a connection
+        
+        try:
+            with get_db_connection(read_only=True) as conn:
+                with get_db_cursor(conn) as cur:
+                    if self.search_trigram is None:
+                        cur.execute(SEARCH_TRIGRAM_QUERY)
+                        self.search_trigram = cur.fetchone()['available']
+                    query, params = self._build_search_query(q, limit)
+                    cur.execute(query, params)
+                    results = [self._transform_summary_row(row) for row in cur.fetchall()]
+                    
+                    logger.info(f"Search matched {len(results)} verifications")
+                    return results
+                    
+        except Exception as e:
+            logger.error(f"Error searching verifications: {e}")
+            raise
+
+    async def asearch(self, q: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[VerificationSession]:
+        """Async version of search."""
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        self._search_params(q)  # reject unsearchable queries before taking a connection
+        
+        try:
+            async with get_async_db_connection(read_only=True) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    if self.search_trigram is None:
+                        await cur.execute(SEARCH_TRIGRAM_QUERY)
+                        self.search_trigram = (await cur.fetchone())['available']
+                    query, params = self._build_search_query(q, limit)
+                    await cur.execute(query, params)
+                    results = [self._transform_summary_row(row) for row in await cur.fetchall()]
+                    
+                    logger.info(f"Search matched {len(results)} verifications (async)")
+                    return results
+                    
+        except Exception as e:
+            logger.error(f"Error searching verifications: {e}")
+            raise
+
+    def _build_detail(self, session_id: str, row: Optional[dict],
+                      audit_events: list) -> Optional[VerificationDetail]:
+        """Transform the row for a single session, or return None if it is missing or has no document."""
+        if not row:
+            logger.warning(f"No verification found for session: {session_id}")
+            return None
+        
+        if not row.get('doc_data'):
+            logger.warning(f"No document data found for session: {session_id}")
+            return None
+        
+        verification = self._build_verifications([row], {row['id']: audit_events})[0]
+        logger.info(f"Retrieved verification for session: {session_id} (joined from all 3 tables)")
+        return verification
+
+    @staticmethod
+    def _version_token(row: Optional[dict]) -> Optional[str]:
+        """Fold a version query row into a short opaque token."""
+        if not row:
+            return None
+        return "|".join("" if value is None else str(value) for value in row.values())
+
+    @coalesced
+    def get_list_version(self) -> Optional[str]:
+        """Token that changes whenever any listed data changes, without running the list query."""
+        with get_db_connection(read_only=True) as conn:
+            with get_db_cursor(conn) as cur:
+                cur.execute(LIST_VERSION_QUERY)
+                return self._version_token(cur.fetchone())
+
+    @coalesced
+    async def aget_list_version(self) -> Optional[str]:
+        """Async version of get_list_version."""
+        async with get_async_db_connection(read_only=True) as conn:
+            async with get_async_db_cursor(conn) as cur:
+                await cur.execute(LIST_VERSION_QUERY)
+                return self._version_token(await cur.fetchone())
+
+    @coalesced
+    def get_version(self, session_id: str) -> Optional[str]:
+        """Token that changes whenever the session, its document or its audit trail changes. None if it does not exist."""
+        with get_db_connection(read_only=self._replica_safe(session_id)) as conn:
+            with get_db_cursor(conn) as cur:
+                cur.execute(SESSION_VERSION_QUERY, (session_id.replace('#', ''),))
+                return self._version_token(cur.fetchone())
+
+    @coalesced
+    async def aget_version(self, session_id: str) -> Optional[str]:
+        """Async version of get_version."""
+        async with get_async_db_connection(read_only=self._replica_safe(session_id)) as conn:
+            async with get_async_db_cursor(conn) as cur:
+                await cur.execute(SESSION_VERSION_QUERY, (session_id.replace('#', ''),))
+                return self._version_token(await cur.fetchone())
+
+    def handle_change_notification(self, payload: str):
+        """Drop the cached detail for the session named in a verification_changed payload, and stop sharing in-flight reads."""
+        try:
+            session_id = json.loads(payload).get('session_id')
+        except ValueError:
+            logger.warning(f"Ignoring malformed change notification: {payload}")
+            return
+        # Any change can alter list pages and versions, so no caller arriving after it joins an older load
+        self.flights.forget()
+        if session_id:
+            self.detail_cache.invalidate(session_id)
+            if replica_router.replicas:
+                self.recent_writes.set(session_id, True)
+
+    def handle_notification_reconnect(self):
+        """Notifications may have been missed while the listener was down: drop everything derived from them."""
+        self.flights.forget()
+        self.detail_cache.clear()
+        # Writes may have gone unnoticed too, so no session is known to be on the replicas yet
+        self._primary_reads_until = time.monotonic() + REPLICA_CONFIG['max_lag']
+
+    def _replica_safe(self, session_id: str) -> bool:
+        """
+        Whether a session may be read from a replica. The first detail read after
+        a write refills the detail cache, so it must see that write: sessions
+        changed within DB_REPLICA_MAX_LAG are read from the primary.
+        """
+        if not replica_router.replicas or time.monotonic() < self._primary_reads_until:
+            return False
+        return self.recent_writes.get(session_id.replace('#', '')) is None
 
     def get_by_id(self, session_id: str) -> Optional[VerificationDetail]:
-        """Get a specific verification session by ID, joining all three tables."""
+        """Get a specific verification session by ID, joining all three tables. Results are cached."""
+        versioned = self.get_versioned_by_id(session_id)
+        return versioned[1] if versioned else None
+
+    def get_versioned_by_id(self, session_id: str,
+                            version: Optional[str] = None) -> Optional[Tuple[str, VerificationDetail]]:
+        """
+        Get a verification session with the version it was read at, for its ETag.
+        
+        Args:
+            session_id: Session to read
+            version: Current version from get_version; a cached detail recorded at
+                another one is reloaded, in case its change notification is late
+        
+        Returns:
+            Tuple of (version, detail), or None if the session or its document is missing
+        """
         # Remove '#' prefix if present
         clean_session_id = session_id.replace('#', '')
         
+        cached = self.detail_cache.get(clean_session_id)
+        if cached is not None and (version is None or cached[0] == version):
+            return cached
+        return self._load_by_id(clean_session_id)
+
+    @coalesced
+    def _load_by_id(self, session_id: str) -> Optional[Tuple[str, VerificationDetail]]:
+        """Read and cache one session on a detail cache miss; concurrent misses for it share the read."""
+        generation = self.detail_cache.generation()
+        
         try:
-            with get_db_connection() as conn:
+            with get_db_connection(read_only=self._replica_safe(session_id)) as conn:
                 with get_db_cursor(conn) as cur:
-                    # Query to join sessions and documents
-                    cur.execute("""
-                        SELECT 
-                            s.id,
-                            s.candidate_name,
-                            s.candidate_email,
-                            s.candidate_phone,
-                            s.status,
-                            s.requested_docs,
-                            s.created_at,
-                            s.updated_at,
-                            d.id as doc_id,
-                            d.doc_type,
-                            d.doc_data,
-                            d.photo_file,
-                            d.pdf_file,
-                            d.fetched_at,
-                            d.fetched_ip
-                        FROM sessions s
-                        LEFT JOIN documents d ON s.id = d.session_id
-                        WHERE s.id = %s
-                        LIMIT 1;
-                    """, (clean_session_id,))
-                    
+                    cur.execute(SESSION_BY_ID_QUERY, (session_id,))
                     row = cur.fetchone()
                     
-                    if row:
-                        # Get audit logs for this session
-                        cur.execute("""
-                            SELECT id, session_id, event, details, ip_address, user_agent, created_at
-                            FROM audit_log
-                            WHERE session_id = %s
-                            ORDER BY created_at ASC;
-                        """, (clean_session_id,))
-                        
-                        audit_events = cur.fetchall()
-                        
-                        # Transform to VerificationDetail
-                        session_data = {
-                            'id': row['id'],
-                            'candidate_name': row['candidate_name'],
-                            'candidate_email': row['candidate_email'],
-                            'candidate_phone': row['candidate_phone'],
-                            'status': row['status'],
-                            'requested_docs': row['requested_docs'],
-                            'created_at': row['created_at'],
-                            'updated_at': row['updated_at']
-                        }
-                        
-                        document_data = {
-                            'doc_type': row.get('doc_type'),
-                            'doc_data': row.get('doc_data'),
-                            'photo_file': row.get('photo_file'),
-                            'pdf_file': row.get('pdf_file'),
-                            'fetched_at': row.get('fetched_at'),
-                            'fetched_ip': row.get('fetched_ip')
-                        }
-                        
-                        if document_data['doc_data']:
-                            verification = self._transform_multi_table_data_to_verification(
-                                session_data=session_data,
-                                document_data=document_data,
-                                audit_events=audit_events
-                            )
-                            logger.info(f"Retrieved verification for session: {session_id} (joined from all 3 tables)")
-                            return verification
-                        else:
-                            logger.warning(f"No document data found for session: {session_id}")
-                            return None
-                    else:
-                        logger.warning(f"No verification found for session: {session_id}")
-                        return None
+                    audit_events = []
+                    if row and row.get('doc_data'):
+                        audit_events = self._fetch_audit_events(cur, [session_id])[session_id]
+                    
+                    verification = self._build_detail(session_id, row, audit_events)
                         
         except Exception as e:
             logger.error(f"Error retrieving verification {session_id}: {e}")
             raise
+        
+        if verification is None:
+            return None
+        # Audit events are read after the row, so the body is never older than this version
+        versioned = (str(row['version']), verification)
+        self.detail_cache.set(session_id, versioned, generation=generation)
+        return versioned
+
+    async def aget_by_id(self, session_id: str) -> Optional[VerificationDetail]:
+        """Async version of get_by_id."""
+        versioned = await self.aget_versioned_by_id(session_id)
+        return versioned[1] if versioned else None
 
-    async def save_file(self, session_id: str, file_name: str, file_content: bytes) -> str:
-        """Save a file to the filesystem."""
-        # Sanitize session_id for filename
-        safe_session_id = session_id.replace('#', '')
-        file_path = os.path.join(self.storage_path, f"{safe_session_id}_{file_name}")
+    async def aget_versioned_by_id(self, session_id: str,
+                                   version: Optional[str] = None) -> Optional[Tuple[str, VerificationDetail]]:
+        """Async version of get_versioned_by_id."""
+        clean_session_id = session_id.replace('#', '')
         
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-            
-        # Return a relative URL
-        return f"/api/files/{safe_session_id}_{file_name}"
+        cached = self.detail_cache.get(clean_session_id)
+        if cached is not None and (version is None or cached[0] == version):
+            return cached
+        return await self._aload_by_id(clean_session_id)
+
+    @coalesced
+    async def _aload_by_id(self, session_id: str) -> Optional[Tuple[str, VerificationDetail]]:
+        """Async version of _load_by_id."""
+        generation = self.detail_cache.generation()
+        
+        try:
+            async with get_async_db_connection(read_only=self._replica_safe(session_id)) as conn:
+                async with get_async_db_cursor(conn) as cur:
+                    await cur.execute(SESSION_BY_ID_QUERY, (session_id,))
+                    row = await cur.fetchone()
+                    
+                    audit_events = []
+                    if row and row.get('doc_data'):
+                        audit_events = (await self._afetch_audit_events(cur, [session_id]))[session_id]
+                    
+                    verification = self._build_detail(session_id, row, audit_events)
+                        
+        except Exception as e:
+            logger.error(f"Error retrieving verification {session_id}: {e}")
+            raise
+        
+        if verification is None:
+            return None
+        versioned = (str(row['version']), verification)
+        self.detail_cache.set(session_id, versioned, generation=generation)
+        return versioned
+
+    async def save_file(self, session_id: str, file_name: str, source,
+                        max_bytes: Optional[int] = None) -> StoredFile:
+        """Stream an uploaded file into the content-addressed file store. See FileStore.put."""
+        return await self.files.put(session_id, file_name, source, max_bytes=max_bytes)
 
-# Create a singleton instance
-db = VerificationStore()
+    async def revert_file(self, stored_file: StoredFile):
+        """Undo a save_file when the rest of its request fails. See FileStore.revert."""
+        await self.files.revert(stored_file)
@@ -0,0 +1,167 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Distinct UA strings remembered by classify_user_agent
+UA_CACHE_SIZE = 4096
+
+
+class UserAgentInfo(NamedTuple):
+    device_type: str  # Mobile, Tablet, Desktop or Bot
+    os: str
+    os_version: Optional[str]
+    browser: str
+    browser_version: Optional[str]
+    brand: Optional[str]
+    model: Optional[str]
+
+
+UNKNOWN = UserAgentInfo("Desktop", "Unknown", None, "Unknown", None, None, None)
+
+# HTTP client libraries and tools send their name first, e.g. "curl/8.4.0"
+_CLIENT_PREFIXES = ("curl/", "wget/", "python-requests/", "python-httpx/", "okhttp/", "postmanruntime/", "httpie/")
+
+# Matched against the lower-cased UA. Whole words and product tokens only: a bare
+# "bot" substring also hits device names such as "CUBOT X30".
+_BOT = re.compile(
+    r"\b(?:bot|crawler|spider)\b"
+    r"|[a-z]+(?:bot|crawler|spider)[/-]"  # Googlebot/2.1, Baiduspider/2.0, AdsBot-Google
+    r"|\b(?:mediapartners-google|facebookexternalhit|slurp)\b"
+)
+
+# (literal token, pattern, OS name); the first group, if any, is the version. A rule's
+# pattern only runs when its token is in the UA, since a failing regex scan costs far
+# more than a substring test. Order matters: iOS UAs contain "Mac OS X" and Android
+# UAs contain "Linux".
+_OS_RULES = [
+    ("Windows Phone", re.compile(r"Windows Phone(?: OS)? ([\d.]+)"), "Windows Phone"),
+    ("Windows NT", re.compile(r"Windows NT ([\d.]+)"), "Windows"),
+    ("iPad", re.compile(r"iPad.*?OS ([\d_]+)"), "iPadOS"),
+    ("iPhone", re.compile(r"iPhone.*?OS ([\d_]+)"), "iOS"),
+    ("iPod", re.compile(r"iPod.*?OS ([\d_]+)"), "iOS"),
+    ("Android", re.compile(r"Android[ /]?([\d.]+)?"), "Android"),
+    ("CrOS", re.compile(r"CrOS \S+ ([\d.]+)"), "ChromeOS"),
+    ("Mac OS X", re.compile(r"Mac OS X ([\d_.]+)"), "macOS"),
+    ("Macintosh", re.compile(r"Macintosh"), "macOS"),
+    ("Ubuntu", re.compile(r"Ubuntu"), "Ubuntu"),
+    ("Linux", re.compile(r"Linux"), "Linux"),
+]
+
+# Marketing names for Windows NT kernel versions
+_WINDOWS_VERSIONS = {"10.0": "10", "6.3": "8.1", "6.2": "8", "6.1": "7", "6.0": "Vista", "5.1": "XP"}
+
+# (literal token, pattern, browser name); the first group is the version. Order
+# matters: most browsers also claim Chrome and Safari.
+_BROWSER_RULES = [
+    ("Edg", re.compile(r"(?:Edg|EdgA|EdgiOS|Edge)/([\d.]+)"), "Edge"),
+    ("OPR/", re.compile(r"OPR/([\d.]+)"), "Opera"),
+    ("Opera/", re.compile(r"Opera/([\d.]+)"), "Opera"),
+    ("SamsungBrowser/", re.compile(r"SamsungBrowser/([\d.]+)"), "Samsung Internet"),
+    ("UCBrowser/", re.compile(r"UCBrowser/([\d.]+)"), "UC Browser"),
+    ("YaBrowser/", re.compile(r"YaBrowser/([\d.]+)"), "Yandex"),
+    ("FBAV/", re.compile(r"FBAV/([\d.]+)"), "Facebook"),
+    ("FBIOS/", re.compile(r"FBIOS/([\d.]+)"), "Facebook"),
+    ("Instagram ", re.compile(r"Instagram ([\d.]+)"), "Instagram"),
+    ("CriOS/", re.compile(r"CriOS/([\d.]+)"), "Chrome"),
+    ("FxiOS/", re.compile(r"FxiOS/([\d.]+)"), "Firefox"),
+    ("Firefox/", re.compile(r"Firefox/([\d.]+)"), "Firefox"),
+    ("; wv)", re.compile(r"; wv\).*?Chrome/([\d.]+)"), "Android WebView"),
+    ("Chrome/", re.compile(r"Chrome/([\d.]+)"), "Chrome"),
+    ("Version/", re.compile(r"Version/([\d.]+).*Mobile.*Safari/"), "Mobile Safari"),
+    ("Version/", re.compile(r"Version/([\d.]+).*Safari/"), "Safari"),
+    ("MSIE ", re.compile(r"MSIE ([\d.]+)"), "Internet Explorer"),
+    ("Trident/", re.compile(r"Trident/[^)]*rv:([\d.]+)"), "Internet Explorer"),
+]
+
+# Android device model: the token after the Android version (and optional locale), before "Build/" or ")"
+_ANDROID_MODEL = re.compile(r"Android [\d.]+;(?: [a-z]{2}[-_][A-Za-z]{2};)? ([^;)]+?)(?: Build/|\))")
+
+# (model pattern, brand)
+_BRAND_RULES = [
+    (re.compile(r"^(?:SM-|GT-|SAMSUNG|Galaxy)", re.I), "Samsung"),
+    (re.compile(r"^Pixel", re.I), "Google"),
+    (re.compile(r"^(?:Redmi|Mi |POCO|M\d{4}[A-Z]\d|\d{7,8}[A-Z]{1,3}$)", re.I), "Xiaomi"),
+    (re.compile(r"^(?:CPH|OPPO)", re.I), "OPPO"),
+    (re.compile(r"^RMX", re.I), "Realme"),
+    (re.compile(r"^(?:vivo|V\d{4})", re.I), "vivo"),
+    (re.compile(r"^(?:ONEPLUS|IN20|KB20|LE21|NE22)", re.I), "OnePlus"),
+    (re.compile(r"^moto", re.I), "Motorola"),
+    (re.compile(r"^Nokia", re.I), "Nokia"),
+    (re.compile(r"^(?:Infinix|TECNO|itel)", re.I), "Transsion"),
+    (re.compile(r"^(?:HUAWEI|HONOR|[A-Z]{3}-(?:L|AL|TL)\d)", re.I), "Huawei"),
+    (re.compile(r"^(?:LM-|LG)", re.I), "LG"),
+]
+
+
+def _match(rules, user_agent: str):
+    for token, pattern, name in rules:
+        if token not in user_agent:
+            continue
+        match = pattern.search(user_agent)
+        if match:
+            version = match.group(1) if match.re.groups else None
+            return name, version.replace("_", ".") if version else None
+    return "Unknown", None
+
+
+def _brand(model: str) -> Optional[str]:
+    for pattern, brand in _BRAND_RULES:
+        if pattern.search(model):
+            return brand
+    return None
+
+
+def _is_bot(user_agent: str) -> bool:
+    lowered = user_agent.lower()
+    if lowered.startswith(_CLIENT_PREFIXES):
+        return True
+    # Substring tests first: they rule out almost every browser UA for a fraction of a regex scan
+    if not ("bot" in lowered or "spider" in lowered or "crawl" in lowered or "slurp" in lowered
+            or "facebookexternalhit" in lowered or "mediapartners-google" in lowered):
+        return False
+    return _BOT.search(lowered) is not None
+
+
+def _classify(user_agent: str) -> UserAgentInfo:
+    """Uncached classification; use classify_user_agent."""
+    if not user_agent:
+        return UNKNOWN
+
+    os_name, os_version = _match(_OS_RULES, user_agent)
+    if os_name == "Windows" and os_version:
+        os_version = _WINDOWS_VERSIONS.get(os_version, os_version)
+    browser, browser_version = _match(_BROWSER_RULES, user_agent)
+
+    brand = model = None
+    if os_name in ("iOS", "iPadOS"):
+        brand = "Apple"
+        model = "iPad" if os_name == "iPadOS" else ("iPod" if "iPod" in user_agent else "iPhone")
+    elif os_name == "macOS":
+        brand = "Apple"
+        model = "Mac"
+    elif os_name == "Android":
+        match = _ANDROID_MODEL.search(user_agent)
+        # Reduced UAs (Chrome 110+) replace the model with "K"
+        if match and match.group(1) not in ("K", "Mobile", "Linux"):
+            model = match.group(1).strip()
+            brand = _brand(model)
+
+    if _is_bot(user_agent):
+        device_type = "Bot"
+    elif os_name == "iPadOS" or "Tablet" in user_agent or (os_name == "Android" and "Mobile" not in user_agent):
+        device_type = "Tablet"
+    elif "Mobi" in user_agent or os_name in ("iOS", "Android", "Windows Phone"):
+        device_type = "Mobile"
+    else:
+        device_type = "Desktop"
+
+    return UserAgentInfo(device_type, os_name, os_version, browser, browser_version, brand, model)
+
+
+@lru_cache(maxsize=UA_CACHE_SIZE)
+def classify_user_agent(user_agent: Optional[str]) -> UserAgentInfo:
+    """
+    Classify a User-Agent string into device type, OS, browser and (for mobile) brand/model.
+    Results are memoized per UA string, since a handful of strings cover most sessions.
+    """
+    return _classify(user_agent)
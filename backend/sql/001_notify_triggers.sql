@@ -0,0 +1,39 @@
+-- Publish a notification on the verification_changed channel whenever a row
+-- belonging to a verification session changes. The payload is a small JSON
+-- object: {"table": ..., "op": ..., "session_id": ...}.
+
+CREATE OR REPLACE FUNCTION notify_verification_change() RETURNS trigger AS $$
+DECLARE
+    changed jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+
+    PERFORM pg_notify('verification_changed', json_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'session_id', CASE WHEN TG_TABLE_NAME = 'sessions'
+                           THEN changed->>'id'
+                           ELSE changed->>'session_id' END
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sessions_notify_change ON sessions;
+CREATE TRIGGER sessions_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON sessions
+    FOR EACH ROW EXECUTE FUNCTION notify_verification_change();
+
+DROP TRIGGER IF EXISTS documents_notify_change ON documents;
+CREATE TRIGGER documents_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON documents
+    FOR EACH ROW EXECUTE FUNCTION notify_verification_change();
+
+DROP TRIGGER IF EXISTS audit_log_notify_change ON audit_log;
+CREATE TRIGGER audit_log_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON audit_log
+    FOR EACH ROW EXECUTE FUNCTION notify_verification_change();
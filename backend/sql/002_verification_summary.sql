@@ -0,0 +1,132 @@
+-- Denormalized list-view rows, one per session that has a document. Every field the
+-- list endpoint returns is derived here once, when the underlying rows change, so
+-- listing is a single indexed scan. Triggers on sessions, documents and audit_log
+-- keep it current. The derivation mirrors
+-- VerificationStore._transform_multi_table_data_to_verification; the audit events
+-- below must match DOCUMENT_FETCH_EVENTS in backend/services/store.py.
+
+-- The derivation, one row per session (its first document)
+CREATE OR REPLACE VIEW verification_summary_source AS
+SELECT DISTINCT ON (s.id)
+    s.id,
+    s.candidate_name,
+    s.candidate_email,
+    s.candidate_phone,
+    s.status,
+    s.created_at,
+    s.updated_at,
+    d.doc_type,
+    d.doc_data->>'name' as doc_name,
+    d.doc_data->'address'->>'country' as country,
+    d.doc_data->'issuer'->>'name' as issuer_name,
+    COALESCE(d.photo_file, d.doc_data->>'photo_file') as photo_file,
+    EXISTS (
+        SELECT 1 FROM audit_log a
+        WHERE a.session_id = s.id
+        AND a.event IN ('DOCUMENT_FETCHED', 'STATUS_CHECKED')
+    ) as has_document_fetch
+FROM sessions s
+JOIN documents d ON s.id = d.session_id
+WHERE d.doc_data IS NOT NULL
+ORDER BY s.id, d.id;
+
+-- Created from the view so column types follow sessions/documents exactly
+CREATE TABLE IF NOT EXISTS verification_summary AS
+SELECT * FROM verification_summary_source
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS verification_summary_id ON verification_summary (id);
+CREATE INDEX IF NOT EXISTS verification_summary_created
+    ON verification_summary (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS verification_summary_status_created
+    ON verification_summary (lower(status), created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS verification_summary_doc_type_created
+    ON verification_summary (lower(doc_type), created_at DESC, id DESC);
+
+-- Recompute (or remove) the summary row of one session
+CREATE OR REPLACE FUNCTION refresh_verification_summary(target_id sessions.id%TYPE) RETURNS void AS $$
+BEGIN
+    INSERT INTO verification_summary
+    SELECT * FROM verification_summary_source WHERE id = target_id
+    ON CONFLICT (id) DO UPDATE SET
+        candidate_name = EXCLUDED.candidate_name,
+        candidate_email = EXCLUDED.candidate_email,
+        candidate_phone = EXCLUDED.candidate_phone,
+        status = EXCLUDED.status,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at,
+        doc_type = EXCLUDED.doc_type,
+        doc_name = EXCLUDED.doc_name,
+        country = EXCLUDED.country,
+        issuer_name = EXCLUDED.issuer_name,
+        photo_file = EXCLUDED.photo_file,
+        has_document_fetch = EXCLUDED.has_document_fetch;
+
+    IF NOT FOUND THEN
+        DELETE FROM verification_summary WHERE id = target_id;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_verification_summary() RETURNS trigger AS $$
+DECLARE
+    old_id sessions.id%TYPE;
+    new_id sessions.id%TYPE;
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        IF TG_TABLE_NAME = 'sessions' THEN
+            old_id := OLD.id;
+        ELSIF TG_TABLE_NAME = 'documents' THEN
+            old_id := OLD.session_id;
+        -- Only document-fetch audit events affect the summary
+        ELSIF OLD.event IN ('DOCUMENT_FETCHED', 'STATUS_CHECKED') THEN
+            old_id := OLD.session_id;
+        END IF;
+    END IF;
+
+    IF TG_OP <> 'DELETE' THEN
+        IF TG_TABLE_NAME = 'sessions' THEN
+            new_id := NEW.id;
+        ELSIF TG_TABLE_NAME = 'documents' THEN
+            new_id := NEW.session_id;
+        -- Only document-fetch audit events affect the summary
+        ELSIF NEW.event IN ('DOCUMENT_FETCHED', 'STATUS_CHECKED') THEN
+            new_id := NEW.session_id;
+        END IF;
+    END IF;
+
+    IF old_id IS NOT NULL THEN
+        PERFORM refresh_verification_summary(old_id);
+    END IF;
+    IF new_id IS NOT NULL AND new_id IS DISTINCT FROM old_id THEN
+        PERFORM refresh_verification_summary(new_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sessions_sync_summary ON sessions;
+CREATE TRIGGER sessions_sync_summary
+    AFTER INSERT OR UPDATE OR DELETE ON sessions
+    FOR EACH ROW EXECUTE FUNCTION sync_verification_summary();
+
+DROP TRIGGER IF EXISTS documents_sync_summary ON documents;
+CREATE TRIGGER documents_sync_summary
+    AFTER INSERT OR UPDATE OR DELETE ON documents
+    FOR EACH ROW EXECUTE FUNCTION sync_verification_summary();
+
+DROP TRIGGER IF EXISTS audit_log_sync_summary ON audit_log;
+CREATE TRIGGER audit_log_sync_summary
+    AFTER INSERT OR UPDATE OR DELETE ON audit_log
+    FOR EACH ROW EXECUTE FUNCTION sync_verification_summary();
+
+-- Backfill once, when the table has just been created
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM verification_summary LIMIT 1) THEN
+        INSERT INTO verification_summary
+        SELECT * FROM verification_summary_source
+        ON CONFLICT (id) DO NOTHING;
+    END IF;
+END;
+$$;
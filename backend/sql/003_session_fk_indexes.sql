@@ -0,0 +1,5 @@
+-- Every per-session lookup (detail view, audit trail, summary refresh, bulk
+-- ingest triggers) filters documents and audit_log by session_id. Without these
+-- each of them scans the whole table.
+CREATE INDEX IF NOT EXISTS documents_session_id ON documents (session_id, id);
+CREATE INDEX IF NOT EXISTS audit_log_session_created ON audit_log (session_id, created_at);
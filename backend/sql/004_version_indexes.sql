@@ -0,0 +1,5 @@
+-- LIST_VERSION_QUERY runs on every list request to answer If-None-Match. These
+-- turn its max(updated_at) and max(fetched_at) into single index probes instead
+-- of full table scans (about 50 ms at 100k sessions).
+CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at);
+CREATE INDEX IF NOT EXISTS documents_fetched_at ON documents (fetched_at);
@@ -0,0 +1,51 @@
+-- Indexes behind VerificationStore.search. The expressions here must match
+-- SEARCH_*_QUERY in backend/services/store.py exactly, or the planner cannot
+-- use them.
+--
+-- Names and emails: word-prefix matching through full-text search ('simple'
+-- config: no stemming, no stop words), e.g. "ravi ku" -> 'ravi':* & 'ku':*.
+-- Emails and digit strings (phone, Aadhaar): prefix matching with
+-- text_pattern_ops, and suffix matching ("last four digits") through an index
+-- on the reversed value.
+
+-- Digits of a phone or document number, ignoring spaces, dashes and masking
+CREATE OR REPLACE FUNCTION search_digits(value text) RETURNS text AS $$
+    SELECT regexp_replace(value, '\D', '', 'g')
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+CREATE INDEX IF NOT EXISTS sessions_search_name
+    ON sessions USING gin (to_tsvector('simple', coalesce(candidate_name, '')));
+CREATE INDEX IF NOT EXISTS sessions_search_email
+    ON sessions (lower(candidate_email) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS sessions_search_phone
+    ON sessions (search_digits(candidate_phone) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS sessions_search_phone_suffix
+    ON sessions (reverse(search_digits(candidate_phone)) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS documents_search_name
+    ON documents USING gin (to_tsvector('simple', coalesce(doc_data->>'name', '')));
+CREATE INDEX IF NOT EXISTS documents_search_doc_number
+    ON documents (search_digits(doc_data->>'aadhaar_number') text_pattern_ops);
+CREATE INDEX IF NOT EXISTS documents_search_doc_number_suffix
+    ON documents (reverse(search_digits(doc_data->>'aadhaar_number')) text_pattern_ops);
+
+-- Substring matching anywhere in a name, email or number needs pg_trgm. It is
+-- optional: where the extension is not installable, search falls back to the
+-- prefix/suffix indexes above (VerificationStore checks pg_extension).
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS sessions_search_trgm ON sessions USING gin (
+            (lower(coalesce(candidate_name, '') || ' ' || coalesce(candidate_email, '') || ' '
+                || coalesce(search_digits(candidate_phone), ''))) gin_trgm_ops
+        );
+        CREATE INDEX IF NOT EXISTS documents_search_trgm ON documents USING gin (
+            (lower(coalesce(doc_data->>'name', '') || ' '
+                || coalesce(search_digits(doc_data->>'aadhaar_number'), ''))) gin_trgm_ops
+        );
+    END IF;
+EXCEPTION WHEN insufficient_privilege THEN
+    RAISE NOTICE 'pg_trgm not installed (insufficient privilege); search uses prefix indexes only';
+END;
+$$;
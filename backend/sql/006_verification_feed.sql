@@ -0,0 +1,44 @@
+-- Publish list-view changes for the live feed (/api/verifications/stream) on
+-- the verification_feed channel. Triggers on verification_summary see exactly
+-- the rows the list endpoint returns, after every derivation has been applied,
+-- so the payload carries the changed summary row itself and the server fans it
+-- out without querying. Payload: {"event": ..., "row": {...}}, where event is
+-- created, status_changed, updated or deleted (deleted rows carry only the id).
+
+CREATE OR REPLACE FUNCTION notify_verification_feed() RETURNS trigger AS $$
+DECLARE
+    event text;
+    changed json;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event := 'created';
+    ELSIF TG_OP = 'DELETE' THEN
+        event := 'deleted';
+    ELSIF NEW.status IS DISTINCT FROM OLD.status THEN
+        event := 'status_changed';
+    ELSE
+        event := 'updated';
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        changed := json_build_object('id', OLD.id);
+    ELSE
+        changed := row_to_json(NEW);
+    END IF;
+
+    PERFORM pg_notify('verification_feed', json_build_object('event', event, 'row', changed)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS verification_summary_feed ON verification_summary;
+CREATE TRIGGER verification_summary_feed
+    AFTER INSERT OR DELETE ON verification_summary
+    FOR EACH ROW EXECUTE FUNCTION notify_verification_feed();
+
+-- refresh_verification_summary() upserts on every related write; only real changes are published
+DROP TRIGGER IF EXISTS verification_summary_feed_update ON verification_summary;
+CREATE TRIGGER verification_summary_feed_update
+    AFTER UPDATE ON verification_summary
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION notify_verification_feed();
@@ -0,0 +1,22 @@
+-- migrate: no-transaction
+-- Indexes behind the remaining store.py read paths, built without blocking
+-- writes. Checked by `python backend/inspect_all_tables.py --explain`.
+
+-- get_page, get_all and iter_export order sessions by (created_at, id) DESC and
+-- resume from a keyset cursor. Without this each page sorts the whole table
+-- (about 100 ms at 100k sessions); with it a page reads limit + 1 entries.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS sessions_created
+    ON sessions (created_at DESC, id DESC);
+
+-- Audit trails are read by session_id in created_at order, and max(id) per
+-- session answers SESSION_VERSION_QUERY. Carrying id in the index makes the
+-- latter an index-only scan; it replaces audit_log_session_created (003).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS audit_log_session_created_id
+    ON audit_log (session_id, created_at) INCLUDE (id);
+DROP INDEX CONCURRENTLY IF EXISTS audit_log_session_created;
+
+-- documents_session_id (003) serves both the session join and max(id); adding
+-- fetched_at lets the version query's max(fetched_at) skip the heap as well.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_session_id_fetched
+    ON documents (session_id, id) INCLUDE (fetched_at);
+DROP INDEX CONCURRENTLY IF EXISTS documents_session_id;
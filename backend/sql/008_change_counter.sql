@@ -0,0 +1,43 @@
+-- Change counter behind LIST_VERSION_QUERY. Every statement that writes sessions,
+-- documents or audit_log bumps it in the same transaction, so the list version
+-- moves exactly when committed data does, including deletes and in-place edits
+-- (e.g. documents.photo_file) that leave every max(updated_at, id) unchanged.
+-- The counter is split over 16 rows picked by backend pid, so concurrent writers
+-- rarely wait on each other's row lock; the version is their sum, which only grows.
+CREATE TABLE IF NOT EXISTS verification_change_counter (
+    shard smallint PRIMARY KEY,
+    changes bigint NOT NULL DEFAULT 0
+);
+
+INSERT INTO verification_change_counter (shard)
+SELECT generate_series(0, 15)
+ON CONFLICT (shard) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION count_verification_change() RETURNS trigger AS $$
+BEGIN
+    UPDATE verification_change_counter
+    SET changes = changes + 1
+    WHERE shard = pg_backend_pid() % 16;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Per statement rather than per row, so a bulk ingest batch bumps it once
+DROP TRIGGER IF EXISTS sessions_count_change ON sessions;
+CREATE TRIGGER sessions_count_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON sessions
+    FOR EACH STATEMENT EXECUTE FUNCTION count_verification_change();
+
+DROP TRIGGER IF EXISTS documents_count_change ON documents;
+CREATE TRIGGER documents_count_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON documents
+    FOR EACH STATEMENT EXECUTE FUNCTION count_verification_change();
+
+DROP TRIGGER IF EXISTS audit_log_count_change ON audit_log;
+CREATE TRIGGER audit_log_count_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON audit_log
+    FOR EACH STATEMENT EXECUTE FUNCTION count_verification_change();
+
+-- The max() probes these served (004_version_indexes.sql) are gone from LIST_VERSION_QUERY
+DROP INDEX IF EXISTS sessions_updated_at;
+DROP INDEX IF EXISTS documents_fetched_at;
@@ -0,0 +1,72 @@
+-- Per-session change counter behind SESSION_VERSION_QUERY, the detail ETag. Any write
+-- to a session, its documents or its audit trail bumps it in the same transaction,
+-- including in-place edits (doc_data, photo_file) and changes to older audit rows.
+-- Rows outlive their session, so a session re-created under the same id never
+-- repeats a version a client may still hold. Sessions without a row are at 0.
+CREATE TABLE IF NOT EXISTS session_versions (
+    session_id text PRIMARY KEY,
+    version bigint NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION bump_session_version() RETURNS trigger AS $$
+DECLARE
+    old_id sessions.id%TYPE;
+    new_id sessions.id%TYPE;
+BEGIN
+    -- Statement-level: every session may have lost rows
+    IF TG_OP = 'TRUNCATE' THEN
+        INSERT INTO session_versions (session_id, version)
+        SELECT id, 1 FROM sessions
+        ON CONFLICT (session_id) DO UPDATE SET version = session_versions.version + 1;
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        IF TG_TABLE_NAME = 'sessions' THEN
+            old_id := OLD.id;
+        ELSE
+            old_id := OLD.session_id;
+        END IF;
+    END IF;
+
+    IF TG_OP <> 'DELETE' THEN
+        IF TG_TABLE_NAME = 'sessions' THEN
+            new_id := NEW.id;
+        ELSE
+            new_id := NEW.session_id;
+        END IF;
+    END IF;
+
+    INSERT INTO session_versions (session_id, version)
+    SELECT DISTINCT changed_id, 1
+    FROM unnest(ARRAY[old_id, new_id]) as changed_id
+    WHERE changed_id IS NOT NULL
+    ON CONFLICT (session_id) DO UPDATE SET version = session_versions.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sessions_bump_version ON sessions;
+CREATE TRIGGER sessions_bump_version
+    AFTER INSERT OR UPDATE OR DELETE ON sessions
+    FOR EACH ROW EXECUTE FUNCTION bump_session_version();
+
+DROP TRIGGER IF EXISTS documents_bump_version ON documents;
+CREATE TRIGGER documents_bump_version
+    AFTER INSERT OR UPDATE OR DELETE ON documents
+    FOR EACH ROW EXECUTE FUNCTION bump_session_version();
+
+DROP TRIGGER IF EXISTS documents_truncate_version ON documents;
+CREATE TRIGGER documents_truncate_version
+    AFTER TRUNCATE ON documents
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_session_version();
+
+DROP TRIGGER IF EXISTS audit_log_bump_version ON audit_log;
+CREATE TRIGGER audit_log_bump_version
+    AFTER INSERT OR UPDATE OR DELETE ON audit_log
+    FOR EACH ROW EXECUTE FUNCTION bump_session_version();
+
+DROP TRIGGER IF EXISTS audit_log_truncate_version ON audit_log;
+CREATE TRIGGER audit_log_truncate_version
+    AFTER TRUNCATE ON audit_log
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_session_version();
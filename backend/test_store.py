@@ -5,12 +5,15 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from backend.services.store import db
+from backend.services.db import init_db_pool
+from backend.services.store import VerificationStore
 import json
 
 def test_multi_table():
     """Test the multi-table integration."""
     print("Testing Multi-Table Integration (sessions + documents + audit_log)...\n")
+    init_db_pool()
+    db = VerificationStore()
     
     # Test get_all
     print("=== Testing get_all() with multi-table join ===")
@@ -3,19 +3,57 @@
 import { useState, useEffect } from 'react';
 import { VerificationsTable } from '@/components/tables/VerificationsTable';
 import { VerificationSession } from '@/types';
-import { fetchFromApi } from '@/lib/api';
+import { fetchFromApi, fetchPageFromApi, subscribeToApi } from '@/lib/api';
 import { Plus, Bell, Settings, Loader2 } from 'lucide-react';
 
+// Sessions fetched per page; the list endpoint pages with a cursor
+const PAGE_SIZE = 50;
+
 export default function VerificationsPage() {
   const [data, setData] = useState<VerificationSession[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState<number | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  async function loadMore() {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await fetchPageFromApi<VerificationSession>(
+        `/api/verifications?limit=${PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`
+      );
+      // Live updates may already have added some of these rows
+      setData((current) => [
+        ...current,
+        ...page.items.filter((session) => !current.some((s) => s.id === session.id)),
+      ]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Failed to load more verifications:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   useEffect(() => {
+    async function loadTotal() {
+      try {
+        const stats = await fetchFromApi<{ total: number }>('/api/verifications/stats');
+        setTotal(stats.total);
+      } catch {
+        setTotal(null);
+      }
+    }
+
+    // (Re)load from the first page; later pages are fetched on demand
     async function loadVerifications() {
       try {
-        const sessions = await fetchFromApi<VerificationSession[]>('/api/verifications');
-        setData(sessions);
+        const page = await fetchPageFromApi<VerificationSession>(`/api/verifications?limit=${PAGE_SIZE}`);
+        setData(page.items);
+        setNextCursor(page.nextCursor);
+        loadTotal();
       } catch (err) {
         console.error('Failed to load verifications:', err);
         setError('Failed to load verifications. Ensure backend is running.');
@@ -24,6 +62,24 @@ export default function VerificationsPage() {
       }
     }
     loadVerifications();
+
+    // Live updates replace polling: apply each changed row in place
+    const replace = (session: VerificationSession) =>
+      setData((current) => current.map((s) => (s.id === session.id ? session : s)));
+
+    return subscribeToApi('/api/verifications/stream', {
+      created: (session: VerificationSession) => {
+        setData((current) => [session, ...current.filter((s) => s.id !== session.id)]);
+        setTotal((current) => (current === null ? current : current + 1));
+      },
+      status_changed: replace,
+      updated: replace,
+      deleted: ({ id }: { id: string }) => {
+        setData((current) => current.filter((s) => s.id !== id));
+        setTotal((current) => (current === null ? current : Math.max(current - 1, 0)));
+      },
+      resync: () => loadVerifications(),
+    });
   }, []);
 
   if (loading) {
@@ -53,7 +109,11 @@ export default function VerificationsPage() {
       <div className="mb-8 flex items-center justify-between">
         <div>
           <h1 className="text-2xl font-semibold text-gray-900">Verifications</h1>
-          <p className="mt-1 text-sm text-gray-500">{data.length} verifications</p>
+          <p className="mt-1 text-sm text-gray-500">
+            {total !== null && total > data.length
+              ? `Showing ${data.length} of ${total} verifications`
+              : `${data.length} verifications`}
+          </p>
         </div>
         
         <div className="flex items-center gap-4">
@@ -71,6 +131,19 @@ export default function VerificationsPage() {
       </div>
 
       <VerificationsTable data={data} />
+
+      {nextCursor && (
+        <div className="mt-6 flex justify-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="flex items-center gap-2 rounded-lg border border-gray-200 bg-white px-4 py-2.5 text-sm font-medium text-gray-700 hover:bg-gray-50 shadow-sm disabled:opacity-60"
+          >
+            {loadingMore && <Loader2 className="animate-spin" size={16} />}
+            Load more
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
@@ -3,7 +3,7 @@ export const API_BASE_URL = 'http://localhost:8000';
 export async function fetchFromApi<T>(endpoint: string): Promise<T> {
   try {
     const res = await fetch(`${API_BASE_URL}${endpoint}`, {
-      cache: 'no-store', // Always fetch fresh data for this dashboard
+      cache: 'no-cache', // Always revalidate; the backend answers 304 via ETag when nothing changed
     });
 
     if (!res.ok) {
@@ -16,3 +16,44 @@ export async function fetchFromApi<T>(endpoint: string): Promise<T> {
     throw error;
   }
 }
+
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null; // pass as ?cursor= for the following page; null on the last page
+}
+
+// One page of a cursor-paginated list endpoint; the cursor comes back in X-Next-Cursor
+export async function fetchPageFromApi<T>(endpoint: string): Promise<Page<T>> {
+  try {
+    const res = await fetch(`${API_BASE_URL}${endpoint}`, { cache: 'no-cache' });
+
+    if (!res.ok) {
+      throw new Error(`API Error: ${res.status} ${res.statusText}`);
+    }
+
+    return { items: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+  } catch (error) {
+    console.error(`Failed to fetch from ${endpoint}:`, error);
+    throw error;
+  }
+}
+
+export type FeedHandlers = Record<string, (data: any) => void>;
+
+// Server-Sent Events subscription; EventSource reconnects on its own and resumes
+// with Last-Event-ID, so the server replays missed events or sends 'resync'.
+export function subscribeToApi(endpoint: string, handlers: FeedHandlers): () => void {
+  const source = new EventSource(`${API_BASE_URL}${endpoint}`);
+
+  for (const [event, handler] of Object.entries(handlers)) {
+    source.addEventListener(event, (message) => {
+      try {
+        handler(JSON.parse((message as MessageEvent).data));
+      } catch (error) {
+        console.error(`Failed to handle ${event} event from ${endpoint}:`, error);
+      }
+    });
+  }
+
+  return () => source.close();
+}
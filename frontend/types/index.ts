@@ -92,6 +92,10 @@ export interface VerificationDetail extends VerificationSession {
     browser: string;
     ip: string;
     location: string;
+    osVersion?: string;
+    browserVersion?: string;
+    brand?: string;
+    model?: string;
   };
   network: NetworkDetails; // New
   devices: DeviceInfo[]; // New
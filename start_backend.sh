@@ -4,4 +4,6 @@
 
 cd "$(dirname "$0")"
 source .venv/bin/activate
-python3 -m uvicorn backend.main:app --host 0.0.0.0 --port 8000 --reload
+# Open /api/verifications/stream connections never finish on their own; stop waiting
+# for them after a few seconds (EventSource clients reconnect and resume)
+python3 -m uvicorn backend.main:app --host 0.0.0.0 --port 8000 --reload --timeout-graceful-shutdown 5